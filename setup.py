@@ -18,6 +18,7 @@ setup(
         'dev': [
             'pytest>=7.4.0',
             'pytest-cov>=4.1.0',
+            'pytest-xdist>=3.5.0',
         ]
     },
     entry_points={
@@ -5,7 +5,9 @@ Shared utilities for environment loading, logging, and path management.
 """
 
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -54,7 +56,37 @@ def load_env():
     return env
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get project root directory (one level up from src/)"""
     # From src/core/core.py -> src/core/ -> src/ -> project_root/
     return Path(__file__).parent.parent.parent
+
+
+# O_NOATIME is Linux-only and refused (EPERM) on files we don't own; O_BINARY is Windows-only
+_NOATIME = getattr(os, 'O_NOATIME', 0)
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+
+def read_text_noatime(path: Path) -> str:
+    """Read a UTF-8 text file like Path.read_text(), without updating its access time where supported.
+
+    One unbuffered open/fstat/read; newlines are normalised as read_text's universal newlines would.
+    """
+    try:
+        fd = os.open(path, _READ_FLAGS | _NOATIME)
+    except PermissionError:
+        if not _NOATIME:
+            raise
+        fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while chunk := os.read(fd, max(size, 1 << 16)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode('utf-8')
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
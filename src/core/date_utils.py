@@ -2,10 +2,20 @@
 Date parsing utilities for flexible date format support
 """
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple
 
 
+# Compiled once: (year, month, day) groups for each supported layout
+# (strptime's %d also takes a space-padded day, so ' 1' is kept valid)
+_ISO_DATE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}| \d)')   # 2027-07-14 or 2027-7-14
+_EU_DATE  = re.compile(r'(\d{1,2}| \d)/(\d{1,2})/(\d{4})')   # 14/07/2027 or 14/7/2027
+
+
+# Commands re-parse the same --date across phases (play -> preset); the result is immutable
+@lru_cache(maxsize=8)
 def parse_flexible_date(date_str: str) -> Tuple[datetime, str]:
     """
     Parse date in multiple formats and return both datetime and ISO-normalized string.
@@ -19,18 +29,19 @@ def parse_flexible_date(date_str: str) -> Tuple[datetime, str]:
     Returns:
         tuple: (datetime object, ISO string YYYY-MM-DD for internal use)
     """
-    formats = [
-        '%Y-%m-%d',  # 2027-07-14 or 2027-7-14
-        '%d/%m/%Y',  # 14/07/2027 or 14/7/2027
-    ]
+    match = _ISO_DATE.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
+    elif match := _EU_DATE.fullmatch(date_str):
+        day, month, year = match.groups()
 
-    for fmt in formats:
+    if match:
         try:
-            dt = datetime.strptime(date_str, fmt)
-            normalized = dt.strftime('%Y-%m-%d')  # ISO 8601: 2027-07-14
-            return dt, normalized
+            dt = datetime(int(year), int(month), int(day))
         except ValueError:
-            continue
+            pass   # well-formed but not a calendar date, e.g. 2027-02-30
+        else:
+            return dt, dt.strftime('%Y-%m-%d')  # ISO 8601: 2027-07-14
 
     raise ValueError(
         f"Invalid date format: '{date_str}'. "
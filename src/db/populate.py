@@ -503,8 +503,8 @@ def _populate_space(conn, raw_db, _load_gs, _player_faction,
     # --- Launch windows (keyed by destination name for merge into gs_space_bodies) ---
     windows: dict[str, dict] = {}
     if game_date and templates_file:
-        from src.preset.launch_windows import calculate_launch_windows
-        windows = calculate_launch_windows(game_date, templates_file)
+        from src.preset.launch_windows import cached_launch_windows
+        windows = cached_launch_windows(game_date, templates_file)
 
     # --- Build objectType map from template file ---
     object_type_map: dict[str, str] = {}  # templateName → objectType
@@ -8,74 +8,132 @@ Public API:
     build_codex_report(savegame_db: Path) -> str
 """
 
+import atexit
+import io
+import itertools
 import sqlite3
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
 
+# Warm connections kept across reports: {resolved db path: ((inode, mtime_ns, size), connection)}
+_POOL: dict[Path, tuple[tuple[int, int, int], sqlite3.Connection]] = {}
+# Guards _POOL and serialises reports: a pooled connection is shared by every
+# thread (preset/stage run extractors on thread pools), one report at a time
+_POOL_LOCK = threading.RLock()
+
+
 def _conn(db: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(db)
+    """
+    Return a pooled connection for db, opening one on first use. Call with _POOL_LOCK held.
+    The parse step deletes and recreates the file, so the cached handle is
+    reopened when the inode, mtime or size moves — the inode alone is not
+    enough, as a freed inode number can be reused for the new file.
+    """
+    key = db.resolve()
+    stat = key.stat()
+    sig = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _POOL.get(key)
+    if cached is not None:
+        if cached[0] == sig:
+            return cached[1]
+        cached[1].close()
+    conn = sqlite3.connect(key, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    _POOL[key] = (sig, conn)
     return conn
 
 
+def _close_pool() -> None:
+    with _POOL_LOCK:
+        for _, conn in _POOL.values():
+            conn.close()
+        _POOL.clear()
+
+
+atexit.register(_close_pool)
+
+
+def _rows(conn, sql: str, params: tuple = ()) -> Iterator[sqlite3.Row] | None:
+    """
+    Stream the rows of *sql* straight off the cursor.
+    Peeks one row so callers can still skip empty results; returns None then.
+    """
+    cur = conn.execute(sql, params)
+    first = cur.fetchone()
+    if first is None:
+        return None
+    return itertools.chain((first,), cur)
+
+
+def _emit(out: io.StringIO, *lines: str) -> None:
+    """Write each line to the report buffer, newline-terminated."""
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+
+
 # ---------------------------------------------------------------------------
 # Earth domain
 # ---------------------------------------------------------------------------
 
-def _section_global(conn) -> list[str]:
+# One bound template for every nation row — field lookups and format specs
+# are parsed once rather than per f-string evaluation.
+_NATION_ROW = (
+    "{name},{gdp_t:.2f}T,{gdp_d},{unrest:.2f},{un_d},{democracy:.1f},{nukes},{cp_str}"
+).format_map
+
+def _section_global(conn, out: io.StringIO) -> None:
     row = conn.execute(
         "SELECT co2_ppm, sea_level_anomaly, nuclear_strikes, loose_nukes FROM gs_global"
     ).fetchone()
     if not row:
-        return []
-    return [
+        return
+    _emit(
+        out,
         "## Global",
         f"CO2: {row['co2_ppm']:.1f} ppm  |  Sea level anomaly: {row['sea_level_anomaly']:.1f} cm",
         f"Nuclear strikes: {row['nuclear_strikes']}  |  Loose nukes: {row['loose_nukes']}",
         "",
-    ]
+    )
 
 
-def _section_nations(conn) -> list[str]:
-    rows = conn.execute("""
+def _section_nations(conn, out: io.StringIO) -> None:
+    rows = _rows(conn, """
         SELECT n.name, n.gdp_t, n.gdp_delta_pct, n.unrest, n.unrest_delta,
                n.democracy, n.nukes, n.nation_key
         FROM gs_nations n
         WHERE n.gdp_t > 0.1          -- major nations only (>100B)
         ORDER BY n.gdp_t DESC
         LIMIT 30
-    """).fetchall()
-    if not rows:
-        return []
-
-    # Build CP summary per nation: {nation_key: {faction_name: count}}
-    cp_rows = conn.execute(
-        "SELECT nation_key, faction_name FROM gs_control_points"
-    ).fetchall()
-    cp_map: dict[int, dict[str, int]] = {}
-    for cp in cp_rows:
-        nk = cp['nation_key']
-        fn = cp['faction_name']
-        cp_map.setdefault(nk, {})
-        cp_map[nk][fn] = cp_map[nk].get(fn, 0) + 1
-
-    lines = ["## Nations", "Nation,GDP,ΔGDP,Unrest,ΔUnrest,Demo,Nukes,Control Points"]
+    """)
+    if rows is None:
+        return
+
+    # CP summary per nation, pre-formatted and already in faction-name order:
+    # {nation_key: ["Faction:count", ...]}
+    cp_map: dict[int, list[str]] = {}
+    for nk, fn, count in conn.execute("""
+        SELECT nation_key, faction_name, COUNT(*)
+        FROM gs_control_points
+        GROUP BY nation_key, faction_name
+        ORDER BY nation_key, faction_name
+    """):
+        cp_map.setdefault(nk, []).append(f"{fn}:{count}")
+
+    _emit(out, "## Nations", "Nation,GDP,ΔGDP,Unrest,ΔUnrest,Demo,Nukes,Control Points")
+    fmt_row = _NATION_ROW
     for r in rows:
-        nk = r['nation_key']
-        cp_summary = cp_map.get(nk, {})
-        cp_str = ' '.join(f"{f}:{c}" for f, c in sorted(cp_summary.items()))
-        gdp_d  = f"{r['gdp_delta_pct']:+.1f}%" if r['gdp_delta_pct'] else '0%'
-        un_d   = f"{r['unrest_delta']:+.2f}" if r['unrest_delta'] else '0'
-        lines.append(
-            f"{r['name']},{r['gdp_t']:.2f}T,{gdp_d},"
-            f"{r['unrest']:.2f},{un_d},{r['democracy']:.1f},"
-            f"{r['nukes']},{cp_str}"
-        )
-    lines.append("")
-    return lines
+        row = dict(r)
+        row['gdp_d']  = f"{r['gdp_delta_pct']:+.1f}%" if r['gdp_delta_pct'] else '0%'
+        row['un_d']   = f"{r['unrest_delta']:+.2f}" if r['unrest_delta'] else '0'
+        row['cp_str'] = ' '.join(cp_map.get(r['nation_key'], ()))
+        _emit(out, fmt_row(row))
+    _emit(out, "")
 
 
-def _section_public_opinion(conn) -> list[str]:
+def _section_public_opinion(conn, out: io.StringIO) -> None:
     """Public opinion for player-controlled nations (has at least one player CP)."""
     player_nation_keys = {
         row[0] for row in conn.execute(
@@ -83,10 +141,10 @@ def _section_public_opinion(conn) -> list[str]:
         ).fetchall()
     }
     if not player_nation_keys:
-        return []
+        return
 
-    lines = ["## Public Opinion (Player Nations)"]
-    lines.append("Nation,Resist,ΔResist,Destroy,ΔDestroy,Exploit,ΔExploit,Undecided")
+    _emit(out, "## Public Opinion (Player Nations)")
+    _emit(out, "Nation,Resist,ΔResist,Destroy,ΔDestroy,Exploit,ΔExploit,Undecided")
 
     for nk in sorted(player_nation_keys):
         nation_name = conn.execute(
@@ -105,146 +163,162 @@ def _section_public_opinion(conn) -> list[str]:
             pct, delta = po.get(slug, (0, 0))
             return f"{pct:.0f}%,{delta:+.1f}pp"
 
-        lines.append(
+        _emit(
+            out,
             f"{nation_name['name']},"
             f"{fmt('resist')},{fmt('destroy')},{fmt('exploit')},"
             f"{po.get('undecided', (0,0))[0]:.0f}%"
         )
-    lines.append("")
-    return lines
+    _emit(out, "")
 
 
-def _section_federations(conn) -> list[str]:
-    rows = conn.execute(
-        "SELECT name, member_count, major_power_count FROM gs_federations ORDER BY member_count DESC"
-    ).fetchall()
-    if not rows:
-        return []
-    lines = ["## Federations"]
+def _section_federations(conn, out: io.StringIO) -> None:
+    rows = _rows(
+        conn,
+        "SELECT name, member_count, major_power_count FROM gs_federations ORDER BY member_count DESC",
+    )
+    if rows is None:
+        return
+    _emit(out, "## Federations")
     for r in rows:
-        lines.append(f"{r['name']}: {r['member_count']} members ({r['major_power_count']} major powers)")
-    lines.append("")
-    return lines
+        _emit(out, f"{r['name']}: {r['member_count']} members ({r['major_power_count']} major powers)")
+    _emit(out, "")
+
 
+# money is an INTEGER column — the int grouping path skips float formatting.
+# round() keeps the old .0f rounding for any REAL values that slip through.
+_MONEY = "{:>12,d}".format
 
-def _section_faction_resources(conn) -> list[str]:
-    rows = conn.execute("""
-        SELECT faction_name, is_player, money, influence, ops, boost, mc_cap
+
+def _faction_rows(conn) -> tuple[list[sqlite3.Row], list[sqlite3.Row]]:
+    """
+    Faction resources and faction intel from one statement, split by kind.
+    Both sections are per-faction tables; each half keeps its own ordering.
+    """
+    resources: list[sqlite3.Row] = []
+    intel: list[sqlite3.Row] = []
+    for r in conn.execute("""
+        SELECT 'res' AS kind, faction_name, is_player,
+               money, influence, ops, boost, mc_cap, NULL AS intel_level
         FROM gs_faction_resources
-        ORDER BY is_player DESC, money DESC
-    """).fetchall()
+        UNION ALL
+        SELECT 'intel', faction_name, is_player,
+               NULL, NULL, NULL, NULL, NULL, intel_level
+        FROM gs_faction_intel
+        ORDER BY kind DESC, intel_level DESC, is_player DESC, money DESC
+    """):
+        (resources if r['kind'] == 'res' else intel).append(r)
+    return resources, intel
+
+
+def _section_faction_resources(rows: list[sqlite3.Row], out: io.StringIO) -> None:
     if not rows:
-        return []
-    lines = [
+        return
+    _emit(
+        out,
         "## Faction Resources",
         f"  {'Faction':<22} {'Money':>10}  {'Influence':>9}  {'Ops':>6}  {'Boost':>6}  {'MC':>6}",
         "  " + "-" * 68,
-    ]
+    )
     for r in rows:
         mark = " *" if r['is_player'] else ""
-        lines.append(
+        _emit(
+            out,
             f"  {r['faction_name']:<22}{mark} "
-            f"{r['money']:>12,.0f}  "
+            f"{_MONEY(round(r['money']))}  "
             f"{r['influence']:>9.0f}  "
             f"{r['ops']:>6.0f}  "
             f"{r['boost']:>6.1f}  "
             f"{r['mc_cap']:>6.0f}"
         )
-    lines.append("")
-    return lines
+    _emit(out, "")
 
 
 # ---------------------------------------------------------------------------
 # Intel domain
 # ---------------------------------------------------------------------------
 
-def _section_enemy_councilors(conn) -> list[str]:
-    rows = conn.execute("""
+def _section_enemy_councilors(conn, out: io.StringIO) -> None:
+    rows = _rows(conn, """
         SELECT name, councilor_type, faction_name, intel_level, suspicion, location
         FROM gs_councilors_enemy
         ORDER BY faction_name, name
-    """).fetchall()
-    if not rows:
-        return []
-    lines = [
+    """)
+    if rows is None:
+        return
+    _emit(
+        out,
         "## Known Enemy Councilors",
         f"  {'Name':<25} {'Type':<16} {'Faction':<22} {'Intel':>6}  {'Susp':>6}  Location",
         "  " + "-" * 100,
-    ]
+    )
     for r in rows:
         sus = f"{r['suspicion']:.1f}" if r['suspicion'] else '-'
-        lines.append(
+        _emit(
+            out,
             f"  {r['name']:<25} {r['councilor_type']:<16} {r['faction_name']:<22} "
             f"{r['intel_level']:>6.2f}  {sus:>6}  {r['location']}"
         )
-    lines.append("")
-    return lines
+    _emit(out, "")
 
 
-def _section_player_councilors(conn) -> list[str]:
-    rows = conn.execute(
-        "SELECT name, councilor_type, location FROM gs_councilors_player ORDER BY name"
-    ).fetchall()
-    if not rows:
-        return []
-    lines = [
+def _section_player_councilors(conn, out: io.StringIO) -> None:
+    rows = _rows(
+        conn, "SELECT name, councilor_type, location FROM gs_councilors_player ORDER BY name"
+    )
+    if rows is None:
+        return
+    _emit(
+        out,
         "## Our Councilors",
         f"  {'Name':<25} {'Type':<16} Location",
         "  " + "-" * 70,
-    ]
+    )
     for r in rows:
-        lines.append(f"  {r['name']:<25} {r['councilor_type']:<16} {r['location']}")
-    lines.append("")
-    return lines
+        _emit(out, f"  {r['name']:<25} {r['councilor_type']:<16} {r['location']}")
+    _emit(out, "")
 
 
-def _section_faction_intel(conn) -> list[str]:
-    rows = conn.execute("""
-        SELECT faction_name, intel_level, is_player
-        FROM gs_faction_intel
-        ORDER BY intel_level DESC
-    """).fetchall()
+def _section_faction_intel(rows: list[sqlite3.Row], out: io.StringIO) -> None:
     if not rows:
-        return []
-    lines = ["## Faction Intel Levels"]
+        return
+    _emit(out, "## Faction Intel Levels")
     for r in rows:
         mark = " *" if r['is_player'] else ""
-        lines.append(f"  {r['faction_name']:<22}{mark}  {r['intel_level']:.2f}")
-    lines.append("")
-    return lines
+        _emit(out, f"  {r['faction_name']:<22}{mark}  {r['intel_level']:.2f}")
+    _emit(out, "")
 
 
 # ---------------------------------------------------------------------------
 # Research domain
 # ---------------------------------------------------------------------------
 
-def _section_research(conn) -> list[str]:
+def _section_research(conn, out: io.StringIO) -> None:
     rows = conn.execute(
         "SELECT tech_name FROM gs_research_completed ORDER BY tech_name"
     ).fetchall()
     if not rows:
-        return []
-    lines = [f"## Completed Technologies ({len(rows)} total)"]
+        return
+    _emit(out, f"## Completed Technologies ({len(rows)} total)")
     for r in rows:
-        lines.append(f"  {r['tech_name']}")
-    lines.append("")
-    return lines
+        _emit(out, f"  {r['tech_name']}")
+    _emit(out, "")
 
 
 # ---------------------------------------------------------------------------
 # Space domain
 # ---------------------------------------------------------------------------
 
-def _section_habs(conn) -> list[str]:
-    rows = conn.execute("""
+def _section_habs(conn, out: io.StringIO) -> None:
+    rows = _rows(conn, """
         SELECT COALESCE(sb.name, h.parent_body_name, '?') AS body,
                h.hab_key, h.name, h.hab_type, h.tier, h.faction_name, h.is_player
         FROM gs_habs h
         LEFT JOIN gs_space_bodies sb ON sb.body_key = h.parent_body_key
         ORDER BY body, h.name
-    """).fetchall()
-    if not rows:
-        return []
+    """)
+    if rows is None:
+        return
 
     # Module summary per hab: active, building, crew_total, power_balance
     mod_rows = conn.execute("""
@@ -263,27 +337,27 @@ def _section_habs(conn) -> list[str]:
         body = r['body'] or '?'
         by_body.setdefault(body, []).append(r)
 
-    lines = ["## Habs & Stations"]
+    _emit(out, "## Habs & Stations")
     for body in sorted(by_body.keys()):
-        lines.append(f"\n### {body}")
-        lines.append(f"  {'Name':<30} {'Type':<10} {'Tier':<5} {'Mod':>4} {'Crew':>5} {'Pwr':>5}  Faction")
-        lines.append("  " + "-" * 78)
+        _emit(out, f"\n### {body}")
+        _emit(out, f"  {'Name':<30} {'Type':<10} {'Tier':<5} {'Mod':>4} {'Crew':>5} {'Pwr':>5}  Faction")
+        _emit(out, "  " + "-" * 78)
         for r in by_body[body]:
             mark = " *" if r['is_player'] else ""
             m = mod_map.get(r['hab_key'])
             mod_str  = f"{m['active']}/{m['active']+m['building']}" if m else "-"
             crew_str = str(m['crew_total']) if m else "-"
             pwr_str  = str(m['power_balance']) if m else "-"
-            lines.append(
+            _emit(
+                out,
                 f"  {r['name']:<30} {r['hab_type']:<10} T{r['tier']}  "
                 f"{mod_str:>4} {crew_str:>5} {pwr_str:>5}  "
                 f"{r['faction_name']}{mark}"
             )
-    lines.append("")
-    return lines
+    _emit(out, "")
 
 
-def _section_hab_modules(conn) -> list[str]:
+def _section_hab_modules(conn, out: io.StringIO) -> None:
     """Detailed module listing for player habs only."""
     habs = conn.execute("""
         SELECT COALESCE(sb.name, h.parent_body_name, '?') AS body,
@@ -294,23 +368,23 @@ def _section_hab_modules(conn) -> list[str]:
         ORDER BY body, h.name
     """).fetchall()
     if not habs:
-        return []
+        return
 
-    lines = ["## Player Hab Modules"]
+    _emit(out, "## Player Hab Modules")
     for hab in habs:
-        mods = conn.execute("""
+        mods = _rows(conn, """
             SELECT module_name, display_name, tier, crew, power,
                    construction_completed, completion_date, powered, destroyed
             FROM gs_hab_modules
             WHERE hab_key = ?
             ORDER BY construction_completed DESC, tier DESC, module_name
-        """, (hab['hab_key'],)).fetchall()
-        if not mods:
+        """, (hab['hab_key'],))
+        if mods is None:
             continue
 
-        lines.append(f"\n### {hab['body']} — {hab['hab_name']}")
-        lines.append(f"  {'Module':<35} {'Tier':>4} {'Crew':>5} {'Pwr':>5}  Status")
-        lines.append("  " + "-" * 72)
+        _emit(out, f"\n### {hab['body']} — {hab['hab_name']}")
+        _emit(out, f"  {'Module':<35} {'Tier':>4} {'Crew':>5} {'Pwr':>5}  Status")
+        _emit(out, "  " + "-" * 72)
         for m in mods:
             if m['destroyed']:
                 status = "DESTROYED"
@@ -325,50 +399,94 @@ def _section_hab_modules(conn) -> list[str]:
             tier_s = str(m['tier']) if m['tier'] else "-"
             crew_s = str(m['crew']) if m['crew'] else "-"
             pwr_s  = str(m['power']) if m['power'] else "-"
-            lines.append(
+            _emit(
+                out,
                 f"  {name:<35} {tier_s:>4} {crew_s:>5} {pwr_s:>5}  {status}"
             )
-    lines.append("")
-    return lines
+    _emit(out, "")
 
 
-def _section_fleets(conn) -> list[str]:
-    rows = conn.execute("""
+def _section_fleets(conn, out: io.StringIO) -> None:
+    rows = _rows(conn, """
         SELECT f.name, f.faction_name, f.location, f.is_player
         FROM gs_fleets f
         ORDER BY f.name
-    """).fetchall()
-    if not rows:
-        return []
-    lines = [
+    """)
+    if rows is None:
+        return
+    _emit(
+        out,
         "## Fleets",
         f"  {'Name':<25} {'Faction':<20} Location",
         "  " + "-" * 65,
-    ]
+    )
     for r in rows:
         mark = " *" if r['is_player'] else ""
-        lines.append(f"  {r['name']:<25} {r['faction_name']:<20} {r['location']}{mark}")
-    lines.append("")
-    return lines
+        _emit(out, f"  {r['name']:<25} {r['faction_name']:<20} {r['location']}{mark}")
+    _emit(out, "")
 
 
-def _section_launch_windows(conn) -> list[str]:
+def _section_launch_windows(conn, out: io.StringIO) -> None:
     """Bodies with launch window data."""
-    rows = conn.execute(
+    rows = _rows(
+        conn,
         "SELECT name, next_window_date, days_away, penalty_pct "
-        "FROM gs_space_bodies WHERE next_window_date IS NOT NULL ORDER BY days_away"
-    ).fetchall()
-    if not rows:
-        return []
-    lines = ["## Launch Windows"]
+        "FROM gs_space_bodies WHERE next_window_date IS NOT NULL ORDER BY days_away",
+    )
+    if rows is None:
+        return
+    _emit(out, "## Launch Windows")
     for r in rows:
         penalty = f", penalty {r['penalty_pct']:.0f}%" if r['penalty_pct'] else ""
-        lines.append(
+        _emit(
+            out,
             f"  {r['name']}: next window {r['next_window_date']} "
             f"({r['days_away']} days){penalty}"
         )
-    lines.append("")
-    return lines
+    _emit(out, "")
+
+
+# ---------------------------------------------------------------------------
+# Report layout
+# ---------------------------------------------------------------------------
+
+# Domain header -> (section builder, table that must be non-empty for it to run).
+# Builders take the connection, except the faction sections, which are fed
+# their half of _faction_rows() by build_codex_report.
+_REPORT_LAYOUT = (
+    ("# EARTH & POLITICAL STATE", (
+        (_section_global,            "gs_global"),
+        (_section_nations,           "gs_nations"),
+        (_section_public_opinion,    "gs_control_points"),
+        (_section_federations,       "gs_federations"),
+        (_section_faction_resources, "gs_faction_resources"),
+    )),
+    ("# INTELLIGENCE STATE", (
+        (_section_enemy_councilors,  "gs_councilors_enemy"),
+        (_section_player_councilors, "gs_councilors_player"),
+        (_section_faction_intel,     "gs_faction_intel"),
+    )),
+    ("# RESEARCH STATE", (
+        (_section_research,          "gs_research_completed"),
+    )),
+    ("# SPACE STATE", (
+        (_section_habs,              "gs_habs"),
+        (_section_hab_modules,       "gs_habs"),
+        (_section_fleets,            "gs_fleets"),
+        (_section_launch_windows,    "gs_space_bodies"),
+    )),
+)
+
+_GATE_TABLES = sorted({table for _, sections in _REPORT_LAYOUT for _, table in sections})
+
+# One round-trip answers "which tables have rows?" for every section
+_POPULATED_SQL = " UNION ALL ".join(
+    f"SELECT '{t}', EXISTS(SELECT 1 FROM {t})" for t in _GATE_TABLES
+)
+
+
+def _populated_tables(conn) -> set[str]:
+    return {name for name, has_rows in conn.execute(_POPULATED_SQL) if has_rows}
 
 
 # ---------------------------------------------------------------------------
@@ -380,27 +498,21 @@ def build_codex_report(savegame_db: Path) -> str:
     Build the full CODEX gamestate report from savegame.db.
     Returns a multi-section text string, same format as old gamestate_*.txt files.
     """
-    conn = _conn(savegame_db)
-    try:
-        sections = [
-            "# EARTH & POLITICAL STATE", "",
-            *_section_global(conn),
-            *_section_nations(conn),
-            *_section_public_opinion(conn),
-            *_section_federations(conn),
-            *_section_faction_resources(conn),
-            "# INTELLIGENCE STATE", "",
-            *_section_enemy_councilors(conn),
-            *_section_player_councilors(conn),
-            *_section_faction_intel(conn),
-            "# RESEARCH STATE", "",
-            *_section_research(conn),
-            "# SPACE STATE", "",
-            *_section_habs(conn),
-            *_section_hab_modules(conn),
-            *_section_fleets(conn),
-            *_section_launch_windows(conn),
-        ]
-        return "\n".join(sections).strip()
-    finally:
-        conn.close()
+    with _POOL_LOCK:
+        return _build_codex_report(_conn(savegame_db))
+
+
+def _build_codex_report(conn: sqlite3.Connection) -> str:
+    out = io.StringIO()
+    populated = _populated_tables(conn)
+    resources, intel = _faction_rows(conn)
+    prefetched = {
+        _section_faction_resources: resources,
+        _section_faction_intel: intel,
+    }
+    for header, sections in _REPORT_LAYOUT:
+        _emit(out, header, "")
+        for section, table in sections:
+            if table in populated:
+                section(prefetched.get(section, conn), out)
+    return out.getvalue().strip()
@@ -58,6 +58,7 @@ CREATE TABLE IF NOT EXISTS gs_control_points (
 CREATE INDEX IF NOT EXISTS idx_cp_nation ON gs_control_points(nation_key);
 CREATE INDEX IF NOT EXISTS idx_cp_faction ON gs_control_points(faction_key);
 CREATE INDEX IF NOT EXISTS idx_cp_type ON gs_control_points(cp_type);
+CREATE INDEX IF NOT EXISTS idx_cp_is_player ON gs_control_points(is_player, nation_key);
 
 CREATE TABLE IF NOT EXISTS gs_public_opinion (
     nation_key          INTEGER NOT NULL,
@@ -66,7 +67,7 @@ CREATE TABLE IF NOT EXISTS gs_public_opinion (
     faction_name        TEXT NOT NULL,
     pct                 REAL,
     delta_pp            REAL,
-    PRIMARY KEY (nation_key, faction_slug),
+    PRIMARY KEY (nation_key, faction_slug),  -- also serves nation_key lookups
     FOREIGN KEY (nation_key) REFERENCES gs_nations(nation_key)
 );
 
@@ -5,14 +5,21 @@ Responsibilities:
     - Append turn to human-readable dialogue log in ./logs/
     - Insert [CHAT] block to dialogue_fts (stub until V2 DB migration)
     - Update decision_log if an UPDATE action was executed
-    - All operations atomic: log write failure rolls back
+    - Log write failures are raised, never swallowed: commit_log() raises directly;
+      for the background writer the next raise_commit_errors() (called at the start
+      of every orchestrator turn) or flush_commit_log() raises them
+    - Optional background writer so the chat loop never blocks on disk I/O
 
 Log format: one file per session, one turn appended per call.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sqlite3
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -24,6 +31,11 @@ from src.orchestrator.validate_action import ActionResult
 # Data types
 # ---------------------------------------------------------------------------
 
+def _utc_timestamp() -> str:
+    """Current UTC time in the dialogue_fts timestamp shape: naive ISO, microseconds, no offset."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="microseconds")
+
+
 @dataclass
 class CommitContext:
     session_id: str       # e.g. "2026-02-19_143201"
@@ -33,33 +45,46 @@ class CommitContext:
     query: str
     parsed: ParsedResponse
     action_result: ActionResult | None
+    created_at: str = field(default_factory=_utc_timestamp)   # turn timestamp, captured once at construction
+
+
+class CommitLogError(OSError):
+    """A background transcript write failed; raised by raise_commit_errors()."""
 
 
 # ---------------------------------------------------------------------------
 # Log formatting
 # ---------------------------------------------------------------------------
 
-def _format_turn(ctx: CommitContext) -> str:
-    lines = [
-        f"=== SESSION {ctx.session_id} | TIER {ctx.tier} | {ctx.flow_type.upper()} ===",
-        "",
-        "USER",
-        ctx.query,
-        "",
-    ]
-    if ctx.parsed.thought:
-        lines += [f"[THOUGHT] {ctx.parsed.thought}", ""]
-    if ctx.parsed.action and ctx.action_result:
-        status = "OK" if ctx.action_result.executed else "REJECTED"
-        lines += [f"[ACTION] {ctx.parsed.action}  [{status}]", ""]
-    lines += [
-        ctx.speaker.upper(),
-        ctx.parsed.chat,
-        "",
-        "=== TURN END ===",
-        "",
+# Fixed pieces of a turn, encoded once; only the per-turn values are encoded per call
+_SESSION_OPEN = b"=== SESSION "
+_TIER_SEP     = b" | TIER "
+_FIELD_SEP    = b" | "
+_HEADER_CLOSE = b" ===\n\nUSER\n"
+_THOUGHT      = b"[THOUGHT] "
+_ACTION       = b"[ACTION] "
+_OK           = b"  [OK]\n\n"
+_REJECTED     = b"  [REJECTED]\n\n"
+_BLANK_LINE   = b"\n\n"
+_NEWLINE      = b"\n"
+_TURN_END     = b"\n\n=== TURN END ===\n"
+
+
+def _format_turn(ctx: CommitContext) -> bytes:
+    parsed = ctx.parsed
+    parts = [
+        _SESSION_OPEN, ctx.session_id.encode("utf-8"),
+        _TIER_SEP, str(ctx.tier).encode("utf-8"),
+        _FIELD_SEP, ctx.flow_type.upper().encode("utf-8"),
+        _HEADER_CLOSE, ctx.query.encode("utf-8"), _BLANK_LINE,
     ]
-    return "\n".join(lines)
+    if parsed.thought:
+        parts += (_THOUGHT, parsed.thought.encode("utf-8"), _BLANK_LINE)
+    if parsed.action and ctx.action_result:
+        parts += (_ACTION, parsed.action.encode("utf-8"),
+                  _OK if ctx.action_result.executed else _REJECTED)
+    parts += (ctx.speaker.upper().encode("utf-8"), _NEWLINE, parsed.chat.encode("utf-8"), _TURN_END)
+    return b"".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -67,7 +92,9 @@ def _format_turn(ctx: CommitContext) -> str:
 # Replaced with real SQLite FTS5 insert during V2 DB migration.
 # ---------------------------------------------------------------------------
 
-def _insert_dialogue_fts(session_id: str, speaker: str, chat: str, db_path: Path | None) -> None:
+def _insert_dialogue_fts(
+    session_id: str, speaker: str, chat: str, created_at: str, db_path: Path | None
+) -> None:
     if db_path is None:
         logging.debug("No DB path — dialogue_fts insert skipped (stub)")
         return
@@ -75,15 +102,67 @@ def _insert_dialogue_fts(session_id: str, speaker: str, chat: str, db_path: Path
         con = sqlite3.connect(db_path)
         con.execute(
             "INSERT INTO dialogue_fts (session_id, speaker, content, timestamp) VALUES (?, ?, ?, ?)",
-            (session_id, speaker, chat, datetime.utcnow().isoformat()),
+            (session_id, speaker, chat, created_at),
         )
         con.commit()
         con.close()
     except sqlite3.Error as e:
-        logging.error(f"dialogue_fts insert failed: {e}")
+        logging.error("dialogue_fts insert failed: %s", e)
         raise
 
 
+# ---------------------------------------------------------------------------
+# Session log file descriptor
+# One O_APPEND fd for the current session's log, reused across turns so each
+# turn is a single write(). A new session closes the previous session's fd; a
+# log rotated or deleted under us is detected by inode and reopened.
+# ---------------------------------------------------------------------------
+
+# (session_id, log file, fd) of the session currently being written, or None
+_session_log: tuple[str, Path, int] | None = None
+_session_log_lock = threading.Lock()
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _same_file(fd: int, log_file: Path) -> bool:
+    try:
+        on_disk = os.stat(log_file)
+    except FileNotFoundError:
+        return False
+    held = os.fstat(fd)
+    return (held.st_dev, held.st_ino) == (on_disk.st_dev, on_disk.st_ino)
+
+
+def _log_fd(session_id: str, log_file: Path) -> int:
+    global _session_log
+    with _session_log_lock:
+        if _session_log is not None:
+            open_id, open_file, fd = _session_log
+            if open_id == session_id and open_file == log_file and _same_file(fd, log_file):
+                return fd
+            _session_log = None
+            os.close(fd)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(log_file, _APPEND_FLAGS, 0o644)
+        _session_log = (session_id, log_file, fd)
+        return fd
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def close_log_files() -> None:
+    """Close the current session's log descriptor, if one is open."""
+    global _session_log
+    with _session_log_lock:
+        if _session_log is not None:
+            os.close(_session_log[2])
+            _session_log = None
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -94,34 +173,102 @@ def commit_log(
     db_path: Path | None = None,
 ) -> None:
     """
-    Atomically write turn to log file and dialogue_fts.
+    Write turn to log file and dialogue_fts.
 
     Raises on log write failure so caller can surface the error.
-    SQLite insert failure rolls back and re-raises.
+    A dialogue_fts insert failure is logged and the turn kept.
 
     Args:
         ctx:       CommitContext for this turn.
         logs_dir:  Directory for session transcript files (./logs/).
         db_path:   Optional path to campaign SQLite DB (stub if None).
     """
-    logs_dir.mkdir(parents=True, exist_ok=True)
     log_file = logs_dir / f"session_{ctx.session_id}.log"
-    turn_text = _format_turn(ctx)
+    turn_bytes = _format_turn(ctx)
 
     try:
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(turn_text)
+        _write_all(_log_fd(ctx.session_id, log_file), turn_bytes)
     except OSError as e:
-        logging.error(f"Log write failed: {e}")
+        logging.error("Log write failed: %s", e)
         raise
 
     # dialogue_fts insert — if it fails, log the error but don't lose the turn
     try:
-        _insert_dialogue_fts(ctx.session_id, ctx.speaker, ctx.parsed.chat, db_path)
+        _insert_dialogue_fts(
+            ctx.session_id, ctx.speaker, ctx.parsed.chat, ctx.created_at, db_path
+        )
     except Exception as e:
-        logging.error(f"dialogue_fts insert failed, continuing: {e}")
+        logging.error("dialogue_fts insert failed, continuing: %s", e)
 
 
 def make_session_id() -> str:
     """Generate a session ID from current UTC time."""
     return datetime.now(timezone.utc).strftime("%Y-%m-%d_%H%M%S")
+
+
+# ---------------------------------------------------------------------------
+# Background writer
+# One daemon thread drains a FIFO queue, so turns land in submission order.
+# ---------------------------------------------------------------------------
+
+_pending: queue.Queue = queue.Queue()
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+_writer_errors: list[Exception] = []
+
+
+def _writer_loop() -> None:
+    while True:
+        ctx, logs_dir, db_path = _pending.get()
+        try:
+            commit_log(ctx, logs_dir, db_path)
+        except Exception as e:
+            _writer_errors.append(e)   # surfaced by raise_commit_errors()
+        finally:
+            _pending.task_done()
+
+
+def commit_log_async(
+    ctx: CommitContext,
+    logs_dir: Path,
+    db_path: Path | None = None,
+) -> None:
+    """
+    Queue a turn for commit_log() on the background writer and return at once.
+    Call flush_commit_log() before relying on the transcript being on disk.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="commit-log", daemon=True)
+            _writer.start()
+    _pending.put((ctx, logs_dir, db_path))
+
+
+def raise_commit_errors() -> None:
+    """
+    Raise the first background write failure seen since the last check, if any,
+    as CommitLogError chained to the original error.
+
+    Does not wait for queued turns — cheap enough to call every turn.
+    """
+    if _writer_errors:
+        errors = _writer_errors[:]
+        del _writer_errors[:len(errors)]   # keep anything the writer appended meanwhile
+        raise CommitLogError(str(errors[0])) from errors[0]
+
+
+def flush_commit_log() -> None:
+    """
+    Block until every queued turn has been written.
+
+    Raises CommitLogError for the first write failure seen since the last check, if any.
+    """
+    _pending.join()
+    raise_commit_errors()
+
+
+# Daemon threads die with the interpreter — drain queued turns first.
+# atexit runs LIFO, so the log fds are closed after the drain.
+atexit.register(close_log_files)
+atexit.register(_pending.join)
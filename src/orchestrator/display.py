@@ -8,9 +8,15 @@ Flow types:
     debate_interrupt         → actor name + chat block + decision prompt
     spectator                → stage direction formatting, no name prefix
     error / fallback         → system message, distinct formatting
+
+ChatEcho shows the [CHAT] block of a streamed reply as it is generated;
+display() stays the authoritative formatting once the reply is parsed.
 """
 
-from src.orchestrator.parse_response import ParsedResponse
+from collections.abc import Callable
+from functools import lru_cache
+
+from src.orchestrator.parse_response import ParsedResponse, _TAG_PATTERN
 
 
 # ---------------------------------------------------------------------------
@@ -21,6 +27,12 @@ DECISION_PROMPT = "— your decision."
 _SYSTEM_PREFIX  = "[SYSTEM]"
 
 
+@lru_cache(maxsize=32)
+def _speaker_prefix(speaker: str | None) -> str:
+    """Uppercased name prefix — computed once per actor, not per turn."""
+    return f"{speaker.upper()}: " if speaker else ""
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -37,7 +49,7 @@ def display(parsed: ParsedResponse, flow_type: str, speaker: str | None = None)
     Returns:
         Formatted string ready for print().
     """
-    chat = parsed.chat.strip()
+    chat = parsed.chat  # already stripped by ParsedResponse
 
     if not chat:
         return ""
@@ -49,9 +61,84 @@ def display(parsed: ParsedResponse, flow_type: str, speaker: str | None = None)
         return f"{_SYSTEM_PREFIX} {chat}"
 
     if flow_type == "debate_interrupt":
-        prefix = f"{speaker.upper()}: " if speaker else ""
-        return f"{prefix}{chat}\n\n{DECISION_PROMPT}"
+        return f"{_speaker_prefix(speaker)}{chat}\n\n{DECISION_PROMPT}"
 
     # standard / debate_turn
-    prefix = f"{speaker.upper()}: " if speaker else ""
-    return f"{prefix}{chat}"
+    return f"{_speaker_prefix(speaker)}{chat}"
+
+
+# ---------------------------------------------------------------------------
+# Streaming echo
+# ---------------------------------------------------------------------------
+
+# Longest tag _TAG_PATTERN matches ("[THOUGHT]") — a trailing "[" closer to the
+# end than this may still be the start of a tag split across two deltas
+_MAX_TAG_LEN = len("[THOUGHT]")
+
+
+class ChatEcho:
+    """
+    on_delta target for llm_call(): writes the [CHAT] block to `write` as it
+    streams in, behind the speaker prefix, and stops at the next tag, so
+    [THOUGHT] and [ACTION] are never shown. Tags are found with parse_response's
+    _TAG_PATTERN, so the echo ends where the parsed [CHAT] block ends.
+    """
+
+    __slots__ = ("_write", "_prefix", "_pending", "_in_chat", "_done", "written")
+
+    def __init__(self, write: Callable[[str], None], speaker: str | None = None):
+        self._write   = write
+        self._prefix  = _speaker_prefix(speaker)
+        self._pending = ""      # text received but not yet written or discarded
+        self._in_chat = False
+        self._done    = False   # a tag closed the [CHAT] block
+        self.written  = ""      # everything passed to write so far
+
+    def __call__(self, delta: str) -> None:
+        if self._done:
+            return
+        self._pending += delta
+        if not self._in_chat:
+            chat = next((m for m in _TAG_PATTERN.finditer(self._pending)
+                         if m.group(1).upper() == "CHAT"), None)
+            if chat is None:
+                return
+            self._in_chat = True
+            self._pending = self._pending[chat.end():]
+
+        text = self._pending
+        end_tag = _TAG_PATTERN.search(text)
+        if end_tag is not None:
+            self._done = True
+            self._pending = ""
+            self._emit(text[:end_tag.start()])
+            return
+        # Hold back a trailing "[" that may open a tag completed by the next delta
+        cut = text.rfind("[")
+        if cut != -1 and len(text) - cut < _MAX_TAG_LEN:
+            text, self._pending = text[:cut], text[cut:]
+        else:
+            self._pending = ""
+        self._emit(text)
+
+    def _emit(self, text: str) -> None:
+        if not self.written:
+            text = text.lstrip()
+            if not text:
+                return
+            text = self._prefix + text
+        elif not text:
+            return
+        self.written += text
+        self._write(text)
+
+    def remainder(self, formatted: str) -> str:
+        """
+        What is left to print of display()'s `formatted` output. When the echo
+        does not match it (repeated tag, fallback, stream cut short), the line
+        is ended and the full formatted text returned.
+        """
+        shown = self.written.rstrip()
+        if formatted.startswith(shown):
+            return formatted[len(shown):]
+        return "\n" + formatted
@@ -16,7 +16,7 @@ Fragment categories:
 
 import logging
 import re
-import tomllib
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -28,7 +28,9 @@ from src.orchestrator.tier_check import TierConfidence
 # Data types
 # ---------------------------------------------------------------------------
 
-ALWAYS_INJECTED = {"voice", "limits"}
+# Ordered: injection order must not depend on per-process string hashing,
+# or the assembled prompt (and the server's cached prefix) changes between runs
+ALWAYS_INJECTED = ("voice", "limits")
 SPECTATOR_ONLY  = {"spectator", "stage_directions"}
 
 TIER_HEDGE_INSTRUCTION = (
@@ -52,35 +54,87 @@ class FetchResult:
 
     def assembled(self) -> str:
         """Return all fragments joined for prompt injection."""
-        return "\n\n".join(f.content for f in self.fragments)
+        return "\n\n".join([f.content for f in self.fragments])
+
+
+class PersonaFragments(Mapping[str, str]):
+    """
+    Read-only {category: content} view over a persona.md text.
+
+    Only (start, end) offsets are kept; a section is sliced and stripped the
+    first time it is requested, so categories a turn never uses cost nothing.
+    """
+
+    def __init__(self, text: str, spans: dict[str, tuple[int, int]]):
+        self._text = text
+        self._spans = spans
+        self._content: dict[str, str] = {}
+
+    def __getitem__(self, category: str) -> str:
+        content = self._content.get(category)
+        if content is None:
+            start, end = self._spans[category]
+            content = self._content[category] = self._text[start:end].strip()
+        return content
+
+    def __contains__(self, category: object) -> bool:
+        return category in self._spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
 
 
 # ---------------------------------------------------------------------------
 # persona.md parser
 # ---------------------------------------------------------------------------
 
-def _parse_persona_fragments(persona_path: Path) -> dict[str, str]:
+# [tag] followed by content up to next [tag] or ## heading
+_PERSONA_RE = re.compile(
+    r"^\[(\w+)\]\s*\n(.*?)(?=^\[|\Z|^##\s)",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Relationships sub-sections open on a line starting with an uppercase name
+# token (e.g. "JONNY (Jonathan Pratt):", "MEI-HUA:", "O'BRIEN:"). Splitting at
+# those line breaks is a single linear pass — no lazy .*? probing a lookahead
+# at every character. The header token keeps hyphens and apostrophes so it
+# matches the uppercased first name fragment_fetch looks up.
+_REL_SPLIT_RE  = re.compile(r"\n(?=[A-Z]['-]?[A-Z])")
+_REL_HEADER_RE = re.compile(r"[^\W\d_][\w'-]+")
+
+_NON_BLANK_RE = re.compile(r"\S")
+
+
+def _parse_persona_fragments(persona_path: Path) -> PersonaFragments:
     """
     Extract [category] sections from persona.md ## Personality and ## Stage blocks.
-    Returns dict of {category: content}.
+    Returns a lazy {category: content} mapping.
 
     Sections are delimited by [tag] lines. Content runs until the next [tag] or ##.
+    Blank sections are skipped without materializing them.
     """
     text = persona_path.read_text(encoding="utf-8")
-    fragments: dict[str, str] = {}
+    spans: dict[str, tuple[int, int]] = {}
 
-    # Match [tag] followed by content up to next [tag] or ## heading
-    pattern = re.compile(
-        r"^\[(\w+)\]\s*\n(.*?)(?=^\[|\Z|^##\s)",
-        re.MULTILINE | re.DOTALL,
-    )
-    for match in pattern.finditer(text):
-        category = match.group(1).lower()
-        content  = match.group(2).strip()
-        if content:
-            fragments[category] = content
+    for match in _PERSONA_RE.finditer(text):
+        start, end = match.span(2)
+        if _NON_BLANK_RE.search(text, start, end):
+            spans[match.group(1).lower()] = (start, end)
 
-    return fragments
+    return PersonaFragments(text, spans)
+
+
+def _relationship_sections(rel_content: str) -> dict[str, str]:
+    """Split a relationships fragment into {HEADER_TOKEN: sub-section}, first wins."""
+    sections: dict[str, str] = {}
+    for chunk in _REL_SPLIT_RE.split(rel_content):
+        header = _REL_HEADER_RE.match(chunk)
+        if header:
+            sections.setdefault(header.group(0), chunk.strip())
+    return sections
 
 
 # ---------------------------------------------------------------------------
@@ -106,11 +160,9 @@ def _build_base(spec: ActorSpec, data: dict) -> Fragment:
 # Domain keyword match
 # ---------------------------------------------------------------------------
 
-def _domain_match(query: str, data: dict) -> bool:
+def _domain_match(query: str, spec: ActorSpec) -> bool:
     """Return True if any domain_keyword appears in the query (case-insensitive)."""
-    keywords = [k.strip().lower() for k in data.get("domain_keywords", "").split(",") if k.strip()]
-    query_lower = query.lower()
-    return any(kw in query_lower for kw in keywords)
+    return spec.domain_re is not None and spec.domain_re.search(query) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -121,7 +173,7 @@ def fragment_fetch(
     spec: ActorSpec,
     query: str,
     tier_confidence: TierConfidence,
-    other_actor_names: list[str] | None = None,
+    other_actor_names: Sequence[str] | None = None,
     spectator_only: bool = False,
 ) -> FetchResult:
     """
@@ -136,51 +188,44 @@ def fragment_fetch(
     """
     result = FetchResult(actor=spec)
 
-    spec_path = spec.actor_dir / "spec.toml"
-    persona_path = spec.actor_dir / "persona.md"
-
-    with open(spec_path, "rb") as f:
-        data = tomllib.load(f)
-
-    parsed = _parse_persona_fragments(persona_path) if persona_path.exists() else {}
+    data = spec.spec_data
+    parsed = spec.persona_fragments
 
     # --- Spectator path ---
     if spectator_only:
         if "spectator" in parsed:
             result.fragments.append(Fragment(category="spectator", subject=None, content=parsed["spectator"]))
         else:
-            logging.warning(f"{spec.display_name}: no spectator fragment found")
+            logging.warning("%s: no spectator fragment found", spec.display_name)
         return result
 
     # --- Always injected ---
     result.fragments.append(_build_base(spec, data))
 
-    for cat in ALWAYS_INJECTED:
-        if cat in parsed:
-            result.fragments.append(Fragment(category=cat, subject=None, content=parsed[cat]))
-        elif spec.first_name.lower() != "codex":  # CODEX has no voice/limits by design
-            logging.warning(f"{spec.display_name}: missing '{cat}' fragment")
+    if not spec.is_codex:  # CODEX has no voice/limits by design
+        for cat in ALWAYS_INJECTED:
+            if cat in parsed:
+                result.fragments.append(Fragment(category=cat, subject=None, content=parsed[cat]))
+            else:
+                logging.warning("%s: missing %r fragment", spec.display_name, cat)
 
     # --- Domain match ---
-    if _domain_match(query, data) and "domain" in parsed:
+    if _domain_match(query, spec) and "domain" in parsed:
         result.fragments.append(Fragment(category="domain", subject=None, content=parsed["domain"]))
 
     # --- Relationships ---
     if other_actor_names:
         rel_content = parsed.get("relationships", "")
         if rel_content:
+            # Relationships fragment may contain named sub-sections (e.g. "JONNY (Jonathan Pratt):"),
+            # split once at load time into spec.relationships_map
             for name in other_actor_names:
                 # Extract the sub-section for this specific actor if present
-                # Relationships fragment may contain named sub-sections (e.g. "JONNY (Jonathan Pratt):")
                 name_upper = name.upper().split()[0]  # match on first token, uppercased
-                sub = re.search(
-                    rf"{name_upper}.*?(?=\n[A-Z]{{2,}}|\Z)",
-                    rel_content,
-                    re.DOTALL,
-                )
+                sub = spec.relationships_map.get(name_upper)
                 if sub:
                     result.fragments.append(
-                        Fragment(category="relationships", subject=name, content=sub.group(0).strip())
+                        Fragment(category="relationships", subject=name, content=sub)
                     )
                 else:
                     # No sub-section found — inject full relationships block once
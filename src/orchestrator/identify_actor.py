@@ -8,13 +8,14 @@ Returns an IdentifyResult with a list of ActorMatch objects and a flow_type.
 """
 
 import logging
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-import tomllib
-
 
 # ---------------------------------------------------------------------------
 # Data types
@@ -42,17 +43,38 @@ class ActorSpec:
     family_name: str
     nickname: str
     display_name: str
+    # Parsed once at load time — the files never change during a session
+    spec_data: dict = field(default_factory=dict, repr=False)
+    persona_fragments: Mapping[str, str] = field(default_factory=dict, repr=False)
+    domain_keywords: tuple[str, ...] = field(default=(), repr=False)  # lowercased, stripped
+    domain_re: re.Pattern | None = field(default=None, repr=False)
+    relationships_map: dict[str, str] = field(default_factory=dict, repr=False)
+    interrupt_weight: int = field(default=0, repr=False)            # [interrupt].weight
+    can_interrupt_own_debate: bool = field(default=False, repr=False)
+    max_tier: int = field(default=1, repr=False)                    # highest tier_N_scope filled in
+    # Derived from first_name on construction so hot paths never call .lower()
+    first_name_lower: str = field(init=False, repr=False)
+    is_codex: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.first_name_lower = self.first_name.lower()
+        self.is_codex = self.first_name_lower == "codex"
 
     @property
     def match_tokens(self) -> list[str]:
         """All name tokens that trigger explicit routing (lowercased)."""
-        tokens = [self.first_name.lower()]
+        tokens = [self.first_name_lower]
         if self.family_name:
             tokens.append(self.family_name.lower())
         if self.nickname:
             tokens.append(self.nickname.lower())
         return tokens
 
+    @cached_property
+    def match_token_set(self) -> frozenset[str]:
+        """match_tokens as a set, built once per actor for O(1) lookups."""
+        return frozenset(self.match_tokens)
+
 
 @dataclass
 class ActorMatch:
@@ -77,42 +99,104 @@ def load_actor_specs(actors_dir: Path) -> list[ActorSpec]:
     """
     Load all actor specs from resources/actors/.
     Skips _template and any directory without a spec.toml.
+    spec.toml and persona.md are parsed here, once, and cached on the spec.
+    Actor directories are read on a small thread pool so file I/O overlaps.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    actor_dirs = [
+        d for d in sorted(actors_dir.iterdir())
+        if d.is_dir() and not d.name.startswith('_')
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        loaded = list(pool.map(_load_actor_spec, actor_dirs))
+    return [spec for spec in loaded if spec is not None]
+
+
+def _load_actor_spec(actor_dir: Path) -> ActorSpec | None:
+    """Read and parse one actor's spec.toml and persona.md. None if no spec.toml."""
+    import tomllib
+
+    from src.orchestrator.fragment_fetch import _parse_persona_fragments, _relationship_sections
+    from src.orchestrator.tier_check import _actor_max_tier
+
+    spec_path = actor_dir / "spec.toml"
+    if not spec_path.exists():
+        logging.warning("No spec.toml in %s, skipping", actor_dir.name)
+        return None
+    with open(spec_path, "rb") as f:
+        data = tomllib.load(f)
+    persona_path = actor_dir / "persona.md"
+    fragments = _parse_persona_fragments(persona_path) if persona_path.exists() else {}
+    keywords = _split_domain_keywords(data.get("domain_keywords", ""))
+    interrupt = data.get("interrupt", {})
+    return ActorSpec(
+        actor_dir=actor_dir,
+        first_name=data.get("first_name", ""),
+        family_name=data.get("family_name", ""),
+        nickname=data.get("nickname", ""),
+        display_name=data.get("display_name", actor_dir.name),
+        spec_data=data,
+        persona_fragments=fragments,
+        domain_keywords=keywords,
+        domain_re=_compile_domain_keywords(keywords),
+        relationships_map=_relationship_sections(fragments.get("relationships", "")),
+        interrupt_weight=interrupt.get("weight", 0),
+        can_interrupt_own_debate=interrupt.get("can_interrupt_own_debate", False),
+        max_tier=_actor_max_tier(data),
+    )
+
+
+def _split_domain_keywords(keywords: str) -> tuple[str, ...]:
+    """Comma-separated domain_keywords → lowercased, stripped, non-empty tuple."""
+    return tuple(k.strip().lower() for k in keywords.split(",") if k.strip())
+
+
+def _compile_domain_keywords(keywords: tuple[str, ...]) -> re.Pattern | None:
+    """
+    One case-insensitive alternation over the actor's domain keywords.
+    Substring semantics, like the plain `kw in query` check it replaces.
     """
-    specs = []
-    for actor_dir in sorted(actors_dir.iterdir()):
-        if not actor_dir.is_dir() or actor_dir.name.startswith('_'):
-            continue
-        spec_path = actor_dir / "spec.toml"
-        if not spec_path.exists():
-            logging.warning(f"No spec.toml in {actor_dir.name}, skipping")
-            continue
-        with open(spec_path, "rb") as f:
-            data = tomllib.load(f)
-        specs.append(ActorSpec(
-            actor_dir=actor_dir,
-            first_name=data.get("first_name", ""),
-            family_name=data.get("family_name", ""),
-            nickname=data.get("nickname", ""),
-            display_name=data.get("display_name", actor_dir.name),
-        ))
-    return specs
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
 
 
 # ---------------------------------------------------------------------------
 # Explicit routing
 # ---------------------------------------------------------------------------
 
+# A whitespace-delimited word with leading/trailing .,!?;: trimmed
+# (inner punctuation kept, so "Mei-hua" stays one token)
+_TOKEN_RE = re.compile(r"[^\s.,!?;:](?:\S*[^\s.,!?;:])?")
+
+
 def _explicit_match(user_input: str, specs: list[ActorSpec]) -> list[ActorSpec]:
     """
     Return all actors whose first_name, family_name, or nickname
     appears as a word in the input (case-insensitive).
     """
-    tokens = [t.strip(".,!?;:") for t in user_input.lower().split()]
-    matched = []
-    for spec in specs:
-        if any(t in tokens for t in spec.match_tokens):
-            matched.append(spec)
-    return matched
+    index = _token_index(specs)
+    hits: set[int] = set()
+    for token in _TOKEN_RE.finditer(user_input.lower()):
+        hits.update(index.get(token.group(0), ()))
+    return [specs[i] for i in sorted(hits)]
+
+
+# {per-actor name token sets: {name token: positions of the actors it names}}
+_token_index_cache: dict[tuple[frozenset[str], ...], dict[str, tuple[int, ...]]] = {}
+
+def _token_index(specs: list[ActorSpec]) -> dict[str, tuple[int, ...]]:
+    """Name-token → actor lookup table, built once per actor set."""
+    key = tuple(spec.match_token_set for spec in specs)
+    index = _token_index_cache.get(key)
+    if index is None:
+        building: dict[str, list[int]] = {}
+        for i, spec in enumerate(specs):
+            for token in spec.match_token_set:
+                building.setdefault(token, []).append(i)
+        index = _token_index_cache[key] = {t: tuple(ix) for t, ix in building.items()}
+    return index
 
 
 # ---------------------------------------------------------------------------
@@ -125,45 +209,95 @@ def _implicit_match(user_input: str, specs: list[ActorSpec]) -> list[tuple[Actor
     Returns list of (spec, similarity_score) for scores >= 0.3, sorted descending.
 
     Lazy-imports sentence_transformers so the module loads without it installed.
-    Domain embeddings are loaded from each actor's spec.toml domain_keywords field
-    and encoded on first call (pre-computation deferred to V2 DB migration).
+    Domain embeddings come from each actor's domain_keywords field; they are
+    encoded once per actor set and scored against the query in one matmul.
     """
     try:
-        from sentence_transformers import SentenceTransformer, util
+        from sentence_transformers import SentenceTransformer  # noqa: F401
     except ImportError:
         logging.error("sentence_transformers not installed — implicit routing unavailable")
         return []
 
+    keyed = [spec for spec in specs if spec.spec_data.get("domain_keywords")]
+    if not keyed:
+        return []
+
     model = _get_embedding_model()
-    query_vec = model.encode(user_input, convert_to_tensor=True)
-    results = []
+    key = tuple(spec.actor_dir for spec in keyed)
+    domain_matrix = _domain_cache.get(key)
+    if domain_matrix is None:
+        # First query for this actor set: one batched forward pass covers
+        # every actor's keywords plus the query itself
+        texts = [spec.spec_data["domain_keywords"] for spec in keyed] + [user_input]
+        vecs = model.encode(
+            texts, convert_to_tensor=True, normalize_embeddings=True, batch_size=len(texts),
+        )
+        domain_matrix = _domain_cache[key] = vecs[:-1]
+        query_vec = vecs[-1]
+    else:
+        query_vec = model.encode(user_input, convert_to_tensor=True, normalize_embeddings=True)
 
-    for spec in specs:
-        spec_path = spec.actor_dir / "spec.toml"
-        with open(spec_path, "rb") as f:
-            data = tomllib.load(f)
-        keywords = data.get("domain_keywords", "")
-        if not keywords:
-            continue
+    # Rows are unit vectors, so the dot product is the cosine similarity
+    scores = (domain_matrix @ query_vec).tolist()
 
-        domain_vec = model.encode(keywords, convert_to_tensor=True)
-        score = float(util.cos_sim(query_vec, domain_vec))
+    results = [(spec, score) for spec, score in zip(keyed, scores) if score >= 0.3]
+    return sorted(results, key=lambda x: x[1], reverse=True)
 
-        if score >= 0.3:
-            results.append((spec, score))
 
-    return sorted(results, key=lambda x: x[1], reverse=True)
+# {actor dirs: (N, D) normalized domain_keywords embeddings}, encoded on first use
+_domain_cache: dict[tuple[Path, ...], object] = {}
 
 
 _embedding_model = None
 
+
+def _onnx_int8_file() -> str:
+    """
+    Pick the int8-quantized ONNX export (under onnx/ in the all-MiniLM-L6-v2
+    repo) built for this CPU's instruction set.
+
+    CPU flags are read from /proc/cpuinfo where it exists; elsewhere an x86-64
+    CPU gets the AVX2 export, which any x86-64 CPU of the last decade runs.
+    """
+    import platform
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        cpuinfo = ""
+    match = re.search(r"^flags\s*:(.*)$", cpuinfo, re.MULTILINE)
+    flags = set(match.group(1).split()) if match else set()
+    if "avx512_vnni" in flags:
+        return "onnx/model_qint8_avx512_vnni.onnx"
+    if "avx512f" in flags:
+        return "onnx/model_qint8_avx512.onnx"
+    return "onnx/model_quint8_avx2.onnx"
+
+
 def _get_embedding_model():
-    """Return cached embedding model (all-MiniLM-L6-v2, CPU-side)."""
+    """
+    Return cached embedding model (all-MiniLM-L6-v2, CPU-side).
+
+    Prefers the int8 ONNX Runtime backend; falls back to the default FP32
+    PyTorch model if onnxruntime/optimum are missing or the export won't load.
+    """
     global _embedding_model
     if _embedding_model is None:
         from sentence_transformers import SentenceTransformer
         logging.info("Loading embedding model (all-MiniLM-L6-v2)...")
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+        onnx_file = _onnx_int8_file()
+        try:
+            _embedding_model = SentenceTransformer(
+                "all-MiniLM-L6-v2",
+                backend="onnx",
+                model_kwargs={"file_name": onnx_file},
+            )
+            logging.info("Embedding backend: ONNX Runtime int8 (%s)", onnx_file)
+        except Exception as e:
+            logging.warning("int8 ONNX embedding model unavailable (%s) — using FP32", e)
+            _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+            logging.info("Embedding backend: PyTorch FP32")
     return _embedding_model
 
 
@@ -4,16 +4,24 @@ llm_call.py — Send assembled prompt to LLM backend.
 Uses OpenAI-compatible API (KoboldCpp, LM Studio, Ollama, etc.).
 Per-flow-type config controls max_tokens and temperature.
 Backend URL loaded from environment — no hardcoded addresses.
+One pooled keep-alive session is shared by every call in the process.
 """
 
+import json
 import logging
 import os
+import random
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
-
-import requests
+from functools import cache
+from typing import TYPE_CHECKING
 
 from src.orchestrator.prompt_assemble import AssembledPrompt
 
+if TYPE_CHECKING:
+    import requests
+
 
 # ---------------------------------------------------------------------------
 # Per-flow-type LLM config
@@ -30,6 +38,12 @@ LLM_CONFIGS: dict[str, dict] = {
 
 _FALLBACK_RESPONSE = "[The council is silent. Something has gone wrong.]"
 
+# (connect, read) seconds — a dead backend fails fast, a slow generation still completes
+_TIMEOUT = (3.05, 120)
+
+# Transient gateway statuses worth one retry (backend restarting / proxy hiccup)
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
 
 # ---------------------------------------------------------------------------
 # Data types
@@ -47,7 +61,12 @@ class LLMResult:
 # Main entry point
 # ---------------------------------------------------------------------------
 
-def llm_call(prompt: AssembledPrompt, flow_type: str, backend_url: str | None = None) -> LLMResult:
+def llm_call(
+    prompt: AssembledPrompt,
+    flow_type: str,
+    backend_url: str | None = None,
+    on_delta: Callable[[str], None] | None = None,
+) -> LLMResult:
     """
     Send prompt to LLM backend. Returns LLMResult with raw output.
 
@@ -55,12 +74,16 @@ def llm_call(prompt: AssembledPrompt, flow_type: str, backend_url: str | None =
         prompt:       AssembledPrompt from prompt_assemble().
         flow_type:    One of: standard, debate_turn, debate_interrupt, spectator.
         backend_url:  Override backend URL (defaults to BACKEND_URL env var).
+        on_delta:     If given, the reply is streamed and each text delta is passed
+                      here as it arrives; the read timeout then applies per chunk.
     """
+    import requests  # deferred: pulls in urllib3 et al., only needed once a call happens
+
     url = _resolve_url(backend_url)
     config = LLM_CONFIGS.get(flow_type, LLM_CONFIGS["standard"])
 
     if flow_type not in LLM_CONFIGS:
-        logging.warning(f"Unknown flow_type '{flow_type}', falling back to 'standard' config")
+        logging.warning("Unknown flow_type %r, falling back to 'standard' config", flow_type)
 
     payload = {
         "model": "koboldcpp",
@@ -70,16 +93,20 @@ def llm_call(prompt: AssembledPrompt, flow_type: str, backend_url: str | None =
         ],
         "max_tokens":  config["max_tokens"],
         "temperature": config["temperature"],
+        # Reuse the KV cache for the unchanged prompt prefix (system block) —
+        # llama.cpp-style servers honour it, others ignore the field
+        "cache_prompt": True,
     }
+    if on_delta is not None:
+        payload["stream"] = True
 
     try:
-        response = requests.post(
-            f"{url}/v1/chat/completions",
-            json=payload,
-            timeout=120,
-        )
+        response = _post_with_retry(f"{url}/v1/chat/completions", payload, stream=on_delta is not None)
         response.raise_for_status()
-        raw = response.json()["choices"][0]["message"]["content"].strip()
+        if on_delta is not None:
+            raw = _read_stream(response, on_delta).strip()
+        else:
+            raw = response.json()["choices"][0]["message"]["content"].strip()
 
         if not raw:
             logging.warning("LLM returned empty response")
@@ -88,11 +115,11 @@ def llm_call(prompt: AssembledPrompt, flow_type: str, backend_url: str | None =
         return LLMResult(raw=raw, flow_type=flow_type, success=True)
 
     except requests.exceptions.Timeout:
-        logging.error(f"LLM timeout after 120s (flow_type={flow_type})")
+        logging.error("LLM timeout (connect %ss / read %ss, flow_type=%s)", *_TIMEOUT, flow_type)
         return LLMResult(raw=_FALLBACK_RESPONSE, flow_type=flow_type, success=False, error="timeout")
 
     except requests.exceptions.RequestException as e:
-        logging.error(f"LLM request failed: {e}")
+        logging.error("LLM request failed: %s", e)
         return LLMResult(raw=_FALLBACK_RESPONSE, flow_type=flow_type, success=False, error=str(e))
 
 
@@ -100,6 +127,65 @@ def llm_call(prompt: AssembledPrompt, flow_type: str, backend_url: str | None =
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _post_with_retry(url: str, payload: dict, stream: bool = False) -> "requests.Response":
+    """
+    POST to the backend, retrying once after a short jittered pause on a
+    dropped connection or a 502/503/504. The second failure is returned/raised as-is.
+    """
+    import requests
+
+    for attempt in range(2):
+        try:
+            response = _get_session().post(url, json=payload, timeout=_TIMEOUT, stream=stream)
+        except requests.exceptions.ConnectionError as e:
+            if attempt:
+                raise
+            logging.warning("LLM connection failed (%s), retrying once", e)
+        else:
+            if attempt or response.status_code not in _RETRY_STATUSES:
+                return response
+            logging.warning("LLM backend returned %d, retrying once", response.status_code)
+            response.close()   # hand the pooled connection back before the retry
+        time.sleep(random.uniform(0.25, 0.75))
+
+
+def _read_stream(response: "requests.Response", on_delta: Callable[[str], None]) -> str:
+    """Consume an OpenAI-style SSE stream, forwarding each content delta; returns the full text."""
+    parts = []
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue   # blank separators, ": keep-alive" comments, event/id fields
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            logging.debug("Skipping undecodable stream chunk: %r", data[:80])
+            continue
+        choices = chunk.get("choices") or [{}]
+        delta = (choices[0].get("delta") or {}).get("content")
+        if delta:
+            parts.append(delta)
+            on_delta(delta)
+    return "".join(parts)
+
+
+@cache
+def _get_session() -> "requests.Session":
+    """Shared session — reuses the backend connection instead of reconnecting per turn."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    # One backend, one request at a time — a single kept-alive connection is all that's used
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def _resolve_url(override: str | None) -> str:
     """Resolve backend URL from override, env var, or default."""
     if override:
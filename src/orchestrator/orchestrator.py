@@ -11,12 +11,15 @@ Call graph:
 
 import logging
 import random
-import tomllib
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 
 from src.core.core import get_project_root, load_env
-from src.orchestrator.commit_log import CommitContext, commit_log, make_session_id
-from src.orchestrator.display import display
+from src.orchestrator.commit_log import (
+    CommitContext, commit_log_async, make_session_id, raise_commit_errors,
+)
+from src.orchestrator.display import ChatEcho, display
 from src.orchestrator.fragment_fetch import fragment_fetch
 from src.orchestrator.identify_actor import (
     ActorSpec,
@@ -26,8 +29,8 @@ from src.orchestrator.identify_actor import (
     identify_actor,
 )
 from src.orchestrator.llm_call import llm_call
-from src.orchestrator.parse_response import parse_response
-from src.orchestrator.prompt_assemble import HistoryTurn, prompt_assemble
+from src.orchestrator.parse_response import ParsedResponse, parse_response
+from src.orchestrator.prompt_assemble import AssembledPrompt, HistoryTurn, prompt_assemble
 from src.orchestrator.tier_check import TierConfidence, tier_check_all, _is_codex
 from src.orchestrator.validate_action import validate_action
 
@@ -45,7 +48,8 @@ class OrchestratorState:
         self.faction      = faction
         self.tier         = tier
         self.session_id   = make_session_id()
-        self.history: list[HistoryTurn] = []
+        self.history: deque[HistoryTurn] = deque(maxlen=20)  # rolling window
+        self.history_tokens = 0   # sum of HistoryTurn.tokens over self.history
         self.debate_turn  = 0
 
         self.actors_dir    = root / "resources" / "actors"
@@ -53,10 +57,35 @@ class OrchestratorState:
         self.campaign_dir  = root / "campaigns" / faction   # flat — no date subdir
         self.codex_spec    = root / "resources" / "actors" / "codex" / "spec.toml"
         self.logs_dir      = root / "logs"
-        self.decision_log  = root / "campaigns" / faction / f"decision_log_{date}.json"
+        self.decision_log  = root / "campaigns" / faction / f"decision_log_{date}.jsonl"
 
         self.specs: list[ActorSpec] = load_actor_specs(self.actors_dir)
 
+        # Parsed once by load_actor_specs — handed to prompt_assemble every turn.
+        # system.txt is not preloaded: load_system_prompt() re-checks it each turn
+        # (one stat) so an edit mid-session is picked up and warned about.
+        self.codex_data: dict | None = next((s.spec_data for s in self.specs if s.is_codex), None)
+
+
+# ---------------------------------------------------------------------------
+# History window
+# ---------------------------------------------------------------------------
+
+# Token budget for the [history] block. Turns are dropped oldest-first past it
+# (on top of the 20-turn cap), so long exchanges can't crowd out the rest of
+# the prompt and short ones still keep their full window.
+_HISTORY_TOKEN_BUDGET = 3000
+
+
+def _append_history(state: OrchestratorState, turn: HistoryTurn) -> None:
+    history = state.history
+    if len(history) == history.maxlen:
+        state.history_tokens -= history[0].tokens   # about to be evicted by append
+    history.append(turn)
+    state.history_tokens += turn.tokens
+    while state.history_tokens > _HISTORY_TOKEN_BUDGET and len(history) > 1:
+        state.history_tokens -= history.popleft().tokens
+
 
 # ---------------------------------------------------------------------------
 # Debate interrupt selector
@@ -65,33 +94,39 @@ class OrchestratorState:
 def _select_interruptor(specs: list[ActorSpec], debating: list[ActorSpec]) -> ActorSpec | None:
     """
     Weighted random selection of interrupt actor.
-    Reads interrupt.weight and interrupt.can_interrupt_own_debate from spec.toml.
+    Uses interrupt.weight and interrupt.can_interrupt_own_debate as cached on each spec.
     Actors with weight=0 or excluded from own debate are filtered out.
     """
-    debating_names = {s.first_name.lower() for s in debating}
-    pool: list[tuple[ActorSpec, int]] = []
-
-    for spec in specs:
-        spec_path = spec.actor_dir / "spec.toml"
-        with open(spec_path, "rb") as f:
-            data = tomllib.load(f)
-        interrupt = data.get("interrupt", {})
-        weight = interrupt.get("weight", 0)
-        can_own = interrupt.get("can_interrupt_own_debate", False)
-
-        if weight == 0:
-            continue
-        if spec.first_name.lower() in debating_names and not can_own:
-            continue
-        pool.append((spec, weight))
-
-    if not pool:
+    pool = _interrupt_pool(specs, frozenset(s.first_name_lower for s in debating))
+    if pool is None:
         return None
 
-    actors, weights = zip(*pool)
+    actors, weights = pool
     return random.choices(actors, weights=weights, k=1)[0]
 
 
+# {(actor dirs, debating first names): (eligible actors, weights) or None}
+# Debate participants rarely change mid-debate, so the filter runs once per pairing
+_interrupt_pool_cache: dict[
+    tuple[tuple[Path, ...], frozenset[str]],
+    tuple[tuple[ActorSpec, ...], tuple[int, ...]] | None,
+] = {}
+
+def _interrupt_pool(
+    specs: list[ActorSpec], debating_names: frozenset[str],
+) -> tuple[tuple[ActorSpec, ...], tuple[int, ...]] | None:
+    """Eligible interruptors and their weights for this debate, or None if nobody qualifies."""
+    key = (tuple(spec.actor_dir for spec in specs), debating_names)
+    if key not in _interrupt_pool_cache:
+        pool = [
+            (spec, spec.interrupt_weight) for spec in specs
+            if spec.interrupt_weight
+            and (spec.can_interrupt_own_debate or spec.first_name_lower not in debating_names)
+        ]
+        _interrupt_pool_cache[key] = tuple(zip(*pool)) if pool else None
+    return _interrupt_pool_cache[key]
+
+
 # ---------------------------------------------------------------------------
 # Stage direction display (no LLM call)
 # ---------------------------------------------------------------------------
@@ -100,15 +135,47 @@ def _stage_direction(note: str) -> str:
     return f"[{note}]"
 
 
+# ---------------------------------------------------------------------------
+# LLM call → parse → display
+# ---------------------------------------------------------------------------
+
+def _ask(
+    prompt: AssembledPrompt, flow_type: str, speaker: str, output_lines: list[str],
+    echo: Callable[[str], None] | None,
+) -> tuple[ParsedResponse, str]:
+    """
+    One advisor reply: parsed response plus the display text still to print.
+    With echo, lines so far are written out first and the [CHAT] block streams
+    through it as generated, so only what was not yet shown is returned.
+    """
+    if echo is None:
+        parsed = parse_response(llm_call(prompt, flow_type))
+        return parsed, display(parsed, flow_type, speaker)
+
+    if output_lines:
+        echo("\n\n".join(output_lines) + "\n\n")
+        output_lines.clear()
+    stream = ChatEcho(echo, None if flow_type == "spectator" else speaker)
+    parsed = parse_response(llm_call(prompt, flow_type, on_delta=stream))
+    return parsed, stream.remainder(display(parsed, flow_type, speaker))
+
+
 # ---------------------------------------------------------------------------
 # Single turn
 # ---------------------------------------------------------------------------
 
-def turn(query: str, state: OrchestratorState) -> str:
+def turn(query: str, state: OrchestratorState, echo: Callable[[str], None] | None = None) -> str:
     """
     Process one user query. Returns formatted string for display.
     Updates state.history and state.debate_turn in place.
+
+    With echo, the reply is streamed: output is written through echo as it is
+    produced and the returned string holds only the rest (possibly empty).
+
+    Raises CommitLogError if an earlier turn's transcript write failed on the
+    background writer, before any work is done for this query.
     """
+    raise_commit_errors()
 
     # --- identify_actor ---
     result: IdentifyResult = identify_actor(query, state.specs)
@@ -157,20 +224,26 @@ def turn(query: str, state: OrchestratorState) -> str:
                     [interrupt_fetch], query,
                     state.system_path, state.campaign_dir, state.codex_spec,
                     history=state.history, tier=state.tier, date=state.date,
+                    codex_data=state.codex_data,
+                )
+                _, interrupt_text = _ask(
+                    interrupt_prompt, "debate_interrupt", interruptor.display_name, output_lines, echo,
                 )
-                interrupt_llm = llm_call(interrupt_prompt, "debate_interrupt")
-                interrupt_parsed = parse_response(interrupt_llm)
-                output_lines.append(display(interrupt_parsed, "debate_interrupt", interruptor.display_name))
+                output_lines.append(interrupt_text)
                 state.debate_turn = 0
                 return "\n\n".join(output_lines)
     else:
         state.debate_turn = 0
 
     # --- fragment_fetch ---
-    other_names = [tr.actor.spec.display_name for tr in active]
+    all_names = tuple(tr.actor.spec.display_name for tr in active)
     fetches = []
     for tr in active:
-        others = [n for n in other_names if n != tr.actor.spec.display_name]
+        # A lone actor has nobody to relate to — skip the filter entirely
+        others = (
+            tuple(n for n in all_names if n != tr.actor.spec.display_name)
+            if len(all_names) > 1 else None
+        )
         fetches.append(
             fragment_fetch(tr.actor.spec, query, tr.confidence, other_actor_names=others or None)
         )
@@ -180,14 +253,13 @@ def turn(query: str, state: OrchestratorState) -> str:
         fetches, query,
         state.system_path, state.campaign_dir, state.codex_spec,
         history=state.history, tier=state.tier, date=state.date,
+        codex_data=state.codex_data,
     )
 
-    # --- llm_call ---
+    # --- llm_call → parse_response (streamed through echo when given) ---
     llm_flow = "codex" if any(_is_codex(tr.actor.spec) for tr in active) else ("debate_turn" if flow_type == FlowType.DEBATE else "standard")
-    llm_result = llm_call(prompt, llm_flow)
-
-    # --- parse_response ---
-    parsed = parse_response(llm_result)
+    speaker = active[0].actor.spec.display_name
+    parsed, reply_text = _ask(prompt, llm_flow, speaker, output_lines, echo)
 
     # --- validate_action ---
     action_result = None
@@ -195,7 +267,6 @@ def turn(query: str, state: OrchestratorState) -> str:
         action_result = validate_action(parsed.action, state.decision_log)
 
     # --- commit_log ---
-    speaker = active[0].actor.spec.display_name
     ctx = CommitContext(
         session_id=state.session_id,
         flow_type=llm_flow,
@@ -205,13 +276,12 @@ def turn(query: str, state: OrchestratorState) -> str:
         parsed=parsed,
         action_result=action_result,
     )
-    commit_log(ctx, state.logs_dir)
+    commit_log_async(ctx, state.logs_dir)
 
     # --- update history ---
-    state.history.append(HistoryTurn(role="user", speaker="User", content=query))
-    state.history.append(HistoryTurn(role="advisor", speaker=speaker, content=parsed.chat))
-    state.history = state.history[-20:]  # rolling window
+    _append_history(state, HistoryTurn(role="user", speaker="User", content=query))
+    _append_history(state, HistoryTurn(role="advisor", speaker=speaker, content=parsed.chat))
 
     # --- display ---
-    output_lines.append(display(parsed, llm_flow, speaker))
+    output_lines.append(reply_text)
     return "\n\n".join(output_lines)
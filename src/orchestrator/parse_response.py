@@ -20,7 +20,7 @@ from src.orchestrator.llm_call import LLMResult, _FALLBACK_RESPONSE
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResponse:
     thought: str | None
     action: str | None
@@ -28,18 +28,75 @@ class ParsedResponse:
     action_valid: bool   # False if action block present but malformed
     fallback_used: bool  # True if [CHAT] was missing or output had no blocks
 
+    def __post_init__(self) -> None:
+        # Normalise once here so display() never has to re-strip
+        self.chat = self.chat.strip()
+
 
 # ---------------------------------------------------------------------------
 # Block extraction
 # ---------------------------------------------------------------------------
 
-_BLOCK_PATTERN = re.compile(
-    r"\[(THOUGHT|ACTION|CHAT)\](.*?)(?=\[(?:THOUGHT|ACTION|CHAT)\]|\Z)",
-    re.DOTALL | re.IGNORECASE,
-)
+# Tags only — block bodies are sliced between successive tag positions,
+# one forward pass with no lazy .*? re-probing a lookahead at every character
+_TAG_PATTERN = re.compile(r"\[(THOUGHT|ACTION|CHAT)\]", re.IGNORECASE)
 
 # Basic ACTION validation: must start with FETCH or UPDATE followed by content
 _ACTION_VALID_PATTERN = re.compile(r"^\s*(FETCH|UPDATE)\s+\S+", re.IGNORECASE)
+_ACTION_VERBS = ("FETCH", "UPDATE")
+
+
+def _action_valid(action: str) -> bool:
+    """
+    _ACTION_VALID_PATTERN via plain string checks for the common case;
+    the regex only runs when the fast path does not accept.
+    """
+    s = action.lstrip()
+    for verb in _ACTION_VERBS:
+        if s[:len(verb)].upper() == verb:
+            rest = s[len(verb):]
+            if rest[:1].isspace() and not rest.isspace():
+                return True
+            break
+    return _ACTION_VALID_PATTERN.match(action) is not None
+
+
+_TAGS = ("[THOUGHT]", "[ACTION]", "[CHAT]")
+_TAGS_LOWER = tuple(t.lower() for t in _TAGS)
+
+
+def _extract_blocks_fast(raw: str) -> dict[str, str] | None:
+    """
+    str.find scan for the well-behaved case: output opens with an uppercase
+    tag and each tag appears at most once, all uppercase.
+    None when that doesn't hold — the caller falls back to _TAG_PATTERN.
+    """
+    if not raw.startswith(("[THOUGHT]", "[CHAT]")):
+        return None
+    hits = []
+    for tag in _TAGS:
+        pos = raw.find(tag)
+        if pos != -1:
+            if raw.find(tag, pos + 1) != -1:
+                return None
+            hits.append((pos, tag))
+    # Any other-case spelling of a tag means the uppercase scan missed one
+    lowered = raw.lower()
+    if sum(lowered.count(t) for t in _TAGS_LOWER) != len(hits):
+        return None
+    hits.sort()
+    ends = [pos for pos, _ in hits[1:]] + [len(raw)]
+    return {tag[1:-1]: raw[pos + len(tag):end].strip() for (pos, tag), end in zip(hits, ends)}
+
+
+def _extract_blocks(raw: str) -> dict[str, str]:
+    """{TAG: body} for every tag in raw; a repeated tag keeps its last body."""
+    blocks = _extract_blocks_fast(raw)
+    if blocks is not None:
+        return blocks
+    tags = list(_TAG_PATTERN.finditer(raw))
+    ends = [m.start() for m in tags[1:]] + [len(raw)]
+    return {m.group(1).upper(): raw[m.end():end].strip() for m, end in zip(tags, ends)}
 
 
 def parse_response(result: LLMResult) -> ParsedResponse:
@@ -48,7 +105,7 @@ def parse_response(result: LLMResult) -> ParsedResponse:
     Always returns a ParsedResponse with a non-empty chat field.
     """
     raw = result.raw.strip()
-    blocks = {m.group(1).upper(): m.group(2).strip() for m in _BLOCK_PATTERN.finditer(raw)}
+    blocks = _extract_blocks(raw)
 
     # No blocks found — treat entire output as CHAT
     if not blocks:
@@ -74,10 +131,10 @@ def parse_response(result: LLMResult) -> ParsedResponse:
     # Validate action if present
     action_valid = False
     if action_raw:
-        if _ACTION_VALID_PATTERN.match(action_raw):
+        if _action_valid(action_raw):
             action_valid = True
         else:
-            logging.warning(f"Malformed [ACTION] block rejected: {action_raw!r}")
+            logging.warning("Malformed [ACTION] block rejected: %r", action_raw)
             action_raw = None
 
     # Missing CHAT — use fallback
@@ -14,8 +14,9 @@ Any modification to system.txt invalidates the cache — log a warning if it cha
 
 import hashlib
 import logging
-import tomllib
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from src.orchestrator.fragment_fetch import FetchResult
@@ -25,14 +26,30 @@ from src.orchestrator.fragment_fetch import FetchResult
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class HistoryTurn:
     role: str       # "user" or "advisor"
     speaker: str    # display name or "User"
     content: str
+    # Label used when the turn is replayed in [history] — fixed once the turn is recorded
+    prefix: str = field(init=False, repr=False, compare=False)
+    # Approximate prompt tokens for the replayed line, counted once per turn
+    tokens: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.prefix = self.speaker.upper() if self.role == "advisor" else "USER"
+        self.tokens = estimate_tokens(self.prefix) + estimate_tokens(self.content) + 1
 
-@dataclass
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count (~4 characters per token). The backend's tokenizer
+    depends on the loaded model, so an exact count isn't available here.
+    """
+    return (len(text) + 3) // 4
+
+
+@dataclass(slots=True)
 class AssembledPrompt:
     system: str
     user: str       # everything after system — sent as the user turn in OpenAI format
@@ -44,15 +61,32 @@ class AssembledPrompt:
 
 _system_hash: str | None = None
 
+# ((path, mtime_ns, size), file hash, content) from the last actual read of system.txt
+_system_cache: tuple[tuple[Path, int, int], str, str] | None = None
+
 
 def load_system_prompt(system_path: Path) -> str:
     """
     Load system.txt. Warn if content has changed since last load
     (indicates KV cache invalidation).
+
+    The file is only re-read and re-hashed when its mtime or size moves;
+    a touch that leaves the bytes identical does not warn and is not re-decoded.
     """
-    global _system_hash
-    content = system_path.read_text(encoding="utf-8").strip()
-    current_hash = hashlib.md5(content.encode()).hexdigest()
+    global _system_hash, _system_cache
+    stat = system_path.stat()
+    key = (system_path, stat.st_mtime_ns, stat.st_size)
+    if _system_cache is not None and _system_cache[0] == key:
+        return _system_cache[2]
+
+    raw = system_path.read_bytes()
+    # Change detection only, not security — blake2b over the file bytes, no decode/encode round trip
+    current_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if _system_cache is not None and _system_cache[1] == current_hash:
+        content = _system_cache[2]
+    else:
+        # Same text read_text() would give (universal newlines), then stripped
+        content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").strip()
 
     if _system_hash is None:
         _system_hash = current_hash
@@ -63,6 +97,7 @@ def load_system_prompt(system_path: Path) -> str:
         )
         _system_hash = current_hash
 
+    _system_cache = (key, current_hash, content)
     return content
 
 
@@ -70,44 +105,104 @@ def load_system_prompt(system_path: Path) -> str:
 # CODEX report handling
 # ---------------------------------------------------------------------------
 
-def _load_gamestate(campaign_dir: Path, date: str = '') -> str:
+def _load_gamestate(campaign_dir: Path, date: str = '') -> tuple[str, int]:
     """
     Load gamestate from savegame_{date}.db if present, else fall back to gamestate_*.txt files.
+    Returns (report, line_count).
     """
-    if date:
-        db_path = campaign_dir / f"savegame_{date}.db"
-        if db_path.exists():
-            from src.db.query import build_codex_report
-            return build_codex_report(db_path)
+    db_path, files = _gamestate_source(campaign_dir, date)
+    if db_path is not None:
+        try:
+            stat = db_path.stat()   # the report cache key — a re-parse recreates the DB, moving mtime/size
+        except FileNotFoundError:
+            db_path, files = None, sorted(campaign_dir.glob("gamestate_*.txt"))
+        else:
+            return _codex_db_report(db_path, stat.st_mtime_ns, stat.st_size)
+
     # Legacy fallback
-    files = sorted(campaign_dir.glob("gamestate_*.txt"))
-    parts = [f.read_text(encoding="utf-8").strip() for f in files if f.stat().st_size > 0]
-    return "\n\n".join(parts)
+    parts = [_read_gamestate_file(f) for f in files if f.stat().st_size > 0]
+    report = "\n\n".join(parts)
+    return report, report.count("\n") + 1
+
+
+# {(campaign dir, date): (dir mtime_ns, savegame DB or None, legacy gamestate_*.txt paths)}
+_gamestate_sources: dict[tuple[Path, str], tuple[int, Path | None, list[Path]]] = {}
+
+
+def _gamestate_source(campaign_dir: Path, date: str) -> tuple[Path | None, list[Path]]:
+    """
+    Which source _load_gamestate reads: the savegame DB, else the sorted legacy files.
+    Resolved again only when the campaign dir's mtime moves — adding or removing
+    the DB or a gamestate file does that, so the decision never goes stale.
+    """
+    try:
+        dir_mtime = campaign_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None, []
+    key = (campaign_dir, date)
+    cached = _gamestate_sources.get(key)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1], cached[2]
+
+    db_path = campaign_dir / f"savegame_{date}.db" if date else None
+    if db_path is not None and not db_path.exists():
+        db_path = None
+    files = [] if db_path is not None else sorted(campaign_dir.glob("gamestate_*.txt"))
+    _gamestate_sources[key] = (dir_mtime, db_path, files)
+    return db_path, files
+
+
+def _read_gamestate_file(path: Path) -> str:
+    from src.core.core import read_text_noatime
+
+    return read_text_noatime(path).strip()
+
+
+@lru_cache(maxsize=4)
+def _codex_db_report(db_path: Path, mtime_ns: int, size: int) -> tuple[str, int]:
+    """
+    build_codex_report() for one savegame DB state, with its line count.
+    The DB only changes when a save is re-parsed, which moves mtime/size and misses the cache.
+    """
+    from src.db.query import build_codex_report
+
+    report = build_codex_report(db_path)
+    return report, report.count("\n") + 1
+
+
+@lru_cache(maxsize=4)
+def _load_codex_spec(codex_spec_path: Path, mtime_ns: int) -> dict:
+    """Parsed codex/spec.toml, re-read only when the file's mtime moves."""
+    import tomllib
+
+    with open(codex_spec_path, "rb") as f:
+        return tomllib.load(f)
 
 
 def _codex_report_or_stage_direction(
     campaign_dir: Path,
     codex_spec_path: Path,
     date: str = '',
+    codex_data: dict | None = None,
 ) -> str:
     """
     Return CODEX report if under line budget, otherwise return a placeholder
     instructing the LLM to generate an in-character stage direction.
 
     The stage direction examples in codex/spec.toml are tone reference only —
-    the LLM generates the actual line.
+    the LLM generates the actual line. codex_data, when given, is the already
+    parsed spec.toml and spares a read of codex_spec_path.
     """
-    with open(codex_spec_path, "rb") as f:
-        codex_data = tomllib.load(f)
+    if codex_data is None:
+        codex_data = _load_codex_spec(codex_spec_path, codex_spec_path.stat().st_mtime_ns)
 
     line_budget: int = codex_data.get("report_line_budget", 40)
-    logging.debug(f"CODEX spec path: {codex_spec_path} | line_budget: {line_budget}")
-    report = _load_gamestate(campaign_dir, date)
+    logging.debug("CODEX spec path: %s | line_budget: %s", codex_spec_path, line_budget)
+    report, line_count = _load_gamestate(campaign_dir, date)
 
     if not report:
         return "[No game state data available. CODEX is silent.]"
 
-    line_count = report.count("\n") + 1
     if line_count <= line_budget:
         return report
 
@@ -128,29 +223,34 @@ def _codex_report_or_stage_direction(
 # History block
 # ---------------------------------------------------------------------------
 
-def _format_history(history: list[HistoryTurn]) -> str:
-    if not history:
-        return ""
-    lines = []
-    for turn in history:
-        prefix = turn.speaker.upper() if turn.role == "advisor" else "USER"
-        lines.append(f"{prefix}: {turn.content}")
-    return "\n\n".join(lines)
+def _format_history(history: Sequence[HistoryTurn]) -> str:
+    return "\n\n".join(f"{turn.prefix}: {turn.content}" for turn in history)
 
 
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
 
+# Fixed head and tail of every user turn
+_TAG_INSTRUCTION = (
+    "IMPORTANT: Your entire response must use ONLY these tags:\n"
+    "[THOUGHT] your reasoning\n"
+    "[CHAT] in-character response\n"
+    "Do NOT write anything outside these tags."
+)
+_TAG_REMINDER = "Respond now using [THOUGHT] and [CHAT] tags only."
+
+
 def prompt_assemble(
     fetch_results: list[FetchResult],
     query: str,
     system_path: Path,
     campaign_dir: Path,
     codex_spec_path: Path,
-    history: list[HistoryTurn] | None = None,
+    history: Sequence[HistoryTurn] | None = None,
     tier: int = 1,
     date: str = '',
+    codex_data: dict | None = None,
 ) -> AssembledPrompt:
     """
     Assemble the final prompt from all components.
@@ -163,38 +263,32 @@ def prompt_assemble(
         codex_spec_path:  Path to resources/actors/codex/spec.toml.
         history:          Recent dialogue turns (soft/hard capped upstream).
         tier:             Current campaign tier (injected into system prompt).
+        codex_data:       Preloaded CODEX spec.toml data; skips the TOML parse.
     """
     # System block — static, {tier} substituted
-    system_raw = load_system_prompt(system_path)
-    system = system_raw.replace("{tier}", str(tier))
+    system = load_system_prompt(system_path).replace("{tier}", str(tier))
 
     # Actor fragments
-    actor_blocks = []
-    for fetch in fetch_results:
-        actor_blocks.append(fetch.assembled())
-    actor_section = "\n\n---\n\n".join(actor_blocks)
+    actor_section = "\n\n---\n\n".join([fetch.assembled() for fetch in fetch_results])
 
     # Context (CODEX gamestate) — only injected when CODEX is active
-    is_codex_query = any(
-        fr.actor.first_name.lower() == "codex" for fr in fetch_results
+    is_codex_query = any(fr.actor.is_codex for fr in fetch_results)
+    context_section = (
+        _codex_report_or_stage_direction(campaign_dir, codex_spec_path, date, codex_data)
+        if is_codex_query else ""
     )
-    context_section = _codex_report_or_stage_direction(campaign_dir, codex_spec_path, date) if is_codex_query else ""
 
     # History
     history_section = _format_history(history or [])
 
-    # Assemble user turn
-    parts = []
-    parts.append("IMPORTANT: Your entire response must use ONLY these tags:\n[THOUGHT] your reasoning\n[CHAT] in-character response\nDo NOT write anything outside these tags.")
-    if actor_section:
-        parts.append(f"## ADVISOR CONTEXT\n\n{actor_section}")
-    if context_section:
-        parts.append(f"## GAME STATE\n\n{context_section}")
-    if history_section:
-        parts.append(f"## RECENT HISTORY\n\n{history_section}")
-    parts.append(f"## QUERY\n\n{query}")
-    parts.append("Respond now using [THOUGHT] and [CHAT] tags only.")
-
-    user_turn = "\n\n".join(parts)
+    # Assemble user turn — fixed section order, empty sections dropped
+    user_turn = "\n\n".join(filter(None, (
+        _TAG_INSTRUCTION,
+        actor_section and f"## ADVISOR CONTEXT\n\n{actor_section}",
+        context_section and f"## GAME STATE\n\n{context_section}",
+        history_section and f"## RECENT HISTORY\n\n{history_section}",
+        f"## QUERY\n\n{query}",
+        _TAG_REMINDER,
+    )))
 
     return AssembledPrompt(system=system, user=user_turn)
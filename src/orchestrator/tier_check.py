@@ -6,7 +6,6 @@ Returns a TierResult per actor indicating pass/hedged/blocked.
 """
 
 import logging
-import tomllib
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -24,7 +23,7 @@ class TierConfidence(str, Enum):
     BLOCKED = "blocked"  # actor two tiers below query
 
 
-@dataclass
+@dataclass(slots=True)
 class TierResult:
     actor: ActorMatch
     confidence: TierConfidence
@@ -38,6 +37,9 @@ class TierResult:
 
 TIERS = [1, 2, 3]
 
+# spec.toml key declaring an actor's scope at each tier, in TIERS order
+_TIER_SCOPE_KEYS = tuple(f"tier_{t}_scope" for t in TIERS)
+
 # Maps current_tier → error key in spec.toml for one-tier-above queries
 _TIER_ERROR_KEYS = {
     1: "error_out_of_tier_1",
@@ -52,13 +54,11 @@ CODEX_NAME = "codex"
 # ---------------------------------------------------------------------------
 
 def _load_spec(spec: ActorSpec) -> dict:
-    spec_path = spec.actor_dir / "spec.toml"
-    with open(spec_path, "rb") as f:
-        return tomllib.load(f)
+    return spec.spec_data  # parsed once by load_actor_specs()
 
 
 def _is_codex(spec: ActorSpec) -> bool:
-    return spec.first_name.lower() == CODEX_NAME
+    return spec.is_codex  # first_name == CODEX_NAME, resolved at load time
 
 
 def _tier_gap(actor_max_tier: int, current_tier: int) -> int:
@@ -73,10 +73,11 @@ def _actor_max_tier(data: dict) -> int:
     """
     Infer the highest tier this actor can handle from spec.toml.
     An actor supports a tier if its tier_N_scope is non-empty.
+    Evaluated once per actor by load_actor_specs() and cached as spec.max_tier.
     """
     max_tier = 1
-    for t in TIERS:
-        if data.get(f"tier_{t}_scope", "").strip():
+    for t, key in zip(TIERS, _TIER_SCOPE_KEYS):
+        if data.get(key, "").strip():
             max_tier = t
     return max_tier
 
@@ -95,8 +96,7 @@ def tier_check(actor: ActorMatch, current_tier: int) -> TierResult:
     if _is_codex(actor.spec):
         return TierResult(actor=actor, confidence=TierConfidence.FULL)
 
-    data = _load_spec(actor.spec)
-    max_tier = _actor_max_tier(data)
+    max_tier = actor.spec.max_tier
     gap = _tier_gap(max_tier, current_tier)
 
     if gap <= 0:
@@ -109,6 +109,7 @@ def tier_check(actor: ActorMatch, current_tier: int) -> TierResult:
         return TierResult(actor=actor, confidence=TierConfidence.HEDGED)
 
     # gap >= 2 → blocked
+    data = _load_spec(actor.spec)
     error_key = _TIER_ERROR_KEYS.get(max_tier, "error_out_of_tier_1")
     error_msg = data.get(error_key, "").strip() or (
         f"{actor.spec.display_name} cannot advise at Tier {current_tier}."
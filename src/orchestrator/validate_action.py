@@ -5,12 +5,19 @@ Actions:
     FETCH  → read-only, execute directly, no decision_log check
     UPDATE → check decision_log, execute if allowed, reject if denied
 
-Decision log persists to campaigns/decision_log.json (JSON file, session-persistent).
+Decision log persists to campaigns/{faction}/decision_log_{date}.jsonl (append-only
+JSON Lines, one {"key", "ruling"} record per decision, session-persistent). It is
+held in memory for the session; new decisions are appended by flush_decision_log()
+(called at session end and at interpreter exit). A log still under the old
+decision_log_{date}.json name is read when no .jsonl exists yet, and its contents
+carried over to the .jsonl on the first flush; the old file is left untouched.
 """
 
+import atexit
 import json
 import logging
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -18,7 +25,7 @@ from pathlib import Path
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     executed: bool
     ruling: str          # "allowed", "denied", "fetch"
@@ -27,18 +34,130 @@ class ActionResult:
 
 
 # ---------------------------------------------------------------------------
-# Decision log (JSON persistence)
+# Decision log (append-only JSONL persistence)
 # ---------------------------------------------------------------------------
 
+@dataclass
+class _LogState:
+    sig: tuple[int, int] | None     # file (mtime_ns, size) when last read/written; None if absent
+    log: dict[str, str]             # {action key: ruling}
+    lines: int = 0                  # records currently in the file
+    legacy: bool = False            # file is a pre-JSONL JSON object — rewrite it on flush
+    pending: list[tuple[str, str]] = field(default_factory=list)   # decisions not yet on disk
+
+
+_LOGS: dict[Path, _LogState] = {}
+
+# Rewrite the file as one line per key once it holds this many records per key
+_COMPACT_RATIO = 10
+
+
+def _file_sig(log_path: Path) -> tuple[int, int] | None:
+    try:
+        stat = log_path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _record_line(key: str, ruling: str) -> str:
+    return json.dumps({"key": key, "ruling": ruling}) + "\n"
+
+
+def _read_log_file(log_path: Path) -> tuple[dict[str, str], int, bool]:
+    """
+    Replay a decision log file into (log, record count, legacy).
+    One {"key", "ruling"} record per line, last write wins; a whole-file
+    JSON object from before the JSONL format is still accepted.
+    """
+    text = log_path.read_text(encoding="utf-8")
+    try:
+        snapshot = json.loads(text)
+    except json.JSONDecodeError:
+        snapshot = None   # several lines, or empty
+    if isinstance(snapshot, dict) and snapshot.keys() != {"key", "ruling"}:
+        return snapshot, 0, True
+
+    log: dict[str, str] = {}
+    lines = 0
+    for line in text.splitlines():
+        if line.strip():
+            record = json.loads(line)
+            log[record["key"]] = record["ruling"]
+            lines += 1
+    return log, lines, False
+
+
+def _load_state(log_path: Path) -> _LogState:
+    """
+    Return the session's decision log state for log_path, reading the file
+    only on first use or after it has been changed on disk (by the user or
+    another process). Unflushed decisions are merged on top of what is read.
+    """
+    sig = _file_sig(log_path)
+    state = _LOGS.get(log_path)
+    if state is not None and state.sig == sig:
+        return state
+    if sig is None:
+        legacy_path = log_path.with_suffix(".json")
+        if log_path.suffix == ".jsonl" and legacy_path.exists():
+            # Old file name: carried over whole to log_path on the first flush
+            log, lines, _ = _read_log_file(legacy_path)
+            fresh = _LogState(sig=None, log=log, lines=lines, legacy=True)
+        else:
+            fresh = _LogState(sig=None, log={})
+    else:
+        log, lines, legacy = _read_log_file(log_path)
+        fresh = _LogState(sig=sig, log=log, lines=lines, legacy=legacy)
+    if state is not None:
+        for key, ruling in state.pending:
+            fresh.log[key] = ruling
+        fresh.pending = state.pending
+    _LOGS[log_path] = fresh
+    return fresh
+
+
 def _load_log(log_path: Path) -> dict:
-    if log_path.exists():
-        return json.loads(log_path.read_text(encoding="utf-8"))
-    return {}
+    return _load_state(log_path).log
+
+
+def _record_decision(log_path: Path, key: str, ruling: str) -> None:
+    """Record a ruling in memory; it is appended to the file by flush_decision_log()."""
+    state = _load_state(log_path)
+    state.log[key] = ruling
+    state.pending.append((key, ruling))
+
+
+def flush_decision_log() -> None:
+    """
+    Append every decision recorded since the last flush.
+    Legacy files and logs grown past _COMPACT_RATIO records per key are
+    rewritten as a compact snapshot instead.
+    """
+    for log_path in list(_LOGS):
+        if not _LOGS[log_path].pending:
+            continue
+        # Re-read (and merge into) the file if it was edited since it was last read,
+        # so an append never lands on top of content the session has not seen
+        state = _load_state(log_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if state.legacy or state.lines + len(state.pending) > _COMPACT_RATIO * len(state.log):
+            tmp_path = log_path.with_name(log_path.name + ".tmp")
+            tmp_path.write_text(
+                "".join(_record_line(k, r) for k, r in state.log.items()), encoding="utf-8"
+            )
+            os.replace(tmp_path, log_path)   # never leaves a half-written snapshot
+            state.lines = len(state.log)
+            state.legacy = False
+        else:
+            with log_path.open("a", encoding="utf-8") as f:
+                f.write("".join(_record_line(k, r) for k, r in state.pending))
+            state.lines += len(state.pending)
+        state.pending.clear()
+        state.sig = _file_sig(log_path)
 
 
-def _save_log(log_path: Path, log: dict) -> None:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_path.write_text(json.dumps(log, indent=2), encoding="utf-8")
+atexit.register(flush_decision_log)
 
 
 def _log_key(action: str) -> str:
@@ -68,12 +187,12 @@ def _parse_action(action: str) -> tuple[str, str]:
 # ---------------------------------------------------------------------------
 
 def _execute_fetch(body: str) -> ActionResult:
-    logging.info(f"[ACTION] FETCH {body}")
+    logging.info("[ACTION] FETCH %s", body)
     return ActionResult(executed=True, ruling="fetch", data={"stub": True})
 
 
 def _execute_update(body: str) -> ActionResult:
-    logging.info(f"[ACTION] UPDATE {body}")
+    logging.info("[ACTION] UPDATE %s", body)
     return ActionResult(executed=True, ruling="allowed", data={"stub": True})
 
 
@@ -87,7 +206,7 @@ def validate_action(action: str, log_path: Path) -> ActionResult:
 
     Args:
         action:    Raw action body from parse_response (already validated as FETCH/UPDATE).
-        log_path:  Path to decision_log.json for the current campaign.
+        log_path:  Path to decision_log_{date}.jsonl for the current campaign.
     """
     verb, body = _parse_action(action)
 
@@ -100,7 +219,7 @@ def validate_action(action: str, log_path: Path) -> ActionResult:
         prior = log.get(key)
 
         if prior == "denied":
-            logging.warning(f"[ACTION] UPDATE denied by decision_log: {action!r}")
+            logging.warning("[ACTION] UPDATE denied by decision_log: %r", action)
             return ActionResult(
                 executed=False,
                 ruling="denied",
@@ -111,11 +230,10 @@ def validate_action(action: str, log_path: Path) -> ActionResult:
 
         # Log new decision
         if not prior:
-            log[key] = "allowed"
-            _save_log(log_path, log)
-            logging.info(f"[ACTION] New decision logged: {key!r}")
+            _record_decision(log_path, key, "allowed")
+            logging.info("[ACTION] New decision logged: %r", key)
 
         return result
 
-    logging.warning(f"[ACTION] Unknown verb '{verb}' — rejected")
+    logging.warning("[ACTION] Unknown verb %r — rejected", verb)
     return ActionResult(executed=False, ruling="denied", rationale=f"Unknown action verb: {verb}")
@@ -2,10 +2,12 @@
 Parse command - Parse savegame to SQLite database
 """
 
+import codecs
 import gzip
 import json
 import logging
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
 from src.core.core import load_env, get_project_root
@@ -37,6 +39,91 @@ def find_savegame(saves_dir: Path, game_date) -> Path:
     return matches[0]
 
 
+# ---------------------------------------------------------------------------
+# JSON codec — orjson when installed (several times faster on 10-100MB saves),
+# stdlib json otherwise. orjson rejects NaN/Infinity and >64-bit integers, so
+# either direction falls back to stdlib for a document or value it refuses;
+# the streaming ijson path falls back to a full load (_insert_gamestates).
+# ---------------------------------------------------------------------------
+
+def _json_loads(raw: bytes):
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        logging.info("orjson rejected savegame JSON, falling back to stdlib json")
+        return json.loads(raw)
+
+
+def _json_dumps_fn():
+    """Return a value -> JSON text serializer."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps
+
+    def dumps(value) -> str:
+        try:
+            return orjson.dumps(value).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(value)
+    return dumps
+
+
+def _streaming_ijson():
+    """ijson with its C (yajl2) backend, or None — the pure-Python backend is slower than a full load."""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson if getattr(ijson, "backend", "") == "yajl2_c" else None
+
+
+def _gamestate_rows(f, ijson=None) -> Iterator[tuple[str, str]]:
+    """(key, JSON text) for each member of 'gamestates' in the decompressed save stream f.
+
+    With ijson given the members are parsed one at a time straight off the
+    gzip stream, so the whole save is never held in memory; otherwise the
+    document is read and decoded in one go.
+    """
+    dumps = _json_dumps_fn()
+    if ijson is not None:
+        if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+            f.seek(0)
+        for key, value in ijson.kvitems(f, 'gamestates', use_float=True):
+            yield key, dumps(value)
+        return
+
+    data = _json_loads(f.read())
+    for key, value in data.get('gamestates', {}).items():
+        yield key, dumps(value)
+
+
+def _insert_gamestates(conn: sqlite3.Connection, f) -> int:
+    """Insert every gamestate row from the save stream f; returns the row count.
+
+    ijson refuses NaN/Infinity, and a duplicate key streams through as a second
+    row that trips the primary key. Either way the partial insert is discarded
+    and the save is re-read with the full decoder, which accepts both (last
+    duplicate wins, as with a dict).
+    """
+    insert = 'INSERT INTO gamestates VALUES (?, ?)'
+    ijson = _streaming_ijson()
+    if ijson is not None:
+        try:
+            return conn.executemany(insert, _gamestate_rows(f, ijson)).rowcount
+        except (ijson.JSONError, sqlite3.IntegrityError) as e:
+            logging.info("Streaming parse failed (%s), falling back to a full load", e)
+            conn.execute("DELETE FROM gamestates")
+            f.seek(0)
+    return conn.executemany(insert, _gamestate_rows(f)).rowcount
+
+
 def parse_savegame(saves_dir: Path, game_date, db_path: Path) -> int:
     """Parse savegame .gz into SQLite DB. Returns number of gamestate keys.
 
@@ -46,28 +133,37 @@ def parse_savegame(saves_dir: Path, game_date, db_path: Path) -> int:
     savegame_path = find_savegame(saves_dir, game_date)
     logging.info(f"Parsing {savegame_path.name}...")
 
-    with gzip.open(savegame_path, 'rt', encoding='utf-8-sig') as f:
-        data = json.load(f)
-
-    logging.info(f"Loaded {len(json.dumps(data)) / 1024 / 1024:.1f}MB JSON")
-
     if db_path.exists():
         db_path.unlink()
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute('''CREATE TABLE campaign (key TEXT PRIMARY KEY, value TEXT)''')
-    cursor.execute('''CREATE TABLE gamestates (key TEXT PRIMARY KEY, data TEXT)''')
-
-    gamestates = data.get('gamestates', {})
-    for key, value in gamestates.items():
-        cursor.execute('INSERT INTO gamestates VALUES (?, ?)', (key, json.dumps(value)))
-
-    conn.commit()
+    # Autocommit mode so the PRAGMAs apply immediately and BEGIN/COMMIT are ours.
+    # The file is rebuilt from scratch on every parse, so bulk-load settings
+    # (no journal, no fsync) cost nothing if a run is interrupted — just re-parse.
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+    # Decompression, JSON decoding and inserts run as one pipeline:
+    # executemany pulls rows from the generator as the gzip stream is read
+    try:
+        with gzip.open(savegame_path, 'rb') as f:
+            conn.execute("BEGIN")
+            conn.execute('''CREATE TABLE campaign (key TEXT PRIMARY KEY, value TEXT)''')
+            conn.execute('''CREATE TABLE gamestates (key TEXT PRIMARY KEY, data TEXT)''')
+            n_keys = _insert_gamestates(conn, f)
+            conn.execute("COMMIT")
+            json_mb = f.tell() / 1024 / 1024
+    except Exception:
+        # Never leave a half-written DB behind for preset/stage to pick up
+        conn.close()
+        db_path.unlink(missing_ok=True)
+        raise
     conn.close()
 
-    return len(gamestates)
+    logging.info(f"Loaded {json_mb:.1f}MB JSON ({savegame_path.stat().st_size / 1024 / 1024:.1f}MB compressed)")
+
+    return n_keys
 
 
 @timed_command
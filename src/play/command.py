@@ -2,46 +2,83 @@
 Play command - Launch KoboldCpp and start interactive advisory session (V2)
 
 Flow:
-  1. Run preset to generate gamestate files
+  1. Run preset to generate gamestate files (unless already newer than the savegame)
   2. Launch KoboldCpp as background process
   3. Delegate chat loop to orchestrator.turn()
 """
 
 import logging
 import os
+import socket
 import subprocess
+import sys
 import time
 from pathlib import Path
 
-import requests
-
 from src.core.core import load_env, get_project_root
-from src.orchestrator.orchestrator import OrchestratorState, turn
 
 
 def _wait_for_server(port: str, timeout: int = 60) -> bool:
-    """Wait until KoboldCpp API is ready. Returns True if ready, False if timeout."""
+    """Wait until KoboldCpp API is ready. Returns True if ready, False if timeout.
+
+    Probes the port with a bare TCP connect every 100ms until it is listening
+    (no HTTP request per tick), then confirms the API through the orchestrator's
+    shared HTTP session (one pooled connection, left warm for the first LLM call)
+    with backoff from 100ms up to 1s — the model may still be loading.
+    """
+    from src.orchestrator.llm_call import _get_session
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("localhost", int(port)), timeout=0.1).close()
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+
+    session = _get_session()
     url = f"http://localhost:{port}/api/v1/info/version"
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    delay = 0.1
+    while time.monotonic() < deadline:
         try:
-            r = requests.get(url, timeout=2)
+            r = session.get(url, timeout=1)
             if r.status_code == 200:
                 return True
         except Exception:
             pass
-        time.sleep(2)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
     return False
 
 
+def _load_tier(tier_state_path: Path) -> int:
+    """Current tier from tier_state_{date}.json (1 if absent)."""
+    try:
+        data = tier_state_path.read_bytes()
+    except FileNotFoundError:
+        return 1
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads(data).get("current_tier", 1)
+
+
+def _echo(text: str) -> None:
+    """Print streamed reply text as it arrives."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def cmd_play(args):
     """Launch KoboldCpp and start interactive advisory session."""
-    from src.preset.command import cmd_preset
+    from src.preset.command import cmd_preset, _preset_is_current
     from src.core.date_utils import parse_flexible_date
-    
-
-    # Phase 1: generate gamestate files
-    cmd_preset(args)
+    from src.orchestrator.commit_log import CommitLogError, flush_commit_log
+    from src.orchestrator.orchestrator import OrchestratorState, turn
+    from src.orchestrator.validate_action import flush_decision_log
 
     env = load_env()
     project_root = get_project_root()
@@ -49,6 +86,12 @@ def cmd_play(args):
     _, iso_date = parse_flexible_date(args.date)
     faction = args.faction
 
+    # Phase 1: generate gamestate files (skipped when already newer than the savegame)
+    if _preset_is_current(project_root, faction, iso_date):
+        logging.info("Gamestate files current — using cached preset")
+    else:
+        cmd_preset(args)
+
     quality    = args.quality if hasattr(args, 'quality') and args.quality else env.get('KOBOLDCPP_QUALITY', 'base')
     model_path = env.get(f'KOBOLDCPP_MODEL_{quality.upper()}')
 
@@ -59,6 +102,9 @@ def cmd_play(args):
     kobold_dir   = os.path.expanduser(env.get('KOBOLDCPP_DIR', ''))
     model_path   = os.path.expanduser(model_path)
     port         = env.get('KOBOLDCPP_PORT', '5001')
+    # Point the orchestrator at the server we launch, so the readiness probe's
+    # pooled connection is the one the first LLM call reuses
+    os.environ.setdefault('BACKEND_URL', f"http://localhost:{port}")
     gpu_backend  = env.get('KOBOLDCPP_GPU_BACKEND', 'vulkan')
     gpu_layers   = env.get('KOBOLDCPP_GPU_LAYERS', '35')
     context_size = env.get('KOBOLDCPP_CONTEXT_SIZE', '32768')
@@ -100,10 +146,7 @@ def cmd_play(args):
 
     # Phase 3: initialise orchestrator state
     tier_state_path = project_root / "campaigns" / faction / f"tier_state_{iso_date}.json"
-    tier = 1
-    if tier_state_path.exists():
-        import json
-        tier = json.loads(tier_state_path.read_text(encoding="utf-8")).get("current_tier", 1)
+    tier = _load_tier(tier_state_path)
     state = OrchestratorState(date=iso_date, faction=faction, tier=tier)
 
     print("=" * 60)
@@ -126,13 +169,26 @@ def cmd_play(args):
                 break
 
             print()
-            response = turn(user_input, state)
+            try:
+                response = turn(user_input, state, echo=_echo)
+            except CommitLogError as e:
+                logging.error("Session transcript write failed, ending session: %s", e)
+                break
             print(response)
             print()
 
     except KeyboardInterrupt:
         print("\n\nSession ended.")
     finally:
+        # Log failures are reported, never allowed to skip the backend shutdown
+        try:
+            flush_commit_log()
+        except Exception as e:
+            logging.error("Session transcript incomplete: %s", e)
+        try:
+            flush_decision_log()
+        except Exception as e:
+            logging.error("Decision log not saved: %s", e)
         print("Shutting down KoboldCpp...")
         proc.terminate()
         proc.wait(timeout=10)
@@ -10,13 +10,15 @@ Writes four focused files to campaigns/{faction}/{iso_date}/:
 Extractors live in preset/extractors/ for clean separation.
 """
 
-import json
 import logging
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.core.core import get_project_root
 from src.core.date_utils import parse_flexible_date
+from src.parse.command import _json_loads
 from src.perf.performance import timed_command
 
 # Import domain extractors
@@ -30,13 +32,89 @@ from src.preset.extractors.research import write_research
 # Shared helpers (passed to extractors)
 # ---------------------------------------------------------------------------
 
+# {(db_path, gamestate key): parsed array} — extractors share keys such as
+# TIFactionState, so each is read and parsed once per run. Treat as read-only.
+_gs_cache: dict[tuple[Path, str], list] = {}
+
+# Extractors run on worker threads: one lock per cache key so concurrent
+# callers of a shared key wait for a single parse instead of each doing it
+_gs_locks: dict[tuple[Path, str], threading.Lock] = {}
+
+# {(db_path, thread id): connection} — one read connection per savegame DB per thread for the whole run
+_conns: dict[tuple[Path, int], sqlite3.Connection] = {}
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    key = (db_path, threading.get_ident())
+    conn = _conns.get(key)
+    if conn is None:
+        conn = _conns[key] = _open_ro(db_path)
+    return conn
+
+
+def _open_ro(db_path: Path) -> sqlite3.Connection:
+    """
+    Read-only connection to a savegame DB. The file is never written while
+    preset reads it (parse rebuilds it beforehand), so immutable=1 lets SQLite
+    skip file locking and change detection.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro&immutable=1"
+    # Only ever used by the creating thread; closed from the main thread by clear_gs_cache()
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    # Multi-MB JSON blobs: map the file instead of copying pages through
+    # the page cache, and give the cache room for the larger ones
+    conn.execute("PRAGMA mmap_size=1073741824")
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+
 def _load_gs(db_path: Path, key: str):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT data FROM gamestates WHERE key = ?", (key,))
-    row = cursor.fetchone()
-    conn.close()
-    return json.loads(row[0]) if row else []
+    cache_key = (db_path, key)
+    cached = _gs_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    with _gs_locks.setdefault(cache_key, threading.Lock()):
+        cached = _gs_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # Fetched as bytes: orjson (via _json_loads) parses UTF-8 bytes without a str round trip
+        row = _connect(db_path).execute(
+            "SELECT CAST(data AS BLOB) FROM gamestates WHERE key = ?", (key,)
+        ).fetchone()
+        data = _gs_cache[cache_key] = _json_loads(row[0]) if row else []
+    return data
+
+
+def _load_gs_many(db_path: Path, keys: list[str]) -> dict[str, list]:
+    """
+    _load_gs for several keys, fetching every not-yet-cached blob in one query.
+    Results land in the same cache, so later single-key calls are hits.
+    """
+    missing = [k for k in keys if (db_path, k) not in _gs_cache]
+    if missing:
+        placeholders = ",".join("?" * len(missing))
+        raw = dict(_connect(db_path).execute(
+            f"SELECT key, CAST(data AS BLOB) FROM gamestates WHERE key IN ({placeholders})", missing
+        ))
+        for key in missing:
+            cache_key = (db_path, key)
+            with _gs_locks.setdefault(cache_key, threading.Lock()):
+                if cache_key not in _gs_cache:
+                    blob = raw.get(key)
+                    _gs_cache[cache_key] = _json_loads(blob) if blob is not None else []
+    return {k: _gs_cache[(db_path, k)] for k in keys}
+
+
+def clear_gs_cache() -> None:
+    """
+    Drop parsed gamestates and close the read connections — call once the
+    extractors are done (bounds memory, and the DB may be re-parsed).
+    """
+    _gs_cache.clear()
+    _gs_locks.clear()
+    for conn in _conns.values():
+        conn.close()
+    _conns.clear()
 
 
 def _player_faction(db_path: Path) -> tuple[int, dict]:
@@ -49,8 +127,20 @@ def _player_faction(db_path: Path) -> tuple[int, dict]:
 
 
 def _faction_name_map(db_path: Path) -> dict[int, str]:
-    factions = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIFactionState')
-    return {f['Key']['value']: f['Value'].get('displayName', '?') for f in factions}
+    key = 'PavonisInteractive.TerraInvicta.TIFactionState'
+    factions = _gs_cache.get((db_path, key))
+    if factions is not None:
+        return {f['Key']['value']: f['Value'].get('displayName', '?') for f in factions}
+    # Not parsed yet — pull just the two fields server-side instead of the whole array
+    rows = _connect(db_path).execute(
+        """SELECT json_extract(f.value, '$.Key.value'),
+                  CASE WHEN json_type(f.value, '$.Value.displayName') IS NULL THEN '?'
+                       ELSE json_extract(f.value, '$.Value.displayName') END
+           FROM gamestates, json_each(gamestates.data) AS f
+           WHERE gamestates.key = ?""",
+        (key,),
+    )
+    return dict(rows)
 
 
 def _nation_map(db_path: Path) -> dict[int, dict]:
@@ -60,18 +150,50 @@ def _nation_map(db_path: Path) -> dict[int, dict]:
 
 def _hab_body_map(db_path: Path) -> dict[int, str]:
     """hab_key → body display name"""
-    sites  = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIHabSiteState')
-    bodies = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TISpaceBodyState')
+    gs = _load_gs_many(db_path, [
+        'PavonisInteractive.TerraInvicta.TIHabSiteState',
+        'PavonisInteractive.TerraInvicta.TISpaceBodyState',
+        'PavonisInteractive.TerraInvicta.TIHabState',
+    ])
+    sites  = gs['PavonisInteractive.TerraInvicta.TIHabSiteState']
+    bodies = gs['PavonisInteractive.TerraInvicta.TISpaceBodyState']
     body_name = {b['Key']['value']: b['Value'].get('displayName', '?') for b in bodies}
     site_body  = {s['Key']['value']: body_name.get(s['Value'].get('parentBody', {}).get('value'), '?')
                   for s in sites}
-    habs = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIHabState')
+    habs = gs['PavonisInteractive.TerraInvicta.TIHabState']
     return {
         h['Key']['value']: site_body.get((h['Value'].get('habSite') or {}).get('value'), '?')
         for h in habs
     }
 
 
+# ---------------------------------------------------------------------------
+# Freshness check
+# ---------------------------------------------------------------------------
+
+_OUTPUT_FILES = (
+    "gamestate_earth.txt",
+    "gamestate_space.txt",
+    "gamestate_intel.txt",
+    "gamestate_research.txt",
+)
+
+
+def _preset_is_current(project_root: Path, faction: str, iso_date: str) -> bool:
+    """True if every gamestate_*.txt for this date is newer than the savegame and templates DBs."""
+    output_dir = project_root / "campaigns" / faction / iso_date
+    sources = (
+        project_root / "build" / f"savegame_{iso_date}.db",
+        project_root / "build" / "game_templates.db",
+    )
+    try:
+        newest_source = max(p.stat().st_mtime_ns for p in sources)
+        oldest_output = min((output_dir / name).stat().st_mtime_ns for name in _OUTPUT_FILES)
+    except FileNotFoundError:
+        return False
+    return oldest_output > newest_source
+
+
 # ---------------------------------------------------------------------------
 # Command entry point
 # ---------------------------------------------------------------------------
@@ -103,6 +225,7 @@ def cmd_preset(args):
     # Bundle helpers for extractors
     helpers = {
         'load_gs': _load_gs,
+        'load_gs_many': _load_gs_many,
         'player_faction': _player_faction,
         'faction_name_map': _faction_name_map,
         'nation_map': _nation_map,
@@ -111,10 +234,19 @@ def cmd_preset(args):
 
     logging.info(f"Extracting game state to {output_dir.name}/...")
 
-    kb_earth    = write_earth(savegame_db, output_dir / "gamestate_earth.txt", helpers)
-    kb_space    = write_space(savegame_db, output_dir / "gamestate_space.txt", game_date, templates_file, helpers)
-    kb_intel    = write_intel(savegame_db, output_dir / "gamestate_intel.txt", helpers)
-    kb_research = write_research(savegame_db, output_dir / "gamestate_research.txt", helpers)
+    # The four domains are independent: run them side by side, sharing the parsed-gamestate cache
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            earth    = pool.submit(write_earth, savegame_db, output_dir / "gamestate_earth.txt", helpers)
+            space    = pool.submit(write_space, savegame_db, output_dir / "gamestate_space.txt",
+                                   game_date, templates_file, helpers)
+            intel    = pool.submit(write_intel, savegame_db, output_dir / "gamestate_intel.txt", helpers)
+            research = pool.submit(write_research, savegame_db, output_dir / "gamestate_research.txt", helpers)
+        kb_earth, kb_space, kb_intel, kb_research = (
+            f.result() for f in (earth, space, intel, research)
+        )
+    finally:
+        clear_gs_cache()
 
     files = list(output_dir.glob("gamestate_*.txt"))
     total_kb = sum(f.stat().st_size for f in files) // 1024
@@ -1,3 +1,12 @@
 """
 Domain-specific game state extractors for preset command.
 """
+
+from pathlib import Path
+
+
+def write_report(out: Path, lines: list[str]) -> int:
+    """Write report lines as UTF-8 in one encode and one write. Returns size in KB."""
+    data = "\n".join(lines).encode('utf-8')
+    out.write_bytes(data)
+    return len(data) // 1024
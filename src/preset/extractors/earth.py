@@ -4,6 +4,8 @@ Earth domain extractor: nations, control points, climate, faction resources.
 
 from pathlib import Path
 
+from src.preset.extractors import write_report
+
 
 def write_earth(db_path: Path, out: Path, helpers: dict):
     """Extract Earth/political game state.
@@ -156,5 +158,4 @@ def write_earth(db_path: Path, out: Path, helpers: dict):
             f"{mc:>6.0f}"
         )
 
-    out.write_text("\n".join(lines), encoding='utf-8')
-    return out.stat().st_size // 1024
+    return write_report(out, lines)
@@ -2,8 +2,28 @@
 Intel domain extractor: known enemy councilors, faction intel levels, our councilors.
 """
 
+from operator import itemgetter
 from pathlib import Path
 
+from src.preset.extractors import write_report
+
+# Row templates, bound once: (name, type, faction, intel, suspicion, location) / (name, type, location)
+_ENEMY_COUNCILOR_ROW = "  {:<25} {:<16} {:<22} {:>6}  {:>9}  {}".format
+_OWN_COUNCILOR_ROW   = "  {:<25} {:<16} {}".format
+
+# Fixed section headers, added with a single extend each
+_ENEMY_COUNCILOR_HEADER = (
+    "## Known Enemy Councilors",
+    f"  {'Name':<25} {'Type':<16} {'Faction':<22} {'Intel':>6}  {'Suspicion':>9}  Location",
+    "  " + "-" * 100,
+)
+_OWN_COUNCILOR_HEADER = (
+    "",
+    "## Our Councilors",
+    f"  {'Name':<25} {'Type':<16} Location",
+    "  " + "-" * 70,
+)
+
 
 def write_intel(db_path: Path, out: Path, helpers: dict):
     """Extract intelligence game state.
@@ -28,10 +48,14 @@ def write_intel(db_path: Path, out: Path, helpers: dict):
     # Build region → nation name map for location resolution
     regions = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIRegionState')
     region_map = {r['Key']['value']: r['Value'] for r in regions}
-    region_nation = {}
-    for nk, n in nation_map_data.items():
-        for rk in (r.get('value') for r in n.get('regions', [])):
-            region_nation[rk] = nk
+    region_nation = {
+        r.get('value'): nk
+        for nk, n in nation_map_data.items()
+        for r in n.get('regions', ())
+    }
+
+    # region key → "Region, Nation" — filled on first use; several councilors share a region
+    region_location: dict = {}
 
     def resolve_location(loc: dict) -> str:
         if not loc:
@@ -39,12 +63,16 @@ def write_intel(db_path: Path, out: Path, helpers: dict):
         loc_type = loc.get('$type', '')
         loc_key  = loc.get('value')
         if 'Region' in loc_type:
-            region = region_map.get(loc_key, {})
-            nation_key = region_nation.get(loc_key)
-            nation = nation_map_data.get(nation_key, {})
-            region_name = region.get('displayName', f'region {loc_key}')
-            nation_name = nation.get('displayName', '')
-            return f"{region_name}, {nation_name}" if nation_name else region_name
+            label = region_location.get(loc_key)
+            if label is None:
+                region = region_map.get(loc_key, {})
+                nation = nation_map_data.get(region_nation.get(loc_key), {})
+                region_name = region.get('displayName', f'region {loc_key}')
+                nation_name = nation.get('displayName', '')
+                label = region_location[loc_key] = (
+                    f"{region_name}, {nation_name}" if nation_name else region_name
+                )
+            return label
         elif 'Hab' in loc_type:
             return f'hab {loc_key}'
         return 'unknown'
@@ -62,41 +90,43 @@ def write_intel(db_path: Path, out: Path, helpers: dict):
 
     lines = ["# INTELLIGENCE STATE", ""]
 
-    # Known enemy councilors
+    # Known enemy councilors — one pass over our intel entries resolves each
+    # councilor, its faction key and faction name once, for both the sort and the row
     intel_entries = pf.get('intel', [])
-    enemy_councilor_intel = [
-        (entry['Key']['value'], entry['Value'])
-        for entry in intel_entries
-        if 'TICouncilorState' in entry['Key'].get('$type', '')
-        and (councilor_map.get(entry['Key']['value'], {}).get('faction') or {}).get('value') != player_faction_key
-    ]
-
-    lines.append("## Known Enemy Councilors")
-    lines.append(f"  {'Name':<25} {'Type':<16} {'Faction':<22} {'Intel':>6}  {'Suspicion':>9}  Location")
-    lines.append("  " + "-" * 100)
-
-    enemy_councilor_intel.sort(key=lambda x: (
-        faction_names.get((councilor_map.get(x[0], {}).get('faction') or {}).get('value'), '?'),
-        councilor_map.get(x[0], {}).get('displayName', '')
-    ))
-
-    for ck, intel_level in enemy_councilor_intel:
-        c = councilor_map.get(ck, {})
-        if not c:
+    any_enemy_intel = False
+    known_enemies = []   # (faction name, display name, councilor key, intel level, councilor)
+    for entry in intel_entries:
+        if 'TICouncilorState' not in entry['Key'].get('$type', ''):
+            continue
+        ck = entry['Key']['value']
+        c  = councilor_map.get(ck)
+        fk = ((c or {}).get('faction') or {}).get('value')
+        if fk == player_faction_key:
             continue
-        name     = c.get('displayName', '?')
-        ctype    = c.get('typeTemplateName', '?')
-        fk       = (c.get('faction') or {}).get('value')
-        fname    = faction_names.get(fk, '?')
-        location = resolve_location(c.get('location', {}))
-        sus_val  = suspicion_map.get(ck, ('', 0.0))[1]
-        sus_str  = f"{sus_val:.1f}" if sus_val > 0 else '-'
-        intel_str = f"{intel_level:.2f}"
-        lines.append(
-            f"  {name:<25} {ctype:<16} {fname:<22} {intel_str:>6}  {sus_str:>9}  {location}"
+        any_enemy_intel = True
+        if c:
+            known_enemies.append((faction_names.get(fk, '?'), c.get('displayName', ''), ck, entry['Value'], c))
+    known_enemies.sort(key=itemgetter(0, 1))
+
+    lines.extend(_ENEMY_COUNCILOR_HEADER)
+
+    def suspicion_str(ck) -> str:
+        sus_val = suspicion_map.get(ck, ('', 0.0))[1]
+        return f"{sus_val:.1f}" if sus_val > 0 else '-'
+
+    lines.extend(
+        _ENEMY_COUNCILOR_ROW(
+            c.get('displayName', '?'),
+            c.get('typeTemplateName', '?'),
+            fname,
+            f"{intel_level:.2f}",
+            suspicion_str(ck),
+            resolve_location(c.get('location', {})),
         )
+        for fname, _, ck, intel_level, c in known_enemies
+    )
 
-    if not enemy_councilor_intel:
+    if not any_enemy_intel:
         lines.append("  No enemy councilors identified yet")
 
     # Faction intel levels
@@ -107,25 +137,24 @@ def write_intel(db_path: Path, out: Path, helpers: dict):
     ]
 
     if faction_intel:
-        lines += ["", "## Faction Intel Levels"]
-        for fk, level in sorted(faction_intel, key=lambda x: -x[1]):
-            mark = " *" if fk == player_faction_key else ""
-            lines.append(f"  {faction_names.get(fk, '?'):<22}{mark}  {level:.2f}")
+        lines.extend(("", "## Faction Intel Levels"))
+        lines.extend(
+            f"  {faction_names.get(fk, '?'):<22}{' *' if fk == player_faction_key else ''}  {level:.2f}"
+            for fk, level in sorted(faction_intel, key=lambda x: -x[1])
+        )
 
     # Our councilors
     player_councilor_keys = {c['value'] for c in pf.get('councilors', [])}
     player_councilors = [councilor_map[k] for k in player_councilor_keys if k in councilor_map]
 
-    lines += ["", "## Our Councilors"]
-    lines.append(f"  {'Name':<25} {'Type':<16} Location")
-    lines.append("  " + "-" * 70)
-    for c in sorted(player_councilors, key=lambda x: x.get('displayName', '')):
-        location = resolve_location(c.get('location', {}))
-        lines.append(
-            f"  {c.get('displayName','?'):<25} "
-            f"{c.get('typeTemplateName','?'):<16} "
-            f"{location}"
+    lines.extend(_OWN_COUNCILOR_HEADER)
+    lines.extend(
+        _OWN_COUNCILOR_ROW(
+            c.get('displayName', '?'),
+            c.get('typeTemplateName', '?'),
+            resolve_location(c.get('location', {})),
         )
+        for c in sorted(player_councilors, key=lambda x: x.get('displayName', ''))
+    )
 
-    out.write_text("\n".join(lines), encoding='utf-8')
-    return out.stat().st_size // 1024
+    return write_report(out, lines)
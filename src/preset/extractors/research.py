@@ -18,18 +18,17 @@ def write_research(db_path: Path, out: Path, helpers: dict):
     grs_list = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIGlobalResearchState')
     grs = grs_list[0]['Value'] if grs_list else {}
 
-    lines = ["# RESEARCH STATE", ""]
-
     finished = grs.get('finishedTechsNames', [])
-    lines.append(f"## Completed Technologies ({len(finished)} total)")
-    for tech in sorted(finished):
-        lines.append(f"  {tech}")
-
     projects = grs.get('finishedOneTimeOnlyProjectNames', [])
-    if projects:
-        lines += ["", f"## Completed One-Time Projects ({len(projects)})"]
-        for p in sorted(projects):
-            lines.append(f"  {p}")
 
-    out.write_text("\n".join(lines), encoding='utf-8')
+    # Streamed through a 1 MiB buffer: the tech list is the one section that
+    # grows without bound, so no joined copy of the report is ever built.
+    # Same bytes as write_report(): LF-separated, no trailing newline.
+    with out.open('w', encoding='utf-8', newline='\n', buffering=1 << 20) as f:
+        f.write(f"# RESEARCH STATE\n\n## Completed Technologies ({len(finished)} total)")
+        f.writelines(f"\n  {tech}" for tech in sorted(finished))
+        if projects:
+            f.write(f"\n\n## Completed One-Time Projects ({len(projects)})")
+            f.writelines(f"\n  {p}" for p in sorted(projects))
+
     return out.stat().st_size // 1024
@@ -2,8 +2,32 @@
 Space domain extractor: habs, stations, fleets, launch windows.
 """
 
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
-from src.preset.launch_windows import calculate_launch_windows
+from src.preset.extractors import write_report
+from src.preset.launch_windows import cached_launch_windows
+
+# (Key, Value) of a gamestate entry in one C-level call
+_key_value = itemgetter('Key', 'Value')
+_value     = itemgetter('Value')
+
+# Sort key for (display name, value) pairs — stable, so equal names keep save order
+_by_name = itemgetter(0)
+
+# Row templates, bound once: (name, type, tier, faction, mark) / (name, faction, location, mark)
+_HAB_ROW   = "  {:<30} {:<10} T{}    {}{}".format
+_FLEET_ROW = "  {:<25} {:<20} {}{}".format
+
+# Fixed table headers, added with a single extend each
+_HAB_HEADER = (
+    f"  {'Name':<30} {'Type':<10} {'Tier':<5} {'Faction'}",
+    "  " + "-" * 65,
+)
+_FLEET_HEADER = (
+    f"  {'Name':<25} {'Faction':<20} {'Location'}",
+    "  " + "-" * 65,
+)
 
 
 def write_space(db_path: Path, out: Path, game_date, templates_file: Path, helpers: dict):
@@ -16,74 +40,84 @@ def write_space(db_path: Path, out: Path, game_date, templates_file: Path, helpe
         templates_file: Path to TISpaceBodyTemplate.json
         helpers: Dict of shared helper functions
     """
-    _load_gs = helpers['load_gs']
+    _load_gs_many = helpers['load_gs_many']
     _player_faction = helpers['player_faction']
     _faction_name_map = helpers['faction_name_map']
     _hab_body_map = helpers['hab_body_map']
     
+    # Every gamestate this domain touches, own and helpers', in one round trip
+    gs = _load_gs_many(db_path, [
+        'PavonisInteractive.TerraInvicta.TIHabState',
+        'PavonisInteractive.TerraInvicta.TISpaceFleetState',
+        'PavonisInteractive.TerraInvicta.TISpaceBodyState',
+        'PavonisInteractive.TerraInvicta.TIHabSiteState',
+        'PavonisInteractive.TerraInvicta.TIFactionState',
+        'PavonisInteractive.TerraInvicta.TIPlayerState',
+    ])
+
     faction_names = _faction_name_map(db_path)
     hab_body      = _hab_body_map(db_path)
     player_faction_key, _ = _player_faction(db_path)
+    faction_name = faction_names.get   # bound once for the row loops
 
-    habs   = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIHabState')
-    fleets = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TISpaceFleetState')
-    bodies = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TISpaceBodyState')
-    body_name = {b['Key']['value']: b['Value'].get('displayName', '?') for b in bodies}
+    habs   = gs['PavonisInteractive.TerraInvicta.TIHabState']
+    fleets = gs['PavonisInteractive.TerraInvicta.TISpaceFleetState']
+    bodies = gs['PavonisInteractive.TerraInvicta.TISpaceBodyState']
+    body_name = {key['value']: value.get('displayName', '?') for key, value in map(_key_value, bodies)}
 
     lines = ["# SPACE STATE", ""]
 
-    # Habs by body
-    hab_by_body: dict[str, list] = {}
-    for h in habs:
-        v = h['Value']
+    # Habs by body, as (sort name, hab value) — decorated while the value is already in hand
+    hab_by_body: defaultdict[str, list] = defaultdict(list)
+    for key, v in map(_key_value, habs):
         if not v.get('exists') or v.get('archived'):
             continue
-        body = hab_body.get(h['Key']['value'], '?')
-        hab_by_body.setdefault(body, []).append(h)
+        hab_by_body[hab_body.get(key['value'], '?')].append((v.get('displayName', ''), v))
 
     lines.append("## Habs & Stations")
     for body in sorted(hab_by_body.keys()):
         lines.append(f"\n### {body}")
-        lines.append(f"  {'Name':<30} {'Type':<10} {'Tier':<5} {'Faction'}")
-        lines.append("  " + "-" * 65)
-        for h in sorted(hab_by_body[body], key=lambda x: x['Value'].get('displayName', '')):
-            v = h['Value']
-            fname = faction_names.get((v.get('faction') or {}).get('value'), 'None')
-            player_mark = " *" if (v.get('faction') or {}).get('value') == player_faction_key else ""
-            lines.append(
-                f"  {v.get('displayName','?'):<30} "
-                f"{v.get('habType','?'):<10} "
-                f"T{v.get('tier',0)}    "
-                f"{fname}{player_mark}"
-            )
+        lines.extend(_HAB_HEADER)
+        for _, v in sorted(hab_by_body[body], key=_by_name):
+            fk = (v.get('faction') or {}).get('value')
+            fname = faction_name(fk, 'None')
+            player_mark = " *" if fk == player_faction_key else ""
+            lines.append(_HAB_ROW(v.get('displayName', '?'), v.get('habType', '?'), v.get('tier', 0),
+                                  fname, player_mark))
 
     # Fleets
-    lines += ["", "## Fleets"]
-    active_fleets = [f for f in fleets if f['Value'].get('exists') and not f['Value'].get('archived')
-                     and not f['Value'].get('dummyFleet')]
+    lines.extend(("", "## Fleets"))
+    active_fleets = [
+        (v.get('displayName', ''), v) for v in map(_value, fleets)
+        if v.get('exists') and not v.get('archived') and not v.get('dummyFleet')
+    ]
     if active_fleets:
-        lines.append(f"  {'Name':<25} {'Faction':<20} {'Location'}")
-        lines.append("  " + "-" * 65)
-        for f in sorted(active_fleets, key=lambda x: x['Value'].get('displayName', '')):
-            v = f['Value']
-            fname = faction_names.get((v.get('faction') or {}).get('value'), '?')
+        lines.extend(_FLEET_HEADER)
+        active_fleets.sort(key=_by_name)
+        for _, v in active_fleets:
+            fk = (v.get('faction') or {}).get('value')
+            fname = faction_name(fk, '?')
             barycenter_key = (v.get('barycenter') or {}).get('value')
             docked_key = (v.get('dockedLocation') or {}).get('value')
             if docked_key:
                 location = f"docked @ hab {docked_key}"
             elif barycenter_key:
-                location = f"orbiting {body_name.get(barycenter_key, f'body {barycenter_key}')}"
+                # membership, not .get(key, default): the fallback name is only built on a miss
+                if barycenter_key in body_name:
+                    location = f"orbiting {body_name[barycenter_key]}"
+                else:
+                    location = f"orbiting body {barycenter_key}"
             else:
                 location = "in transit"
-            player_mark = " *" if (v.get('faction') or {}).get('value') == player_faction_key else ""
-            lines.append(f"  {v.get('displayName','?'):<25} {fname:<20} {location}{player_mark}")
+            player_mark = " *" if fk == player_faction_key else ""
+            lines.append(_FLEET_ROW(v.get('displayName', '?'), fname, location, player_mark))
     else:
         lines.append("  No active fleets")
 
     # Launch windows
-    launch_windows = calculate_launch_windows(game_date, templates_file)
+    launch_windows = cached_launch_windows(game_date, templates_file)
     if launch_windows:
-        lines += ["", "## Launch Windows"]
+        lines.extend(("", "## Launch Windows"))
         for target, data in launch_windows.items():
             line = (f"  {target}: next window {data['next_window']} "
                     f"({data['days_away']} days, ~{data['days_away'] // 30} months)")
@@ -91,5 +125,4 @@ def write_space(db_path: Path, out: Path, game_date, templates_file: Path, helpe
                 line += f", current penalty {data['current_penalty']}%"
             lines.append(line)
 
-    out.write_text("\n".join(lines), encoding='utf-8')
-    return out.stat().st_size // 1024
+    return write_report(out, lines)
@@ -8,21 +8,18 @@ Uses Keplerian orbital mechanics and game-verified synodic periods.
 import logging
 import math
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 
 def calculate_launch_windows(game_date: datetime, templates_file: Path) -> dict:
     """Calculate launch windows for major targets using known synodic periods"""
-    import json
-
+    # The templates file gates the calculation (no build, no windows) but its
+    # contents are not needed: every target below uses game-verified constants
     if not templates_file.exists():
         logging.warning(f"Templates file not found: {templates_file}")
         return {}
 
-    # Load templates
-    with open(templates_file, encoding='utf-8') as f:
-        templates_data = json.load(f)
-
     # Known optimal windows (from game verification)
     # Mars windows repeat every 780 days
     mars_base_window = datetime(2026, 11, 13)  # Known optimal
@@ -82,3 +79,17 @@ def calculate_launch_windows(game_date: datetime, templates_file: Path) -> dict:
     }
 
     return results
+
+
+def cached_launch_windows(game_date: datetime, templates_file: Path) -> dict:
+    """calculate_launch_windows(), memoized per (date, templates file state). Treat the result as read-only."""
+    try:
+        mtime_ns = templates_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return calculate_launch_windows(game_date, templates_file)
+    return _launch_windows_for(game_date, templates_file, mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _launch_windows_for(game_date: datetime, templates_file: Path, mtime_ns: int) -> dict:
+    return calculate_launch_windows(game_date, templates_file)
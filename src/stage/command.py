@@ -14,14 +14,16 @@ Usage:
 
 import json
 import logging
-import sqlite3
+import os
 import tomllib
 from datetime import datetime
 from pathlib import Path
 
-from src.core.core import load_env, get_project_root
+from src.core.core import load_env, get_project_root, read_text_noatime
 from src.core.date_utils import parse_flexible_date
 from src.perf.performance import timed_command
+# Same cached loader preset uses: keys parsed for tier evaluation are reused by populate
+from src.preset.command import _load_gs, clear_gs_cache
 
 # Stable Terra Invicta body keys (confirmed across saves)
 BODY_LUNA    = 6
@@ -74,16 +76,6 @@ def _ensure_db(project_root: Path, game_date, iso_date: str, force: bool) -> Pat
 # Phase 2: Tier evaluation
 # ---------------------------------------------------------------------------
 
-def _load_gs(db_path: Path, key: str):
-    """Load one gamestate array from the DB, parsed from JSON."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT data FROM gamestates WHERE key = ?", (key,))
-    row = cursor.fetchone()
-    conn.close()
-    return json.loads(row[0]) if row else []
-
-
 def _find_player_faction(db_path: Path) -> tuple[int, dict]:
     """Return (faction_key, faction_value) for the human player."""
     players = _load_gs(db_path, 'PavonisInteractive.TerraInvicta.TIPlayerState')
@@ -345,7 +337,7 @@ def load_actor(actor_dir: Path) -> dict:
     persona_file = actor_dir / "persona.md"
     if persona_file.exists():
         # New consolidated format
-        content = persona_file.read_text(encoding='utf-8')
+        content = read_text_noatime(persona_file)
         actor['background']       = _extract_section(content, 'Background')
         actor['personality']      = _extract_section(content, 'Personality')
         actor['stage_directions'] = _extract_section(content, 'Stage')
@@ -357,12 +349,12 @@ def load_actor(actor_dir: Path) -> dict:
             ('stage.txt',       'stage_directions'),
         ]:
             filepath = actor_dir / filename
-            actor[key] = filepath.read_text(encoding='utf-8').strip() if filepath.exists() else ''
+            actor[key] = read_text_noatime(filepath).strip() if filepath.exists() else ''
 
     for tier in (1, 2, 3):
         filepath = actor_dir / f"examples_tier{tier}.md"
         actor[f'examples_tier{tier}'] = (
-            filepath.read_text(encoding='utf-8').strip() if filepath.exists() else ''
+            read_text_noatime(filepath).strip() if filepath.exists() else ''
         )
 
     return actor
@@ -427,7 +419,7 @@ def assemble_system_context(prompts_dir: Path, tier: int) -> str:
     if not system_file.exists():
         logging.warning("resources/prompts/system.txt not found - skipping")
         return ''
-    content = system_file.read_text(encoding='utf-8').strip()
+    content = read_text_noatime(system_file).strip()
     content = content.replace('{tier}', str(tier))
     return content
 
@@ -438,39 +430,105 @@ def assemble_codex_context(prompts_dir: Path) -> str:
     if not codex_file.exists():
         logging.warning("resources/prompts/codex_eval.txt not found - skipping")
         return ''
-    return codex_file.read_text(encoding='utf-8').strip()
+    return read_text_noatime(codex_file).strip()
+
+
+# Manifest of {context file name: inputs key} written alongside the context files
+_CONTEXT_CACHE_FILE = ".context_cache.json"
+
+
+def _inputs_key(paths: list[Path], tier: int) -> str:
+    """Fingerprint of a context file's inputs: tier plus each source's path, mtime and size."""
+    import hashlib
+
+    h = hashlib.blake2b(str(tier).encode(), digest_size=16)
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            h.update(f"\n{path}:-".encode())
+            continue
+        h.update(f"\n{path}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return h.hexdigest()
+
+
+def _assemble_actor(actor_dir: Path, tier: int) -> str:
+    """Context text for one actor, or '' if it has no spec.toml."""
+    actor = load_actor(actor_dir)
+    return assemble_actor_context(actor, tier) if actor else ''
 
 
 def assemble_contexts(resources_dir: Path, campaigns_dir: Path, tier: int):
-    """Assemble all context files at the given tier."""
+    """Assemble all context files at the given tier.
+
+    A context file whose source files (and the tier) are unchanged since the
+    last run is left as is — no reads, no re-assembly, no write.
+    """
     prompts_dir = resources_dir / "prompts"
 
-    system_ctx = assemble_system_context(prompts_dir, tier)
-    if system_ctx:
-        (campaigns_dir / "context_system.txt").write_text(system_ctx, encoding='utf-8')
-        logging.info("  -> context_system.txt")
+    # (output file, actor name or None, source files, builder) in write order.
+    # Several jobs may target one file (the codex actor and codex_eval.txt both
+    # produce context_codex.txt); the last non-empty result wins, as it always has.
+    jobs = [
+        ("context_system.txt", None, [prompts_dir / "system.txt"],
+         lambda: assemble_system_context(prompts_dir, tier)),
+        ("context_codex.txt", None, [prompts_dir / "codex_eval.txt"],
+         lambda: assemble_codex_context(prompts_dir)),
+    ]
+    # scandir: entry types come from the directory listing, no stat per entry
+    with os.scandir(resources_dir / "actors") as entries:
+        actor_dirs = sorted(Path(e.path) for e in entries if e.is_dir() and not e.name.startswith('_'))
+    for actor_dir in actor_dirs:
+        with os.scandir(actor_dir) as entries:
+            sources = sorted(Path(e.path) for e in entries if e.is_file())
+        jobs.append((f"context_{actor_dir.name}.txt", actor_dir.name, sources,
+                     lambda d=actor_dir: _assemble_actor(d, tier)))
+
+    # One key per output file, covering every job that writes it
+    job_keys: dict[str, list[str]] = {}
+    for out_name, _, sources, _ in jobs:
+        job_keys.setdefault(out_name, []).append(_inputs_key(sources, tier))
+    new_cache = {name: ":".join(keys) for name, keys in job_keys.items()}
+
+    cache_path = campaigns_dir / _CONTEXT_CACHE_FILE
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        cache = {}
+    current = {
+        name for name, key in new_cache.items()
+        if cache.get(name) == key and (campaigns_dir / name).exists()
+    }
 
-    codex_ctx = assemble_codex_context(prompts_dir)
-    if codex_ctx:
-        (campaigns_dir / "context_codex.txt").write_text(codex_ctx, encoding='utf-8')
-        logging.info("  -> context_codex.txt")
+    # Build the stale ones concurrently (overlapping their file reads); write in job order
+    stale = [i for i, job in enumerate(jobs) if job[0] not in current]
+    built: dict[int, str] = {}
+    if stale:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            built = dict(zip(stale, pool.map(lambda i: jobs[i][3](), stale)))
 
     assembled, skipped = [], []
-    for actor_dir in sorted((resources_dir / "actors").iterdir()):
-        if not actor_dir.is_dir() or actor_dir.name.startswith('_'):
+    for i, (out_name, actor_name, _, _) in enumerate(jobs):
+        if out_name in current:
+            logging.info(f"  -> {out_name} (unchanged)")
+            if actor_name:
+                assembled.append(actor_name)
             continue
-        actor = load_actor(actor_dir)
-        if not actor:
-            skipped.append(actor_dir.name)
+        ctx = built[i]
+        if not ctx:
+            if actor_name:
+                skipped.append(actor_name)
             continue
-        ctx = assemble_actor_context(actor, tier)
-        (campaigns_dir / f"context_{actor_dir.name}.txt").write_text(ctx, encoding='utf-8')
-        assembled.append(actor_dir.name)
-        logging.info(f"  -> context_{actor_dir.name}.txt")
+        (campaigns_dir / out_name).write_text(ctx, encoding='utf-8')
+        if actor_name:
+            assembled.append(actor_name)
+        logging.info(f"  -> {out_name}")
 
     if skipped:
         logging.warning(f"Skipped actors (no spec.toml): {', '.join(skipped)}")
 
+    cache_path.write_text(json.dumps(new_cache, indent=2), encoding='utf-8')
     return assembled
 
 
@@ -496,28 +554,30 @@ def cmd_stage(args):
     db_path = _ensure_db(project_root, game_date, iso_date, force)
 
     # Phase 2: Evaluate
-    state = evaluate_tier(db_path, output_dir, iso_date)
-    tier = state['current_tier']
-
-    # Phase 2b: Populate savegame.db
-    from src.db.populate import populate_savegame_db
-    from src.preset.command import (
-        _load_gs as preset_load_gs,
-        _player_faction, _faction_name_map, _nation_map, _hab_body_map
-    )
-    helpers = {
-        'load_gs':         preset_load_gs,
-        'player_faction':  _player_faction,
-        'faction_name_map': _faction_name_map,
-        'nation_map':      _nation_map,
-        'hab_body_map':    _hab_body_map,
-    }
-    savegame_db = output_dir / f"savegame_{iso_date}.db"
-    templates_dir  = project_root / 'build' / 'templates'
-    templates_file = templates_dir / 'TISpaceBodyTemplate.json'
-    populate_savegame_db(db_path, savegame_db, faction, iso_date, helpers,
-                         game_date=game_date, templates_file=templates_file,
-                         templates_dir=templates_dir)
+    try:
+        state = evaluate_tier(db_path, output_dir, iso_date)
+        tier = state['current_tier']
+
+        # Phase 2b: Populate savegame.db
+        from src.db.populate import populate_savegame_db
+        from src.preset.command import (
+            _player_faction, _faction_name_map, _nation_map, _hab_body_map
+        )
+        helpers = {
+            'load_gs':         _load_gs,
+            'player_faction':  _player_faction,
+            'faction_name_map': _faction_name_map,
+            'nation_map':      _nation_map,
+            'hab_body_map':    _hab_body_map,
+        }
+        savegame_db = output_dir / f"savegame_{iso_date}.db"
+        templates_dir  = project_root / 'build' / 'templates'
+        templates_file = templates_dir / 'TISpaceBodyTemplate.json'
+        populate_savegame_db(db_path, savegame_db, faction, iso_date, helpers,
+                             game_date=game_date, templates_file=templates_file,
+                             templates_dir=templates_dir)
+    finally:
+        clear_gs_cache()
 
     # Phase 3: Assemble
     assembled = assemble_contexts(resources_dir, output_dir, tier)
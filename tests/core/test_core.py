@@ -4,10 +4,11 @@ Tests for core utilities
 Tests environment loading, logging setup, and path management.
 """
 
+import os
 import pytest
 from pathlib import Path
 
-from src.core.core import get_project_root
+from src.core.core import get_project_root, read_text_noatime
 
 
 class TestEnvironmentLoading:
@@ -34,19 +35,23 @@ class TestPathManagement:
     def test_project_structure(self):
         """Verify expected project structure"""
         root = get_project_root()
-        
+        names = {entry.name for entry in os.scandir(root)}
+
         # Core directories
-        assert (root / "resources").exists()
-        assert (root / "src").exists()
-        assert (root / "tests").exists()
-        assert (root / "docs").exists()
-        
+        assert {"resources", "src", "tests", "docs"} <= names
+
         # Config files
-        assert (root / ".env.linux.dist").exists()
-        assert (root / ".env.win.dist").exists()
-        assert (root / "README.md").exists()
-        assert (root / "setup.py").exists()
-        assert (root / "pyproject.toml").exists()
+        assert {".env.linux.dist", ".env.win.dist", "README.md", "setup.py", "pyproject.toml"} <= names
+
+
+class TestReadTextNoatime:
+    """Test the unbuffered text reader"""
+
+    @pytest.mark.parametrize("raw", [b"plain\n", b"crlf\r\nlines\r\n", b"old\rmac\r", "ünïcode\n".encode("utf-8"), b""])
+    def test_matches_read_text(self, tmp_path, raw):
+        path = tmp_path / "f.txt"
+        path.write_bytes(raw)
+        assert read_text_noatime(path) == path.read_text(encoding="utf-8")
 
 
 if __name__ == '__main__':
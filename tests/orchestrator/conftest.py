@@ -0,0 +1,74 @@
+"""
+tests/orchestrator/conftest.py
+
+Actor specs and prompt inputs shared by the orchestrator test modules — loaded once per session.
+"""
+
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.orchestrator.identify_actor import load_actor_specs
+from src.orchestrator.prompt_assemble import AssembledPrompt
+
+ACTORS_DIR   = Path("resources/actors")
+FIXTURES_DIR = Path("tests/fixtures/actors")
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch):
+    """
+    Fail fast on any real HTTP request. Every requests verb, module-level or on
+    a Session, goes through Session.request; stubs such as test_llm_call's
+    fake_post replace Session.post and so take precedence.
+    """
+    def _refuse(self, method, url, *args, **kwargs):
+        raise RuntimeError(f"network access in unit test: {method} {url}")
+    monkeypatch.setattr(requests.Session, "request", _refuse)
+
+
+@pytest.fixture(scope="session")
+def real_specs():
+    """Real actor specs from resources/actors/."""
+    return load_actor_specs(ACTORS_DIR)
+
+
+@pytest.fixture(scope="session")
+def fixture_specs():
+    """Edge-case actor specs from tests/fixtures/actors/."""
+    return load_actor_specs(FIXTURES_DIR)
+
+
+def _alias_index(specs) -> dict:
+    """{alias: spec} over lowercased first, family, nick and display names; the first actor listed wins a clash."""
+    index = {}
+    for s in specs:
+        for alias in (s.first_name, s.family_name, s.nickname, s.display_name):
+            if alias:
+                index.setdefault(alias.lower(), s)
+    return index
+
+
+@pytest.fixture(scope="session")
+def specs_by_name(real_specs):
+    """Real specs by any lowercased alias."""
+    return _alias_index(real_specs)
+
+
+@pytest.fixture(scope="session")
+def specs_by_alias(real_specs, fixture_specs):
+    """Real and fixture specs in one alias index; real actors win a clash (e.g. Kim)."""
+    return _alias_index(real_specs + fixture_specs)
+
+
+@pytest.fixture(scope="session")
+def codex_data(real_specs):
+    """CODEX spec.toml data, taken from the loaded specs as the orchestrator does."""
+    return next(s.spec_data for s in real_specs if s.is_codex)
+
+
+@pytest.fixture(scope="session")
+def dummy_prompt():
+    """Minimal AssembledPrompt for tests that only exercise the LLM call path."""
+    return AssembledPrompt(system="System block.", user="User block.")
@@ -10,7 +10,10 @@ from pathlib import Path
 
 from src.orchestrator.parse_response import ParsedResponse
 from src.orchestrator.validate_action import ActionResult
-from src.orchestrator.commit_log import CommitContext, commit_log, make_session_id
+from src.orchestrator.commit_log import (
+    CommitContext, commit_log, commit_log_async, flush_commit_log, make_session_id,
+    CommitLogError, raise_commit_errors,
+)
 from src.orchestrator.llm_call import _FALLBACK_RESPONSE
 
 
@@ -52,6 +55,39 @@ class TestLogFile:
         content = log_file.read_text()
         assert content.count("=== TURN END ===") == 2
 
+    def test_log_file_opened_once_per_session(self, tmp_path, monkeypatch):
+        import os
+        opens = []
+        real_open = os.open
+        monkeypatch.setattr(os, "open", lambda *a, **kw: opens.append(a[0]) or real_open(*a, **kw))
+        commit_log(_ctx(), logs_dir=tmp_path)
+        commit_log(_ctx(), logs_dir=tmp_path)
+        assert opens == [tmp_path / "session_2026-02-19_143201.log"]
+
+    def test_new_session_closes_previous_log(self, tmp_path, monkeypatch):
+        import os
+        commit_log(_ctx(session_id="first"), logs_dir=tmp_path)
+        closed = []
+        real_close = os.close
+        monkeypatch.setattr(os, "close", lambda fd: closed.append(fd) or real_close(fd))
+        commit_log(_ctx(session_id="second"), logs_dir=tmp_path)
+        assert len(closed) == 1
+
+    def test_rotated_log_reopened(self, tmp_path):
+        log_file = tmp_path / "session_2026-02-19_143201.log"
+        commit_log(_ctx(query="before"), logs_dir=tmp_path)
+        log_file.rename(tmp_path / "rotated.log")
+        commit_log(_ctx(query="after"), logs_dir=tmp_path)
+        assert "after" in log_file.read_text()
+        assert "after" not in (tmp_path / "rotated.log").read_text()
+
+    def test_deleted_log_recreated(self, tmp_path):
+        log_file = tmp_path / "session_2026-02-19_143201.log"
+        commit_log(_ctx(), logs_dir=tmp_path)
+        log_file.unlink()
+        commit_log(_ctx(), logs_dir=tmp_path)
+        assert log_file.read_text().count("=== TURN END ===") == 1
+
     def test_creates_logs_dir_if_missing(self, tmp_path):
         nested = tmp_path / "deep" / "logs"
         commit_log(_ctx(), logs_dir=nested)
@@ -62,23 +98,27 @@ class TestLogFile:
 # Log content
 # ---------------------------------------------------------------------------
 
-class TestLogContent:
+@pytest.fixture(scope="class")
+def log_text(tmp_path_factory) -> str:
+    """One default turn, written once and shared by the read-only content checks."""
+    logs_dir = tmp_path_factory.mktemp("logs")
+    commit_log(_ctx(), logs_dir=logs_dir)
+    return (logs_dir / "session_2026-02-19_143201.log").read_text()
 
-    def _read(self, tmp_path) -> str:
-        commit_log(_ctx(), logs_dir=tmp_path)
-        return (tmp_path / "session_2026-02-19_143201.log").read_text()
 
-    def test_query_in_log(self, tmp_path):
-        assert "Should we proceed?" in self._read(tmp_path)
+class TestLogContent:
+
+    def test_query_in_log(self, log_text):
+        assert "Should we proceed?" in log_text
 
-    def test_chat_in_log(self, tmp_path):
-        assert "Wale: Na so e be." in self._read(tmp_path)
+    def test_chat_in_log(self, log_text):
+        assert "Wale: Na so e be." in log_text
 
-    def test_thought_in_log(self, tmp_path):
-        assert "[THOUGHT]" in self._read(tmp_path)
+    def test_thought_in_log(self, log_text):
+        assert "[THOUGHT]" in log_text
 
-    def test_action_status_in_log(self, tmp_path):
-        assert "[OK]" in self._read(tmp_path)
+    def test_action_status_in_log(self, log_text):
+        assert "[OK]" in log_text
 
     def test_rejected_action_shown(self, tmp_path):
         ctx = _ctx(action_result=ActionResult(executed=False, ruling="denied", rationale="forbidden"))
@@ -86,9 +126,8 @@ class TestLogContent:
         content = (tmp_path / "session_2026-02-19_143201.log").read_text()
         assert "[REJECTED]" in content
 
-    def test_session_header_present(self, tmp_path):
-        content = self._read(tmp_path)
-        assert "=== SESSION 2026-02-19_143201 | TIER 1 | STANDARD ===" in content
+    def test_session_header_present(self, log_text):
+        assert "=== SESSION 2026-02-19_143201 | TIER 1 | STANDARD ===" in log_text
 
 
 # ---------------------------------------------------------------------------
@@ -105,6 +144,56 @@ class TestLogWriteFailure:
             commit_log(_ctx(), logs_dir=bad_path)
 
 
+# ---------------------------------------------------------------------------
+# Background writer
+# ---------------------------------------------------------------------------
+
+class TestAsyncCommit:
+
+    def test_flush_writes_queued_turns_in_order(self, tmp_path):
+        for q in ("first", "second", "third"):
+            commit_log_async(_ctx(query=q), logs_dir=tmp_path)
+        flush_commit_log()
+        content = (tmp_path / "session_2026-02-19_143201.log").read_text()
+        assert content.index("first") < content.index("second") < content.index("third")
+
+    def test_flush_raises_write_failure(self, tmp_path):
+        bad_path = tmp_path / "not_a_dir"
+        bad_path.write_text("block")
+        commit_log_async(_ctx(), logs_dir=bad_path)
+        with pytest.raises(CommitLogError):
+            flush_commit_log()
+        flush_commit_log()  # error reported once
+
+    def test_write_failure_raised_before_flush(self, tmp_path):
+        from src.orchestrator import commit_log as commit_log_module
+        bad_path = tmp_path / "not_a_dir"
+        bad_path.write_text("block")
+        commit_log_async(_ctx(), logs_dir=bad_path)
+        commit_log_module._pending.join()   # let the writer fail without flushing
+        with pytest.raises(CommitLogError):
+            raise_commit_errors()
+        raise_commit_errors()  # error reported once
+
+
+# ---------------------------------------------------------------------------
+# Turn timestamp
+# ---------------------------------------------------------------------------
+
+class TestCreatedAt:
+
+    def test_default_keeps_dialogue_fts_shape(self):
+        import re
+        from datetime import datetime, timedelta, timezone
+        created_at = _ctx().created_at
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}", created_at)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs(now - datetime.fromisoformat(created_at)) < timedelta(minutes=1)
+
+    def test_explicit_value_kept(self):
+        assert _ctx(created_at="2026-02-19T14:32:01.000000").created_at == "2026-02-19T14:32:01.000000"
+
+
 # ---------------------------------------------------------------------------
 # session_id helper
 # ---------------------------------------------------------------------------
@@ -6,7 +6,7 @@ Unit tests for src/orchestrator/display.py.
 
 import pytest
 from src.orchestrator.parse_response import ParsedResponse
-from src.orchestrator.display import display, DECISION_PROMPT, _SYSTEM_PREFIX
+from src.orchestrator.display import ChatEcho, display, DECISION_PROMPT, _SYSTEM_PREFIX
 
 
 def _parsed(chat: str) -> ParsedResponse:
@@ -99,3 +99,47 @@ class TestEdgeCases:
     def test_whitespace_only_chat_returns_empty(self):
         result = display(_parsed("   "), "standard", speaker="Wale Oluwaseun")
         assert result == ""
+
+
+# ---------------------------------------------------------------------------
+# Streaming echo
+# ---------------------------------------------------------------------------
+
+class TestChatEcho:
+
+    def _stream(self, deltas, speaker="Wale Oluwaseun"):
+        out = []
+        echo = ChatEcho(out.append, speaker)
+        for delta in deltas:
+            echo(delta)
+        return echo, "".join(out)
+
+    def test_only_chat_block_written(self):
+        _, out = self._stream(["[THOUGHT] plan", " ahead\n[CH", "AT] Na so", " e be."])
+        assert out == "WALE OLUWASEUN: Na so e be."
+
+    def test_stops_at_next_tag_after_chat(self):
+        echo, out = self._stream(["[CHAT] Na so", " e be.\n[AC", "TION] UPDATE x SET y=1"])
+        assert out == "WALE OLUWASEUN: Na so e be.\n"
+        assert echo.remainder("WALE OLUWASEUN: Na so e be.") == ""
+
+    def test_bracket_in_chat_not_held_back(self):
+        _, out = self._stream(["[CHAT] Figures [see appendix] attached."])
+        assert out == "WALE OLUWASEUN: Figures [see appendix] attached."
+
+    def test_nothing_written_without_chat_tag(self):
+        _, out = self._stream(["no tags at all"])
+        assert out == ""
+
+    def test_remainder_after_matching_echo(self):
+        echo, _ = self._stream(["[chat] Na so e be.\n"])
+        formatted = display(_parsed("Na so e be."), "debate_interrupt", speaker="Wale Oluwaseun")
+        assert echo.remainder(formatted) == f"\n\n{DECISION_PROMPT}"
+
+    def test_remainder_without_echo_is_full_text(self):
+        echo, _ = self._stream(["no tags at all"])
+        assert echo.remainder("WALE OLUWASEUN: no tags at all") == "WALE OLUWASEUN: no tags at all"
+
+    def test_mismatch_reprints_on_new_line(self):
+        echo, _ = self._stream(["[CHAT] draft\n[CHAT] final"])
+        assert echo.remainder("WALE OLUWASEUN: final") == "\nWALE OLUWASEUN: final"
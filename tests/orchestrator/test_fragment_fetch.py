@@ -5,27 +5,22 @@ Unit tests for src/orchestrator/fragment_fetch.py.
 Uses real actor specs and persona.md files from resources/actors/.
 """
 
-from pathlib import Path
-
 import pytest
 
-from src.orchestrator.identify_actor import load_actor_specs
 from src.orchestrator.tier_check import TierConfidence
-from src.orchestrator.fragment_fetch import fragment_fetch, TIER_HEDGE_INSTRUCTION
-
-ACTORS_DIR = Path("resources/actors")
+from src.orchestrator.fragment_fetch import (
+    fragment_fetch, _parse_persona_fragments, _relationship_sections, TIER_HEDGE_INSTRUCTION,
+)
 
+# Reads real actor specs from resources/actors/
+pytestmark = pytest.mark.slow
 
-@pytest.fixture(scope="module")
-def specs():
-    return load_actor_specs(ACTORS_DIR)
 
-
-def _spec(specs, name: str):
-    for s in specs:
-        if s.first_name.lower() == name.lower() or s.nickname.lower() == name.lower():
-            return s
-    raise ValueError(f"Actor '{name}' not found")
+def _spec(specs_by_name, name: str):
+    try:
+        return specs_by_name[name.lower()]
+    except KeyError:
+        raise ValueError(f"Actor '{name}' not found") from None
 
 
 # ---------------------------------------------------------------------------
@@ -34,21 +29,26 @@ def _spec(specs, name: str):
 
 class TestAlwaysInjected:
 
-    def test_base_always_present(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.FULL)
+    def test_base_always_present(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "base" in categories
 
-    def test_voice_always_present(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.FULL)
+    def test_voice_always_present(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "voice" in categories
 
-    def test_limits_always_present(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.FULL)
+    def test_limits_always_present(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "limits" in categories
 
+    def test_fixed_fragment_order(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
+        categories = [f.category for f in result.fragments]
+        assert categories[:3] == ["base", "voice", "limits"]
+
 
 # ---------------------------------------------------------------------------
 # Domain match
@@ -56,14 +56,14 @@ class TestAlwaysInjected:
 
 class TestDomainMatch:
 
-    def test_domain_injected_on_keyword_match(self, specs):
+    def test_domain_injected_on_keyword_match(self, specs_by_name):
         # "assassination" is in Wale's domain_keywords
-        result = fragment_fetch(_spec(specs, "Wale"), "should we proceed with the assassination?", TierConfidence.FULL)
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "should we proceed with the assassination?", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "domain" in categories
 
-    def test_domain_not_injected_on_no_match(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "what's the weather like?", TierConfidence.FULL)
+    def test_domain_not_injected_on_no_match(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "what's the weather like?", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "domain" not in categories
 
@@ -74,19 +74,30 @@ class TestDomainMatch:
 
 class TestRelationships:
 
-    def test_relationships_injected_when_actor_present(self, specs):
+    def test_relationships_injected_when_actor_present(self, specs_by_name):
         result = fragment_fetch(
-            _spec(specs, "Wale"), "anything", TierConfidence.FULL,
+            _spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL,
             other_actor_names=["Jonathan Pratt"]
         )
         categories = [f.category for f in result.fragments]
         assert "relationships" in categories
 
-    def test_relationships_not_injected_when_no_other_actor(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.FULL)
+    def test_relationships_not_injected_when_no_other_actor(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "relationships" not in categories
 
+    def test_named_sub_section_extracted(self, specs_by_name):
+        result = fragment_fetch(
+            _spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL,
+            other_actor_names=["Valentina Mendoza"]
+        )
+        rel = [f for f in result.fragments if f.category == "relationships"]
+        assert len(rel) == 1
+        assert rel[0].subject == "Valentina Mendoza"
+        assert rel[0].content.startswith("VALENTINA (Valentina Mendoza):")
+        assert "JONNY" not in rel[0].content
+
 
 # ---------------------------------------------------------------------------
 # Tier hedge
@@ -94,18 +105,18 @@ class TestRelationships:
 
 class TestTierHedge:
 
-    def test_hedge_instruction_injected_when_hedged(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.HEDGED)
+    def test_hedge_instruction_injected_when_hedged(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.HEDGED)
         categories = [f.category for f in result.fragments]
         assert "tier_hedge" in categories
 
-    def test_hedge_instruction_content(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.HEDGED)
+    def test_hedge_instruction_content(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.HEDGED)
         hedge = next(f for f in result.fragments if f.category == "tier_hedge")
         assert hedge.content == TIER_HEDGE_INSTRUCTION
 
-    def test_no_hedge_when_full_confidence(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.FULL)
+    def test_no_hedge_when_full_confidence(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
         categories = [f.category for f in result.fragments]
         assert "tier_hedge" not in categories
 
@@ -116,13 +127,13 @@ class TestTierHedge:
 
 class TestSpectatorPath:
 
-    def test_spectator_only_returns_spectator_fragment(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "", TierConfidence.FULL, spectator_only=True)
+    def test_spectator_only_returns_spectator_fragment(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "", TierConfidence.FULL, spectator_only=True)
         categories = [f.category for f in result.fragments]
         assert categories == ["spectator"]
 
-    def test_spectator_excludes_voice_and_limits(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "", TierConfidence.FULL, spectator_only=True)
+    def test_spectator_excludes_voice_and_limits(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "", TierConfidence.FULL, spectator_only=True)
         categories = [f.category for f in result.fragments]
         assert "voice" not in categories
         assert "limits" not in categories
@@ -134,13 +145,50 @@ class TestSpectatorPath:
 
 class TestAssembled:
 
-    def test_assembled_returns_non_empty_string(self, specs):
-        result = fragment_fetch(_spec(specs, "Wale"), "anything", TierConfidence.FULL)
+    def test_assembled_returns_non_empty_string(self, specs_by_name):
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
         text = result.assembled()
         assert isinstance(text, str)
         assert len(text) > 0
 
-    def test_unknown_fragment_category_skipped_gracefully(self, specs):
+    def test_assembled_reflects_appended_fragment(self, specs_by_name):
+        from src.orchestrator.fragment_fetch import Fragment
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
+        before = result.assembled()
+        result.fragments.append(Fragment(category="extra", subject=None, content="EXTRA"))
+        assert result.assembled() == before + "\n\nEXTRA"
+
+    def test_assembled_reflects_replaced_fragment(self, specs_by_name):
+        from src.orchestrator.fragment_fetch import Fragment
+        result = fragment_fetch(_spec(specs_by_name, "Wale"), "anything", TierConfidence.FULL)
+        result.assembled()
+        result.fragments[-1] = Fragment(category="extra", subject=None, content="REPLACED")
+        assert result.assembled().endswith("\n\nREPLACED")
+
+    def test_unknown_fragment_category_skipped_gracefully(self, specs_by_name):
         # Fragment fetch should not crash if a category is missing from persona.md
-        result = fragment_fetch(_spec(specs, "CODEX"), "anything", TierConfidence.FULL)
+        result = fragment_fetch(_spec(specs_by_name, "CODEX"), "anything", TierConfidence.FULL)
         assert result is not None
+
+
+# ---------------------------------------------------------------------------
+# persona.md parser
+# ---------------------------------------------------------------------------
+
+class TestPersonaParser:
+
+    def test_sections_sliced_and_stripped(self, tmp_path):
+        persona = tmp_path / "persona.md"
+        persona.write_text("## Personality\n\n[voice]\n  Speaks plainly.  \n\n[limits]\n\n[domain]\nOrbital.\n")
+        fragments = _parse_persona_fragments(persona)
+        assert list(fragments) == ["voice", "domain"]   # blank [limits] skipped
+        assert fragments["voice"] == "Speaks plainly."
+        assert "limits" not in fragments
+
+    def test_relationship_headers_with_hyphen_and_apostrophe(self):
+        sections = _relationship_sections(
+            "MEI-HUA (Mei-Hua Chen):\nTrusts her.\n\nO'BRIEN:\nDoes not.\n\nWALE:\nTolerates him."
+        )
+        assert list(sections) == ["MEI-HUA", "O'BRIEN", "WALE"]
+        assert sections["MEI-HUA"] == "MEI-HUA (Mei-Hua Chen):\nTrusts her."
+        assert sections["O'BRIEN"] == "O'BRIEN:\nDoes not."
@@ -4,47 +4,86 @@ tests/test_identify_actor.py
 Unit tests for src/orchestrator/identify_actor.py.
 
 Explicit routing tests use real actor specs from resources/actors/.
-Implicit routing tests mock _implicit_match to avoid loading the embedding model.
+Implicit routing tests stub _implicit_match to avoid loading the embedding model.
 Ambiguous Kim test uses fixture specs from tests/fixtures/actors/.
 """
 
-from pathlib import Path
-from unittest.mock import patch
-
+import sys
+import types
 import pytest
 
+from src.orchestrator import identify_actor as identify_actor_module
 from src.orchestrator.identify_actor import (
     AdvisorRole,
     FlowType,
     IdentifyResult,
+    _implicit_match,
     identify_actor,
-    load_actor_specs,
 )
 
-ACTORS_DIR   = Path("resources/actors")
-FIXTURES_DIR = Path("tests/fixtures/actors")
+# Reads real actor specs from resources/actors/
+pytestmark = pytest.mark.slow
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module")
-def real_specs():
-    """Real actor specs — used for all explicit routing tests."""
-    return load_actor_specs(ACTORS_DIR)
+# real_specs / fixture_specs: session-scoped, from conftest.py
+
+@pytest.fixture(scope="module", autouse=True)
+def no_implicit_match():
+    """Stub the embedding path once for the module; tests override per case."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(identify_actor_module, "_implicit_match", lambda user_input, specs: [])
+        yield
 
 
+@pytest.fixture
+def implicit_scores(monkeypatch):
+    """Set the (spec, score) list the stubbed _implicit_match returns for this test."""
+    def _set(scores):
+        monkeypatch.setattr(identify_actor_module, "_implicit_match", lambda user_input, specs: scores)
+    return _set
+
 @pytest.fixture(scope="module")
-def ambiguous_specs(real_specs):
+def ambiguous_specs(real_specs, fixture_specs):
     """
     Real specs + fixture Kim actor.
     Jun-ho has family_name 'Kim' — fixture adds a second Kim to force ambiguity.
     """
-    fixture_specs = load_actor_specs(FIXTURES_DIR)
     return real_specs + fixture_specs
 
 
+# ---------------------------------------------------------------------------
+# Actor loader
+# ---------------------------------------------------------------------------
+
+class TestLoadActorSpecs:
+
+    def test_spec_data_cached(self, real_specs):
+        wale = next(s for s in real_specs if s.first_name == "Wale")
+        assert wale.spec_data["first_name"] == "Wale"
+        assert wale.spec_data.get("domain_keywords")
+
+    def test_persona_fragments_cached(self, real_specs):
+        wale = next(s for s in real_specs if s.first_name == "Wale")
+        assert "voice" in wale.persona_fragments
+
+    def test_is_codex_flag(self, real_specs):
+        flags = {s.first_name_lower: s.is_codex for s in real_specs}
+        assert flags["codex"] is True
+        assert flags["wale"] is False
+
+    def test_interrupt_config_cached(self, real_specs):
+        lin = next(s for s in real_specs if s.first_name == "Mei-hua")
+        assert lin.interrupt_weight > 0
+        assert lin.can_interrupt_own_debate is True
+
+    def test_missing_persona_gives_empty_fragments(self, fixture_specs):
+        assert all(s.persona_fragments == {} for s in fixture_specs)
+
+
 # ---------------------------------------------------------------------------
 # Explicit routing
 # ---------------------------------------------------------------------------
@@ -65,6 +104,11 @@ class TestExplicitRouting:
         assert result.actors[0].spec.nickname == "Ankledeep"
         assert result.actors[0].role == AdvisorRole.MAIN
 
+    def test_hyphenated_name_with_punctuation(self, real_specs):
+        result = identify_actor("Mei-hua, thoughts on the shipyard?", real_specs)
+        assert result.flow_type == FlowType.STANDARD
+        assert result.actors[0].spec.family_name == "Lin"
+
     def test_ambiguous_two_kims(self, ambiguous_specs):
         result = identify_actor("Kim, what's your take?", ambiguous_specs)
         assert result.flow_type == FlowType.AMBIGUOUS
@@ -73,8 +117,7 @@ class TestExplicitRouting:
 
     def test_explicit_no_match_falls_through_to_implicit(self, real_specs):
         # "Zaphod" matches no actor — falls through to implicit path
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=[]):
-            result = identify_actor("Zaphod, what's your take?", real_specs)
+        result = identify_actor("Zaphod, what's your take?", real_specs)
         assert result.flow_type == FlowType.TOO_VAGUE
 
 
@@ -85,47 +128,103 @@ class TestExplicitRouting:
 class TestImplicitRouting:
 
     def test_too_vague(self, real_specs):
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=[]):
-            result = identify_actor("Hmm.", real_specs)
+        result = identify_actor("Hmm.", real_specs)
         assert result.flow_type == FlowType.TOO_VAGUE
         assert result.stage_note is not None
 
-    def test_too_broad(self, real_specs):
+    def test_too_broad(self, real_specs, implicit_scores):
         fake = [(real_specs[0], 0.80), (real_specs[1], 0.75), (real_specs[2], 0.71)]
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=fake):
-            result = identify_actor("What do you all think?", real_specs)
+        implicit_scores(fake)
+        result = identify_actor("What do you all think?", real_specs)
         assert result.flow_type == FlowType.TOO_BROAD
         assert result.stage_note is not None
 
-    def test_single_main(self, real_specs):
+    def test_single_main(self, real_specs, implicit_scores):
         fake = [(real_specs[0], 0.80)]
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=fake):
-            result = identify_actor("What should we do in Southeast Asia?", real_specs)
+        implicit_scores(fake)
+        result = identify_actor("What should we do in Southeast Asia?", real_specs)
         assert result.flow_type == FlowType.STANDARD
         assert len(result.actors) == 1
         assert result.actors[0].role == AdvisorRole.MAIN
 
-    def test_main_and_support(self, real_specs):
+    def test_main_and_support(self, real_specs, implicit_scores):
         fake = [(real_specs[0], 0.80), (real_specs[1], 0.45)]
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=fake):
-            result = identify_actor("Should we expand orbital presence?", real_specs)
+        implicit_scores(fake)
+        result = identify_actor("Should we expand orbital presence?", real_specs)
         assert result.flow_type == FlowType.STANDARD
         assert result.actors[0].role == AdvisorRole.MAIN
         assert result.actors[1].role == AdvisorRole.SUPPORT
 
-    def test_two_mains_triggers_debate(self, real_specs):
+    def test_two_mains_triggers_debate(self, real_specs, implicit_scores):
         fake = [(real_specs[0], 0.80), (real_specs[1], 0.75)]
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=fake):
-            result = identify_actor("Should we hit the shipyard?", real_specs)
+        implicit_scores(fake)
+        result = identify_actor("Should we hit the shipyard?", real_specs)
         assert result.flow_type == FlowType.DEBATE
         assert len(result.actors) == 2
         assert all(a.role == AdvisorRole.MAIN for a in result.actors)
 
-    def test_two_supports_triggers_debate(self, real_specs):
+    def test_two_supports_triggers_debate(self, real_specs, implicit_scores):
         # 2 supports + 0 main → low-confidence debate, user arbitrates
         fake = [(real_specs[0], 0.50), (real_specs[1], 0.40)]
-        with patch("src.orchestrator.identify_actor._implicit_match", return_value=fake):
-            result = identify_actor("Some vague question?", real_specs)
+        implicit_scores(fake)
+        result = identify_actor("Some vague question?", real_specs)
         assert result.flow_type == FlowType.DEBATE
         assert result.actors[0].role == AdvisorRole.SUPPORT
         assert result.actors[1].role == AdvisorRole.SUPPORT
+
+
+# ---------------------------------------------------------------------------
+# Implicit scoring (fake embedding model — no sentence_transformers needed)
+# ---------------------------------------------------------------------------
+
+class _FakeMatrix:
+    """Stands in for the (N, D) domain tensor: matmul yields preset scores."""
+    def __init__(self, scores):
+        self.scores = scores
+
+    def __matmul__(self, _query_vec):
+        return types.SimpleNamespace(tolist=lambda: list(self.scores))
+
+    def __getitem__(self, index):
+        # [:-1] keeps the domain rows; [-1] is the batched query vector
+        return self if isinstance(index, slice) else object()
+
+
+class _FakeModel:
+    def __init__(self, scores):
+        self.scores = scores
+        self.batch_encodes = 0
+
+    def encode(self, sentences, **kwargs):
+        if isinstance(sentences, list):
+            self.batch_encodes += 1
+            return _FakeMatrix(self.scores)
+        return object()
+
+
+class TestImplicitScoring:
+
+    @pytest.fixture
+    def fake_model(self, real_specs, monkeypatch):
+        keyed = [s for s in real_specs if s.spec_data.get("domain_keywords")]
+        scores = [0.9, 0.2, 0.5] + [0.0] * (len(keyed) - 3)
+        model = _FakeModel(scores)
+        stub = types.ModuleType("sentence_transformers")
+        stub.SentenceTransformer = object
+        monkeypatch.setitem(sys.modules, "sentence_transformers", stub)
+        monkeypatch.setattr(identify_actor_module, "_get_embedding_model", lambda: model)
+        monkeypatch.setattr(identify_actor_module, "_domain_cache", {})
+        return model, keyed
+
+    def test_scores_filtered_and_sorted(self, real_specs, fake_model):
+        _, keyed = fake_model
+        result = _implicit_match("anything", real_specs)
+        assert [(s.first_name, score) for s, score in result] == [
+            (keyed[0].first_name, 0.9), (keyed[2].first_name, 0.5),
+        ]
+
+    def test_domain_vectors_encoded_once(self, real_specs, fake_model):
+        model, _ = fake_model
+        _implicit_match("first query", real_specs)
+        _implicit_match("second query", real_specs)
+        assert model.batch_encodes == 1
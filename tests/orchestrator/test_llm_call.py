@@ -2,26 +2,67 @@
 tests/orchestrator/test_llm_call.py
 
 Unit tests for src/orchestrator/llm_call.py.
-All tests mock the requests.post call — no live LLM required.
+All tests stub requests.Session.post — no live LLM required.
 """
 
-from unittest.mock import MagicMock, patch
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
 
 import pytest
 import requests
 
-from src.orchestrator.prompt_assemble import AssembledPrompt
-from src.orchestrator.llm_call import LLM_CONFIGS, LLMResult, _FALLBACK_RESPONSE, llm_call
+from src.orchestrator.llm_call import LLM_CONFIGS, LLMResult, _FALLBACK_RESPONSE, _get_session, llm_call
 
-DUMMY_PROMPT = AssembledPrompt(system="System block.", user="User block.")
+# dummy_prompt: session-scoped AssembledPrompt, from conftest.py
 
 
-def _mock_response(content: str, status: int = 200) -> MagicMock:
-    mock = MagicMock()
-    mock.status_code = status
-    mock.json.return_value = {"choices": [{"message": {"content": content}}]}
-    mock.raise_for_status = MagicMock()
-    return mock
+@dataclass(slots=True)
+class FakeResponse:
+    """Just enough of requests.Response for llm_call (status is never raised)."""
+    content: str
+    status_code: int = 200
+    lines: tuple[bytes, ...] = ()
+    closed: bool = False
+
+    def json(self) -> dict:
+        return {"choices": [{"message": {"content": self.content}}]}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_lines(self):
+        return iter(self.lines)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    """
+    Stub requests.Session.post. Queue replies (FakeResponse or exception) in
+    .replies — the last one repeats — and read each call's kwargs from .calls.
+    """
+    stub = SimpleNamespace(replies=[], calls=[])
+
+    def _post(session, url, **kwargs):
+        stub.calls.append(kwargs)
+        reply = stub.replies.pop(0) if len(stub.replies) > 1 else stub.replies[0]
+        if isinstance(reply, (BaseException, type)):   # exception instance or class
+            raise reply
+        return reply
+
+    monkeypatch.setattr(requests.Session, "post", _post)
+    return stub
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry pauses instead of sleeping."""
+    calls = []
+    monkeypatch.setattr(time, "sleep", calls.append)
+    return calls
 
 
 # ---------------------------------------------------------------------------
@@ -47,35 +88,21 @@ class TestLLMConfigs:
 
 class TestSuccessfulCall:
 
-    def test_standard_flow(self):
-        with patch("requests.post", return_value=_mock_response("Wale: Na so e be.")) as mock_post:
-            result = llm_call(DUMMY_PROMPT, "standard", backend_url="http://localhost:5001")
+    @pytest.mark.parametrize("flow_type,max_tokens,temperature,content", [
+        ("standard",         150, 0.7, "Wale: Na so e be."),
+        ("debate_turn",      150, 0.8, "Lin: We have leverage."),
+        ("debate_interrupt",  75, 0.5, "Lin: Decide."),
+        ("spectator",         50, 0.5, "[Wale looks at the ceiling.]"),
+    ])
+    def test_flow_config(self, dummy_prompt, fake_post, flow_type, max_tokens, temperature, content):
+        fake_post.replies.append(FakeResponse(content))
+        result = llm_call(dummy_prompt, flow_type, backend_url="http://localhost:5001")
         assert result.success is True
-        assert result.raw == "Wale: Na so e be."
-        payload = mock_post.call_args.kwargs["json"]
-        assert payload["max_tokens"] == 150
-        assert payload["temperature"] == 0.7
-
-    def test_debate_turn_config(self):
-        with patch("requests.post", return_value=_mock_response("Lin: We have leverage.")) as mock_post:
-            result = llm_call(DUMMY_PROMPT, "debate_turn", backend_url="http://localhost:5001")
-        payload = mock_post.call_args.kwargs["json"]
-        assert payload["max_tokens"] == 150
-        assert payload["temperature"] == 0.8
-
-    def test_debate_interrupt_config(self):
-        with patch("requests.post", return_value=_mock_response("Lin: Decide.")) as mock_post:
-            result = llm_call(DUMMY_PROMPT, "debate_interrupt", backend_url="http://localhost:5001")
-        payload = mock_post.call_args.kwargs["json"]
-        assert payload["max_tokens"] == 75
-        assert payload["temperature"] == 0.5
-
-    def test_spectator_config(self):
-        with patch("requests.post", return_value=_mock_response("[Wale looks at the ceiling.]")) as mock_post:
-            result = llm_call(DUMMY_PROMPT, "spectator", backend_url="http://localhost:5001")
-        payload = mock_post.call_args.kwargs["json"]
-        assert payload["max_tokens"] == 50
-        assert payload["temperature"] == 0.5
+        assert result.raw == content
+        payload = fake_post.calls[-1]["json"]
+        assert payload["max_tokens"] == max_tokens
+        assert payload["temperature"] == temperature
+        assert payload["cache_prompt"] is True
 
 
 # ---------------------------------------------------------------------------
@@ -84,28 +111,116 @@ class TestSuccessfulCall:
 
 class TestFailureModes:
 
-    def test_timeout_returns_fallback(self):
-        with patch("requests.post", side_effect=requests.exceptions.Timeout):
-            result = llm_call(DUMMY_PROMPT, "standard", backend_url="http://localhost:5001")
+    def test_timeout_returns_fallback(self, dummy_prompt, fake_post):
+        fake_post.replies.append(requests.exceptions.Timeout)
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
         assert result.success is False
         assert result.raw == _FALLBACK_RESPONSE
         assert result.error == "timeout"
 
-    def test_request_exception_returns_fallback(self):
-        with patch("requests.post", side_effect=requests.exceptions.ConnectionError("refused")):
-            result = llm_call(DUMMY_PROMPT, "standard", backend_url="http://localhost:5001")
+    def test_request_exception_returns_fallback(self, dummy_prompt, fake_post, sleeps):
+        fake_post.replies.append(requests.exceptions.ConnectionError("refused"))
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
         assert result.success is False
         assert result.raw == _FALLBACK_RESPONSE
 
-    def test_empty_response_returns_fallback(self):
-        with patch("requests.post", return_value=_mock_response("")):
-            result = llm_call(DUMMY_PROMPT, "standard", backend_url="http://localhost:5001")
+    def test_empty_response_returns_fallback(self, dummy_prompt, fake_post):
+        fake_post.replies.append(FakeResponse(""))
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
         assert result.success is False
         assert result.raw == _FALLBACK_RESPONSE
         assert result.error == "empty response"
 
-    def test_unknown_flow_type_falls_back_to_standard_config(self):
-        with patch("requests.post", return_value=_mock_response("response")) as mock_post:
-            result = llm_call(DUMMY_PROMPT, "nonexistent_flow", backend_url="http://localhost:5001")
-        payload = mock_post.call_args.kwargs["json"]
+    def test_unknown_flow_type_falls_back_to_standard_config(self, dummy_prompt, fake_post):
+        fake_post.replies.append(FakeResponse("response"))
+        llm_call(dummy_prompt, "nonexistent_flow", backend_url="http://localhost:5001")
+        payload = fake_post.calls[-1]["json"]
         assert payload["max_tokens"] == LLM_CONFIGS["standard"]["max_tokens"]
+
+
+# ---------------------------------------------------------------------------
+# Connection reuse
+# ---------------------------------------------------------------------------
+
+class TestSession:
+
+    def test_session_shared_across_calls(self):
+        assert _get_session() is _get_session()
+
+    def test_session_keep_alive(self):
+        assert _get_session().headers["Connection"] == "keep-alive"
+
+
+# ---------------------------------------------------------------------------
+# Timeouts and retry
+# ---------------------------------------------------------------------------
+
+class TestRetry:
+
+    def test_split_connect_read_timeout(self, dummy_prompt, fake_post):
+        fake_post.replies.append(FakeResponse("ok"))
+        llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
+        assert fake_post.calls[-1]["timeout"] == (3.05, 120)
+
+    def test_connection_error_retried_once(self, dummy_prompt, fake_post, sleeps):
+        fake_post.replies += [requests.exceptions.ConnectionError("reset"), FakeResponse("ok")]
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
+        assert result.success is True
+        assert len(fake_post.calls) == 2
+        assert len(sleeps) == 1
+
+    def test_gateway_status_retried_once(self, dummy_prompt, fake_post, sleeps):
+        gateway_error = FakeResponse("", 503)
+        fake_post.replies += [gateway_error, FakeResponse("ok")]
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
+        assert result.raw == "ok"
+        assert len(fake_post.calls) == 2
+        assert gateway_error.closed is True
+
+    def test_second_failure_not_retried(self, dummy_prompt, fake_post, sleeps):
+        fake_post.replies.append(requests.exceptions.ConnectionError("down"))
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
+        assert result.success is False
+        assert len(fake_post.calls) == 2
+
+    def test_client_error_not_retried(self, dummy_prompt, fake_post):
+        fake_post.replies.append(FakeResponse("ok", 400))
+        llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001")
+        assert len(fake_post.calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+class TestStreaming:
+
+    def test_deltas_forwarded_and_joined(self, dummy_prompt, fake_post):
+        fake_post.replies.append(FakeResponse("", lines=(
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b"",
+            b'data: {"choices": [{"delta": {"content": "[CHAT] Na so"}}]}',
+            b'data: {"choices": [{"delta": {"content": " e be."}}]}',
+            b"data: [DONE]",
+        )))
+        seen = []
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001", on_delta=seen.append)
+        assert result.raw == "[CHAT] Na so e be."
+        assert seen == ["[CHAT] Na so", " e be."]
+        assert fake_post.calls[-1]["json"]["stream"] is True
+        assert fake_post.calls[-1]["stream"] is True
+
+    def test_bad_chunk_skipped(self, dummy_prompt, fake_post):
+        fake_post.replies.append(FakeResponse("", lines=(
+            b": keep-alive",
+            b'data: {"choices": [{"delta": {"content": "[CHAT] Na so"}}]}',
+            b"data: {not json",
+            b"data:",
+            b'data:{"choices": [{"delta": {"content": " e be."}}]}',
+            b"data: [DONE]",
+        )))
+        seen = []
+        result = llm_call(dummy_prompt, "standard", backend_url="http://localhost:5001", on_delta=seen.append)
+        assert result.success is True
+        assert result.raw == "[CHAT] Na so e be."
+        assert seen == ["[CHAT] Na so", " e be."]
@@ -0,0 +1,78 @@
+"""
+tests/orchestrator/test_orchestrator.py
+
+Unit tests for session-state helpers in src/orchestrator/orchestrator.py.
+"""
+
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from src.orchestrator import commit_log as commit_log_module
+from src.orchestrator.commit_log import CommitLogError
+from src.orchestrator import orchestrator as orchestrator_module
+from src.orchestrator.llm_call import LLMResult
+from src.orchestrator.orchestrator import _HISTORY_TOKEN_BUDGET, _append_history, _ask, turn
+from src.orchestrator.prompt_assemble import HistoryTurn
+
+
+def _state(maxlen: int = 20) -> SimpleNamespace:
+    return SimpleNamespace(history=deque(maxlen=maxlen), history_tokens=0)
+
+
+def _turn(chars: int) -> HistoryTurn:
+    return HistoryTurn(role="user", speaker="User", content="x" * chars)
+
+
+class TestHistoryWindow:
+
+    def test_running_total_tracks_turn_cap(self):
+        state = _state(maxlen=3)
+        for _ in range(5):
+            _append_history(state, _turn(40))
+        assert len(state.history) == 3
+        assert state.history_tokens == sum(t.tokens for t in state.history)
+
+    def test_oldest_dropped_past_token_budget(self):
+        state = _state()
+        big = _HISTORY_TOKEN_BUDGET * 8 // 3   # ~4 chars/token: ~2/3 of the budget per turn
+        _append_history(state, _turn(big))
+        _append_history(state, _turn(big))
+        assert len(state.history) == 1
+        assert state.history_tokens <= _HISTORY_TOKEN_BUDGET
+
+    def test_latest_turn_always_kept(self):
+        state = _state()
+        _append_history(state, _turn(_HISTORY_TOKEN_BUDGET * 8))
+        assert len(state.history) == 1
+
+
+class TestTurn:
+
+    def test_background_write_failure_raised_on_next_turn(self, monkeypatch):
+        monkeypatch.setattr(commit_log_module, "_writer_errors", [OSError("disk full")])
+        with pytest.raises(CommitLogError, match="disk full"):
+            turn("Wale, status?", SimpleNamespace())
+
+
+class TestStreamedReply:
+
+    @staticmethod
+    def _fake_llm(prompt, flow_type, on_delta=None):
+        for delta in ("[THOUGHT] hm\n", "[CHAT] Na so", " e be."):
+            if on_delta:
+                on_delta(delta)
+        return LLMResult(raw="[THOUGHT] hm\n[CHAT] Na so e be.", flow_type=flow_type, success=True)
+
+    def test_earlier_lines_then_chat_echoed(self, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "llm_call", self._fake_llm)
+        out, lines = [], ["[Positions are clear. A decision is needed.]"]
+        parsed, rest = _ask(None, "debate_turn", "Wale Oluwaseun", lines, out.append)
+        assert "".join(out) == "[Positions are clear. A decision is needed.]\n\nWALE OLUWASEUN: Na so e be."
+        assert (parsed.chat, rest, lines) == ("Na so e be.", "", [])
+
+    def test_without_echo_returns_full_display(self, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "llm_call", self._fake_llm)
+        _, text = _ask(None, "standard", "Wale Oluwaseun", [], None)
+        assert text == "WALE OLUWASEUN: Na so e be."
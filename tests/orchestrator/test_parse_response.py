@@ -6,79 +6,92 @@ Unit tests for src/orchestrator/parse_response.py.
 
 import pytest
 from src.orchestrator.llm_call import LLMResult, _FALLBACK_RESPONSE
-from src.orchestrator.parse_response import parse_response
+from src.orchestrator.parse_response import ParsedResponse, parse_response
 
 
-def _result(raw: str) -> LLMResult:
-    return LLMResult(raw=raw, flow_type="standard", success=True)
+FALLBACK = _FALLBACK_RESPONSE
 
+# Canonical raw LLM outputs, shared by the block table and the spot checks below
+_RAW_ALL          = "[THOUGHT] domain check\n[ACTION] FETCH nations WHERE region='asia'\n[CHAT] Lin: We have leverage."
+_RAW_LOWER        = "[thought] ok\n[chat] Wale: Na so e be."
+_RAW_REPEATED     = "[CHAT] draft\n[THOUGHT] rethink\n[CHAT] Lin: Final answer."
+_RAW_NO_CHAT      = "[THOUGHT] ok\n[ACTION] FETCH something"
+_RAW_NO_THOUGHT   = "[ACTION] FETCH x\n[CHAT] Lin: noted."
+_RAW_NO_ACTION    = "[THOUGHT] ok\n[CHAT] Jonny: boost budget won't support that."
+_RAW_UNTAGGED     = "Wale just said something without any tags."
+_RAW_FAST_PATH    = "[THOUGHT] ok\n[ACTION] FETCH x\n[CHAT] Lin: noted."
+_RAW_MIXED_CASE   = "[chat] draft\n[THOUGHT] ok\n[CHAT] Lin: noted."
+_RAW_ILLEGAL      = "[THOUGHT] ok\n[ACTION] DO SOMETHING ILLEGAL\n[CHAT] Lin: noted."
+_RAW_VALID_FETCH  = "[THOUGHT] ok\n[ACTION] FETCH dialogue WHERE topic='orbital'\n[CHAT] Jonny: here."
+_RAW_VALID_UPDATE = "[THOUGHT] ok\n[ACTION] UPDATE priorities SET focus='military'\n[CHAT] Katya: done."
 
-# ---------------------------------------------------------------------------
-# Well-formed output
-# ---------------------------------------------------------------------------
-
-class TestWellFormed:
-
-    def test_all_blocks_extracted(self):
-        raw = "[THOUGHT] domain check\n[ACTION] FETCH nations WHERE region='asia'\n[CHAT] Lin: We have leverage."
-        parsed = parse_response(_result(raw))
-        assert parsed.thought == "domain check"
-        assert parsed.action == "FETCH nations WHERE region='asia'"
-        assert parsed.chat == "Lin: We have leverage."
-        assert parsed.action_valid is True
-        assert parsed.fallback_used is False
 
-    def test_case_insensitive_block_tags(self):
-        raw = "[thought] ok\n[chat] Wale: Na so e be."
-        parsed = parse_response(_result(raw))
-        assert parsed.thought == "ok"
-        assert parsed.chat == "Wale: Na so e be."
+@pytest.fixture
+def parsed():
+    """raw LLM text -> ParsedResponse, through a successful standard-flow LLMResult."""
+    return lambda raw: parse_response(LLMResult(raw=raw, flow_type="standard", success=True))
 
 
 # ---------------------------------------------------------------------------
-# Missing blocks
+# Block extraction: well-formed, missing blocks, no blocks
 # ---------------------------------------------------------------------------
 
-class TestMissingBlocks:
-
-    def test_missing_chat_uses_fallback(self):
-        raw = "[THOUGHT] ok\n[ACTION] FETCH something"
-        parsed = parse_response(_result(raw))
-        assert parsed.chat == _FALLBACK_RESPONSE
-        assert parsed.fallback_used is True
-
-    def test_missing_thought_continues(self):
-        raw = "[ACTION] FETCH x\n[CHAT] Lin: noted."
-        parsed = parse_response(_result(raw))
-        assert parsed.thought is None
+class TestBlocks:
+
+    @pytest.mark.parametrize("raw,thought,action,chat,action_valid,fallback_used", [
+        pytest.param(
+            _RAW_ALL,
+            "domain check", "FETCH nations WHERE region='asia'", "Lin: We have leverage.", True, False,
+            id="all_blocks_extracted"),
+        pytest.param(
+            _RAW_LOWER,
+            "ok", None, "Wale: Na so e be.", False, False,
+            id="case_insensitive_block_tags"),
+        pytest.param(
+            _RAW_REPEATED,
+            "rethink", None, "Lin: Final answer.", False, False,
+            id="repeated_tag_keeps_last_block"),
+        pytest.param(
+            _RAW_NO_CHAT,
+            "ok", "FETCH something", FALLBACK, True, True,
+            id="missing_chat_uses_fallback"),
+        pytest.param(
+            _RAW_NO_THOUGHT,
+            None, "FETCH x", "Lin: noted.", True, False,
+            id="missing_thought_continues"),
+        pytest.param(
+            _RAW_NO_ACTION,
+            "ok", None, "Jonny: boost budget won't support that.", False, False,
+            id="missing_action_continues"),
+        pytest.param(
+            _RAW_UNTAGGED,
+            None, None, _RAW_UNTAGGED, False, False,
+            id="no_blocks_treated_as_chat"),
+        pytest.param(
+            "",
+            None, None, FALLBACK, False, True,
+            id="empty_output_uses_fallback"),
+    ])
+    def test_parse(self, parsed, raw, thought, action, chat, action_valid, fallback_used):
+        result = parsed(raw)
+        assert (result.thought, result.action, result.chat, result.action_valid, result.fallback_used) == \
+               (thought, action, chat, action_valid, fallback_used)
+
+    @pytest.mark.parametrize("raw", [
+        _RAW_FAST_PATH,     # str.find fast path
+        _RAW_MIXED_CASE,    # _TAG_PATTERN fallback
+    ])
+    def test_no_regex_compiled_per_call(self, parsed, raw, monkeypatch):
+        import re
+        def _no_compile(*args, **kwargs):
+            raise AssertionError("regex compiled during parse_response")
+        monkeypatch.setattr(re, "compile", _no_compile)
+        monkeypatch.setattr(re, "_compile", _no_compile)
+        assert parsed(raw).chat == "Lin: noted."
+
+    def test_chat_stripped_at_construction(self):
+        parsed = ParsedResponse(None, None, "  \nLin: noted.\n ", False, False)
         assert parsed.chat == "Lin: noted."
-        assert parsed.fallback_used is False
-
-    def test_missing_action_continues(self):
-        raw = "[THOUGHT] ok\n[CHAT] Jonny: boost budget won't support that."
-        parsed = parse_response(_result(raw))
-        assert parsed.action is None
-        assert parsed.chat == "Jonny: boost budget won't support that."
-
-
-# ---------------------------------------------------------------------------
-# No block tags
-# ---------------------------------------------------------------------------
-
-class TestNoBlocks:
-
-    def test_no_blocks_treated_as_chat(self):
-        raw = "Wale just said something without any tags."
-        parsed = parse_response(_result(raw))
-        assert parsed.chat == raw
-        assert parsed.thought is None
-        assert parsed.action is None
-        assert parsed.fallback_used is False
-
-    def test_empty_output_uses_fallback(self):
-        parsed = parse_response(_result(""))
-        assert parsed.chat == _FALLBACK_RESPONSE
-        assert parsed.fallback_used is True
 
 
 # ---------------------------------------------------------------------------
@@ -87,19 +100,14 @@ class TestNoBlocks:
 
 class TestMalformedAction:
 
-    def test_malformed_action_rejected(self):
-        raw = "[THOUGHT] ok\n[ACTION] DO SOMETHING ILLEGAL\n[CHAT] Lin: noted."
-        parsed = parse_response(_result(raw))
-        assert parsed.action is None
-        assert parsed.action_valid is False
-        assert parsed.chat == "Lin: noted."
+    def test_malformed_action_rejected(self, parsed):
+        result = parsed(_RAW_ILLEGAL)
+        assert result.action is None
+        assert result.action_valid is False
+        assert result.chat == "Lin: noted."
 
-    def test_valid_fetch_action_accepted(self):
-        raw = "[THOUGHT] ok\n[ACTION] FETCH dialogue WHERE topic='orbital'\n[CHAT] Jonny: here."
-        parsed = parse_response(_result(raw))
-        assert parsed.action_valid is True
+    def test_valid_fetch_action_accepted(self, parsed):
+        assert parsed(_RAW_VALID_FETCH).action_valid is True
 
-    def test_valid_update_action_accepted(self):
-        raw = "[THOUGHT] ok\n[ACTION] UPDATE priorities SET focus='military'\n[CHAT] Katya: done."
-        parsed = parse_response(_result(raw))
-        assert parsed.action_valid is True
+    def test_valid_update_action_accepted(self, parsed):
+        assert parsed(_RAW_VALID_UPDATE).action_valid is True
@@ -5,40 +5,69 @@ Unit tests for src/orchestrator/prompt_assemble.py.
 Uses real system.txt and actor specs. Mocks gamestate files where needed.
 """
 
+import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import pytest
 
-from src.orchestrator.identify_actor import load_actor_specs
 from src.orchestrator.tier_check import TierConfidence
 from src.orchestrator.fragment_fetch import fragment_fetch
 from src.orchestrator.prompt_assemble import (
     prompt_assemble,
-    load_system_prompt,
     HistoryTurn,
     AssembledPrompt,
 )
 
-ACTORS_DIR    = Path("resources/actors")
+# Reads real actor specs and resources/prompts/system.txt
+pytestmark = pytest.mark.slow
+
 SYSTEM_PATH   = Path("resources/prompts/system.txt")
 CAMPAIGNS_DIR = Path("campaigns/resist/2027-08-01")
 CODEX_SPEC    = Path("resources/actors/codex/spec.toml")
 
+# Canned history — prompt_assemble only reads it, so one immutable copy serves every test
+_HISTORY_SINGLE = (
+    HistoryTurn(role="user", speaker="User", content="First question"),
+    HistoryTurn(role="advisor", speaker="Wale Oluwaseun", content="First answer"),
+)
+_HISTORY_DEBATE = (
+    HistoryTurn(role="advisor", speaker="Wale Oluwaseun", content="My position."),
+    HistoryTurn(role="advisor", speaker="Jonathan Pratt", content="My position."),
+)
+
+
+@pytest.fixture
+def assemble(codex_data):
+    """prompt_assemble() over the real system.txt and the session-loaded CODEX spec."""
+    def _assemble(fetches, query, campaign_dir=CAMPAIGNS_DIR, **kwargs):
+        return prompt_assemble(
+            fetches, query, SYSTEM_PATH, campaign_dir, CODEX_SPEC,
+            codex_data=codex_data, **kwargs,
+        )
+    return _assemble
 
-@pytest.fixture(scope="module")
-def specs():
-    return load_actor_specs(ACTORS_DIR)
 
+@pytest.fixture
+def fetch(specs_by_name):
+    """fragment_fetch() by actor name — a fresh FetchResult per call, never shared between tests."""
+    def _fetch(name: str, query: str = "anything", confidence: TierConfidence = TierConfidence.FULL):
+        return fragment_fetch(specs_by_name[name.lower()], query, confidence)
+    return _fetch
 
-def _spec(specs, name: str):
-    for s in specs:
-        if s.first_name.lower() == name.lower() or s.nickname.lower() == name.lower():
-            return s
-    raise ValueError(f"Actor '{name}' not found")
 
+@pytest.fixture(scope="session")
+def fat_gamestate_dir(tmp_path_factory):
+    """Campaign dir whose gamestate file exceeds the 40-line CODEX budget (read-only, shared)."""
+    gen_dir = tmp_path_factory.mktemp("fat_gs") / "campaigns"
+    gen_dir.mkdir()
+    (gen_dir / "gamestate_earth.txt").write_text("\n".join([f"Line {i}: data" for i in range(60)]))
+    return gen_dir
 
-def _fetch(specs, name: str, query: str = "anything", confidence: TierConfidence = TierConfidence.FULL):
-    return fragment_fetch(_spec(specs, name), query, confidence)
+
+@pytest.fixture(scope="session")
+def empty_campaign_dir(tmp_path_factory):
+    """Campaign dir with no gamestate files (read-only, shared)."""
+    return tmp_path_factory.mktemp("empty")
 
 
 # ---------------------------------------------------------------------------
@@ -47,31 +76,19 @@ def _fetch(specs, name: str, query: str = "anything", confidence: TierConfidence
 
 class TestSystemBlock:
 
-    def test_tier_substituted(self, specs):
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "test query",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC, tier=2
-        )
+    def test_tier_substituted(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "test query", tier=2)
         assert "{tier}" not in result.system
         assert "2" in result.system
 
-    def test_system_hash_warning_on_change(self, tmp_path):
-        # Reset module-level hash to ensure test isolation
-        import src.orchestrator.prompt_assemble as pa
-        pa._system_hash = None
-
-        sys_file = tmp_path / "system.txt"
-        sys_file.write_text("Version 1", encoding="utf-8")
-        load_system_prompt(sys_file)
-        sys_file.write_text("Version 2 - modified", encoding="utf-8")
-        import logging
-        with patch.object(logging, "warning") as mock_warn:
-            load_system_prompt(sys_file)
-            mock_warn.assert_called_once()
-            assert "KV cache" in mock_warn.call_args[0][0]
-
-        # Restore to None so subsequent tests are unaffected
-        pa._system_hash = None
+    def test_system_read_from_path(self, fetch, tmp_path, monkeypatch):
+        from src.orchestrator import prompt_assemble as prompt_assemble_module
+        monkeypatch.setattr(prompt_assemble_module, "_system_hash", None)
+        monkeypatch.setattr(prompt_assemble_module, "_system_cache", None)
+        system_path = tmp_path / "system.txt"
+        system_path.write_text("Rules for tier {tier}")
+        result = prompt_assemble([fetch("Wale")], "test query", system_path, CAMPAIGNS_DIR, CODEX_SPEC, tier=3)
+        assert result.system == "Rules for tier 3"
 
 
 # ---------------------------------------------------------------------------
@@ -80,16 +97,13 @@ class TestSystemBlock:
 
 class TestActorSection:
 
-    def test_actor_context_present(self, specs):
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "test",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC
-        )
+    def test_actor_context_present(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "test")
         assert "ADVISOR CONTEXT" in result.user
 
-    def test_two_actors_both_present(self, specs):
-        fetches = [_fetch(specs, "Wale"), _fetch(specs, "Jonny")]
-        result = prompt_assemble(fetches, "test", SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC)
+    def test_two_actors_both_present(self, assemble, fetch):
+        fetches = [fetch("Wale"), fetch("Jonny")]
+        result = assemble(fetches, "test")
         assert "Wale" in result.user
         assert "Jonathan" in result.user
 
@@ -100,35 +114,57 @@ class TestActorSection:
 
 class TestGameState:
 
-    def test_gamestate_under_budget_included(self, specs):
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "test",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC
-        )
+    def test_gamestate_under_budget_included(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "test")
         assert "GAME STATE" in result.user
 
-    def test_gamestate_over_budget_returns_stage_direction(self, specs, tmp_path):
-        # Write a gamestate file exceeding 40 lines
-        gen_dir = tmp_path / "campaigns"
-        gen_dir.mkdir()
-        fat_report = "\n".join([f"Line {i}: data" for i in range(60)])
-        (gen_dir / "gamestate_earth.txt").write_text(fat_report)
-
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "test",
-            SYSTEM_PATH, gen_dir, CODEX_SPEC
-        )
+    def test_gamestate_over_budget_returns_stage_direction(self, assemble, fetch, fat_gamestate_dir):
+        result = assemble([fetch("Wale")], "test", fat_gamestate_dir)
         assert "EXCEEDS LINE BUDGET" in result.user or "stage direction" in result.user.lower()
 
-    def test_no_gamestate_files_graceful(self, specs, tmp_path):
-        empty_dir = tmp_path / "empty"
-        empty_dir.mkdir()
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "test",
-            SYSTEM_PATH, empty_dir, CODEX_SPEC
-        )
+    def test_no_gamestate_files_graceful(self, assemble, fetch, empty_campaign_dir):
+        result = assemble([fetch("Wale")], "test", empty_campaign_dir)
         assert "CODEX is silent" in result.user
 
+    def test_db_report_built_once_per_db_state(self, tmp_path):
+        from src.orchestrator.prompt_assemble import _load_gamestate
+        db_path = tmp_path / "savegame_2027-08-01.db"
+        db_path.write_bytes(b"")
+        with patch("src.db.query.build_codex_report", return_value="A\nB") as mock_build:
+            assert _load_gamestate(tmp_path, "2027-08-01") == ("A\nB", 2)
+            assert _load_gamestate(tmp_path, "2027-08-01") == ("A\nB", 2)
+            assert mock_build.call_count == 1
+            db_path.write_bytes(b"re-parsed")
+            _load_gamestate(tmp_path, "2027-08-01")
+            assert mock_build.call_count == 2
+
+    @staticmethod
+    def _touch_dir(path):
+        # Successive edits can land within one mtime tick; move it on explicitly
+        mtime = path.stat().st_mtime_ns + 1_000_000
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_legacy_files_follow_dir_changes(self, tmp_path):
+        from src.orchestrator.prompt_assemble import _load_gamestate
+        (tmp_path / "gamestate_a.txt").write_text("A")
+        (tmp_path / "gamestate_empty.txt").write_text("")
+        assert _load_gamestate(tmp_path) == ("A", 1)
+        (tmp_path / "gamestate_b.txt").write_text("B")
+        self._touch_dir(tmp_path)
+        assert _load_gamestate(tmp_path) == ("A\n\nB", 3)
+        (tmp_path / "gamestate_a.txt").unlink()
+        self._touch_dir(tmp_path)
+        assert _load_gamestate(tmp_path) == ("B", 1)
+
+    def test_db_added_mid_session_replaces_legacy(self, tmp_path):
+        from src.orchestrator.prompt_assemble import _load_gamestate
+        (tmp_path / "gamestate_a.txt").write_text("A")
+        assert _load_gamestate(tmp_path, "2027-08-01") == ("A", 1)
+        (tmp_path / "savegame_2027-08-01.db").write_bytes(b"")
+        self._touch_dir(tmp_path)
+        with patch("src.db.query.build_codex_report", return_value="DB"):
+            assert _load_gamestate(tmp_path, "2027-08-01") == ("DB", 1)
+
 
 # ---------------------------------------------------------------------------
 # History
@@ -136,35 +172,18 @@ class TestGameState:
 
 class TestHistory:
 
-    def test_no_history_first_turn(self, specs):
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "test",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC, history=[]
-        )
+    def test_no_history_first_turn(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "test", history=[])
         assert "RECENT HISTORY" not in result.user
 
-    def test_history_present_when_provided(self, specs):
-        history = [
-            HistoryTurn(role="user", speaker="User", content="First question"),
-            HistoryTurn(role="advisor", speaker="Wale Oluwaseun", content="First answer"),
-        ]
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "second question",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC, history=history
-        )
+    def test_history_present_when_provided(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "second question", history=_HISTORY_SINGLE)
         assert "RECENT HISTORY" in result.user
         assert "First question" in result.user
 
-    def test_two_actor_debate_history_includes_both(self, specs):
-        history = [
-            HistoryTurn(role="advisor", speaker="Wale Oluwaseun", content="My position."),
-            HistoryTurn(role="advisor", speaker="Jonathan Pratt", content="My position."),
-        ]
-        fetches = [_fetch(specs, "Wale"), _fetch(specs, "Jonny")]
-        result = prompt_assemble(
-            fetches, "next question",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC, history=history
-        )
+    def test_two_actor_debate_history_includes_both(self, assemble, fetch):
+        fetches = [fetch("Wale"), fetch("Jonny")]
+        result = assemble(fetches, "next question", history=_HISTORY_DEBATE)
         assert "Wale Oluwaseun".upper() in result.user
         assert "Jonathan Pratt".upper() in result.user
 
@@ -175,16 +194,10 @@ class TestHistory:
 
 class TestQueryPosition:
 
-    def test_query_present(self, specs):
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "my specific query",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC
-        )
+    def test_query_present(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "my specific query")
         assert "my specific query" in result.user
 
-    def test_query_is_last_section(self, specs):
-        result = prompt_assemble(
-            [_fetch(specs, "Wale")], "my specific query",
-            SYSTEM_PATH, CAMPAIGNS_DIR, CODEX_SPEC
-        )
+    def test_query_is_last_section(self, assemble, fetch):
+        result = assemble([fetch("Wale")], "my specific query")
         assert result.user.endswith("my specific query")
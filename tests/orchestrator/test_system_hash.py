@@ -0,0 +1,58 @@
+"""
+tests/orchestrator/test_system_hash.py
+
+Unit tests for load_system_prompt() in src/orchestrator/prompt_assemble.py.
+These mutate the module-level system.txt hash, so they live apart from the
+prompt_assemble tests, which only ever pass preloaded system text.
+"""
+
+import logging
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import src.orchestrator.prompt_assemble as pa
+from src.orchestrator.prompt_assemble import load_system_prompt
+
+# Mutates module state. --dist loadscope already keeps a module on one worker;
+# the group does the same under --dist loadgroup.
+pytestmark = pytest.mark.xdist_group("system_hash")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_system_hash(monkeypatch):
+    """Each test starts with no remembered system.txt hash; the original is restored after."""
+    monkeypatch.setattr(pa, "_system_hash", None)
+
+
+class TestLoadSystemPrompt:
+
+    def test_system_hash_warning_on_change(self, tmp_path):
+        sys_file = tmp_path / "system.txt"
+        sys_file.write_text("Version 1", encoding="utf-8")
+        load_system_prompt(sys_file)
+        sys_file.write_text("Version 2 - modified", encoding="utf-8")
+        with patch.object(logging, "warning") as mock_warn:
+            load_system_prompt(sys_file)
+            mock_warn.assert_called_once()
+            assert "KV cache" in mock_warn.call_args[0][0]
+
+    def test_unchanged_file_not_reread(self, tmp_path):
+        sys_file = tmp_path / "system.txt"
+        sys_file.write_text("Stable rules", encoding="utf-8")
+        assert load_system_prompt(sys_file) == "Stable rules"
+        with patch.object(Path, "read_text") as mock_read:
+            assert load_system_prompt(sys_file) == "Stable rules"
+            mock_read.assert_not_called()
+
+    def test_touch_without_content_change_no_warning(self, tmp_path):
+        sys_file = tmp_path / "system.txt"
+        sys_file.write_text("Same", encoding="utf-8")
+        load_system_prompt(sys_file)
+        stat = sys_file.stat()
+        os.utime(sys_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        with patch.object(logging, "warning") as mock_warn:
+            assert load_system_prompt(sys_file) == "Same"
+            mock_warn.assert_not_called()
@@ -2,7 +2,7 @@
 tests/orchestrator/test_validate_action.py
 
 Unit tests for src/orchestrator/validate_action.py.
-Uses tmp_path for decision_log.json isolation.
+Uses tmp_path for decision_log.jsonl isolation.
 """
 
 import json
@@ -10,93 +10,122 @@ from pathlib import Path
 
 import pytest
 
-from src.orchestrator.validate_action import validate_action
+from src.orchestrator.validate_action import flush_decision_log, validate_action
 
 
-# ---------------------------------------------------------------------------
-# FETCH
-# ---------------------------------------------------------------------------
-
-class TestFetch:
-
-    def test_fetch_executes_without_log_check(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        result = validate_action("FETCH nations WHERE region='asia'", log_path)
-        assert result.executed is True
-        assert result.ruling == "fetch"
-        # FETCH never writes to decision_log
-        assert not log_path.exists()
+@pytest.fixture
+def log_path(tmp_path) -> Path:
+    return tmp_path / "decision_log.jsonl"
 
 
 # ---------------------------------------------------------------------------
-# UPDATE — no prior ruling
+# Rulings: FETCH, UPDATE with and without a prior ruling, bad verbs
 # ---------------------------------------------------------------------------
 
-class TestUpdateNoPrior:
+class TestRulings:
+
+    @pytest.mark.parametrize("prior,action,executed,ruling", [
+        pytest.param(None, "FETCH nations WHERE region='asia'", True, "fetch", id="fetch"),
+        pytest.param(None, "UPDATE priorities SET focus='military'", True, "allowed", id="update_no_prior"),
+        pytest.param("allowed", "UPDATE priorities SET focus='military'", True, "allowed", id="prior_allowed"),
+        pytest.param("denied", "UPDATE something forbidden", False, "denied", id="prior_denied"),
+        pytest.param(None, "DELETE everything", False, "denied", id="unknown_verb"),
+        pytest.param(None, "", False, "denied", id="malformed_action"),
+    ])
+    def test_ruling(self, log_path, prior, action, executed, ruling):
+        if prior:
+            log_path.write_text(json.dumps({action.strip().lower(): prior}))
+        result = validate_action(action, log_path)
+        assert (result.executed, result.ruling) == (executed, ruling)
+        if not executed:
+            assert result.rationale is not None
 
-    def test_update_executes_and_logs(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        result = validate_action("UPDATE priorities SET focus='military'", log_path)
-        assert result.executed is True
-        assert result.ruling == "allowed"
-        assert log_path.exists()
+    def test_fetch_never_logged(self, log_path):
+        validate_action("FETCH nations WHERE region='asia'", log_path)
+        flush_decision_log()
+        assert not log_path.exists()
 
-    def test_update_writes_allowed_to_log(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        action = "UPDATE priorities SET focus='military'"
-        validate_action(action, log_path)
-        log = json.loads(log_path.read_text())
-        assert any("allowed" == v for v in log.values())
+    def test_update_writes_allowed_to_log(self, log_path):
+        validate_action("UPDATE priorities SET focus='military'", log_path)
+        flush_decision_log()
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert any(r["ruling"] == "allowed" for r in records)
 
 
 # ---------------------------------------------------------------------------
-# UPDATE — prior ruling allowed
+# Session cache / write-back
 # ---------------------------------------------------------------------------
 
-class TestUpdatePriorAllowed:
+class TestWriteBack:
 
-    def test_prior_allowed_executes(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        action = "UPDATE priorities SET focus='military'"
-        # First call logs it
+    def test_update_deferred_until_flush(self, log_path):
+        validate_action("UPDATE priorities SET focus='economy'", log_path)
+        assert not log_path.exists()
+        flush_decision_log()
+        assert json.loads(log_path.read_text()) == {
+            "key": "update priorities set focus='economy'", "ruling": "allowed",
+        }
+
+    def test_new_decisions_appended(self, log_path):
+        validate_action("UPDATE a SET x=1", log_path)
+        flush_decision_log()
+        first = log_path.read_text()
+        validate_action("UPDATE b SET y=2", log_path)
+        flush_decision_log()
+        text = log_path.read_text()
+        assert text.startswith(first)
+        assert len(text.splitlines()) == 2
+
+    def test_legacy_json_log_rewritten_as_jsonl(self, log_path):
+        log_path.write_text(json.dumps({"update old": "denied"}, indent=2))
+        validate_action("UPDATE new SET z=3", log_path)
+        flush_decision_log()
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert {r["key"]: r["ruling"] for r in records} == {
+            "update old": "denied", "update new set z=3": "allowed",
+        }
+
+    def test_legacy_json_name_carried_over(self, log_path):
+        legacy_path = log_path.with_suffix(".json")
+        legacy_path.write_text(json.dumps({"update old": "denied"}, indent=2))
+        assert validate_action("UPDATE old", log_path).ruling == "denied"
+        validate_action("UPDATE new SET z=3", log_path)
+        flush_decision_log()
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert {r["key"]: r["ruling"] for r in records} == {
+            "update old": "denied", "update new set z=3": "allowed",
+        }
+        assert json.loads(legacy_path.read_text()) == {"update old": "denied"}
+
+    def test_external_rewrite_picked_up(self, log_path):
+        action = "UPDATE budget SET boost=1"
         validate_action(action, log_path)
-        # Second call uses prior
+        flush_decision_log()
+        # Another process denies it in the meantime
+        log_path.write_text(json.dumps({action.lower(): "denied", "padding": "x"}))
         result = validate_action(action, log_path)
-        assert result.executed is True
-        assert result.ruling == "allowed"
-
-
-# ---------------------------------------------------------------------------
-# UPDATE — prior ruling denied
-# ---------------------------------------------------------------------------
-
-class TestUpdatePriorDenied:
-
-    def test_prior_denied_rejects(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        action = "UPDATE something forbidden"
-        key = action.strip().lower()
-        # Pre-seed log with denied ruling
-        log_path.write_text(json.dumps({key: "denied"}))
-        result = validate_action(action, log_path)
-        assert result.executed is False
-        assert result.ruling == "denied"
-        assert result.rationale is not None
-
-
-# ---------------------------------------------------------------------------
-# Unknown verb
-# ---------------------------------------------------------------------------
-
-class TestUnknownVerb:
-
-    def test_unknown_verb_rejected(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        result = validate_action("DELETE everything", log_path)
-        assert result.executed is False
         assert result.ruling == "denied"
 
-    def test_malformed_action_rejected(self, tmp_path):
-        log_path = tmp_path / "decision_log.json"
-        result = validate_action("", log_path)
-        assert result.executed is False
+    def test_edit_before_flush_merged(self, log_path):
+        validate_action("UPDATE a SET x=1", log_path)
+        flush_decision_log()
+        validate_action("UPDATE b SET y=2", log_path)
+        # User denies a by hand, as a JSONL record, before the pending decision is flushed
+        with log_path.open("a") as f:
+            f.write(json.dumps({"key": "update a set x=1", "ruling": "denied"}) + "\n")
+        assert validate_action("UPDATE a SET x=1", log_path).ruling == "denied"
+        flush_decision_log()
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert {r["key"]: r["ruling"] for r in records} == {
+            "update a set x=1": "denied", "update b set y=2": "allowed",
+        }
+
+    def test_legacy_rewrite_before_flush_not_appended_to(self, log_path):
+        validate_action("UPDATE b SET y=2", log_path)
+        # Rewritten as a legacy JSON object mid-session
+        log_path.write_text(json.dumps({"update old": "denied"}, indent=2))
+        flush_decision_log()
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert {r["key"]: r["ruling"] for r in records} == {
+            "update old": "denied", "update b set y=2": "allowed",
+        }
@@ -0,0 +1,113 @@
+"""
+Tests for preset shared helpers
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from src.preset.command import _load_gs, clear_gs_cache
+
+
+@pytest.fixture
+def savegame_db(tmp_path):
+    db_path = tmp_path / "savegame.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE gamestates (key TEXT PRIMARY KEY, data TEXT)")
+    conn.execute("INSERT INTO gamestates VALUES (?, ?)",
+                 ("TIFactionState", json.dumps([{"Key": {"value": 1}, "Value": {"displayName": "Resist"}}])))
+    conn.commit()
+    conn.close()
+    yield db_path
+    clear_gs_cache()
+
+
+class TestLoadGs:
+
+    def test_missing_key_is_empty(self, savegame_db):
+        assert _load_gs(savegame_db, "TINationState") == []
+
+    def test_shared_key_parsed_once(self, savegame_db):
+        first = _load_gs(savegame_db, "TIFactionState")
+        assert _load_gs(savegame_db, "TIFactionState") is first
+
+    def test_concurrent_callers_share_one_parse(self, savegame_db):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: _load_gs(savegame_db, "TIFactionState"), range(8)))
+        assert all(r is results[0] for r in results)
+
+    def test_many_fills_cache_in_one_query(self, savegame_db):
+        from src.preset.command import _load_gs_many
+
+        got = _load_gs_many(savegame_db, ["TIFactionState", "TINationState"])
+        assert got["TINationState"] == []
+        assert _load_gs(savegame_db, "TIFactionState") is got["TIFactionState"]
+
+    def test_clear_rereads(self, savegame_db):
+        first = _load_gs(savegame_db, "TIFactionState")
+        clear_gs_cache()
+        second = _load_gs(savegame_db, "TIFactionState")
+        assert second == first
+        assert second is not first
+
+
+class TestFactionNameMap:
+
+    KEY = "PavonisInteractive.TerraInvicta.TIFactionState"
+
+    def test_server_side_matches_parsed(self, savegame_db):
+        from src.preset.command import _faction_name_map
+
+        factions = [
+            {"Key": {"value": 1}, "Value": {"displayName": "Resist"}},
+            {"Key": {"value": 2}, "Value": {}},
+        ]
+        conn = sqlite3.connect(savegame_db)
+        conn.execute("INSERT INTO gamestates VALUES (?, ?)", (self.KEY, json.dumps(factions)))
+        conn.commit()
+        conn.close()
+
+        server_side = _faction_name_map(savegame_db)
+        _load_gs(savegame_db, self.KEY)
+        assert server_side == _faction_name_map(savegame_db) == {1: "Resist", 2: "?"}
+
+
+class TestPresetIsCurrent:
+
+    def _tree(self, root, outputs_newer: bool):
+        import os
+        from src.preset.command import _OUTPUT_FILES
+
+        build = root / "build"
+        build.mkdir()
+        out = root / "campaigns" / "resist" / "2027-08-01"
+        out.mkdir(parents=True)
+        sources = [build / "savegame_2027-08-01.db", build / "game_templates.db"]
+        outputs = [out / name for name in _OUTPUT_FILES]
+        for p in sources + outputs:
+            p.write_text("")
+        older, newer = (sources, outputs) if outputs_newer else (outputs, sources)
+        for p in older:
+            os.utime(p, ns=(1_000_000_000, 1_000_000_000))
+        for p in newer:
+            os.utime(p, ns=(2_000_000_000, 2_000_000_000))
+        return out
+
+    def test_outputs_newer_is_current(self, tmp_path):
+        from src.preset.command import _preset_is_current
+        self._tree(tmp_path, outputs_newer=True)
+        assert _preset_is_current(tmp_path, "resist", "2027-08-01")
+
+    def test_savegame_newer_is_stale(self, tmp_path):
+        from src.preset.command import _preset_is_current
+        self._tree(tmp_path, outputs_newer=False)
+        assert not _preset_is_current(tmp_path, "resist", "2027-08-01")
+
+    def test_missing_output_is_stale(self, tmp_path):
+        from src.preset.command import _preset_is_current
+        out = self._tree(tmp_path, outputs_newer=True)
+        (out / "gamestate_intel.txt").unlink()
+        assert not _preset_is_current(tmp_path, "resist", "2027-08-01")
@@ -11,18 +11,25 @@ from pathlib import Path
 from src.preset.launch_windows import calculate_launch_windows
 from src.core.core import get_project_root
 
+# Reads the built templates from disk
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="module")
+def templates_file():
+    """Built TISpaceBodyTemplate.json; every test that needs it skips when it is missing."""
+    path = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
+    if not path.exists():
+        pytest.skip("Templates not built - run: tias load")
+    return path
+
 
 class TestMarsLaunchWindows:
     """Test Mars launch window calculations against verified game data"""
 
-    def test_mars_window_2027_08_01(self):
+    def test_mars_window_2027_08_01(self, templates_file):
         """Test Mars window from 2027-08-01"""
         game_date = datetime(2027, 8, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        # Skip if templates not built
-        if not templates_file.exists():
-            pytest.skip("Templates not built - run: tias load")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -32,13 +39,9 @@ class TestMarsLaunchWindows:
         # Penalty should be 32-33% (game shows 33%)
         assert 31 <= windows['Mars']['current_penalty'] <= 34
 
-    def test_mars_window_2026_02_01(self):
+    def test_mars_window_2026_02_01(self, templates_file):
         """Test Mars window from 2026-02-01"""
         game_date = datetime(2026, 2, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -48,13 +51,9 @@ class TestMarsLaunchWindows:
         # Penalty should be 36-38% (game shows 37%)
         assert 35 <= windows['Mars']['current_penalty'] <= 39
 
-    def test_mars_optimal_window(self):
+    def test_mars_optimal_window(self, templates_file):
         """Test Mars at optimal window (should be 0% penalty)"""
         game_date = datetime(2026, 11, 13)  # Known optimal
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -66,13 +65,9 @@ class TestMarsLaunchWindows:
 class TestNEALaunchWindows:
     """Test Near-Earth Asteroid launch windows"""
 
-    def test_sisyphus_window_2027_08_01(self):
+    def test_sisyphus_window_2027_08_01(self, templates_file):
         """Test Sisyphus window from 2027-08-01 (near optimal)"""
         game_date = datetime(2027, 8, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -80,13 +75,9 @@ class TestNEALaunchWindows:
         # Should be very close to optimal (next day)
         assert windows['Sisyphus']['days_away'] <= 2
 
-    def test_hephaistos_window_2027_08_01(self):
+    def test_hephaistos_window_2027_08_01(self, templates_file):
         """Test Hephaistos window from 2027-08-01 (at optimal)"""
         game_date = datetime(2027, 8, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -94,13 +85,9 @@ class TestNEALaunchWindows:
         # Should be at optimal
         assert windows['Hephaistos']['days_away'] <= 1
 
-    def test_nea_synodic_periods(self):
+    def test_nea_synodic_periods(self, templates_file):
         """Verify NEA synodic periods match game observations"""
         game_date = datetime(2027, 8, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -132,13 +119,9 @@ class TestEdgeCases:
         # Should return empty dict, not crash
         assert windows == {}
 
-    def test_dates_far_in_future(self):
+    def test_dates_far_in_future(self, templates_file):
         """Test calculations work for future dates"""
         game_date = datetime(2035, 1, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -146,13 +129,9 @@ class TestEdgeCases:
         assert 'Mars' in windows
         assert windows['Mars']['days_away'] > 0
 
-    def test_dates_in_past(self):
+    def test_dates_in_past(self, templates_file):
         """Test calculations work for past dates"""
         game_date = datetime(2020, 1, 1)
-        templates_file = get_project_root() / "build" / "templates" / "TISpaceBodyTemplate.json"
-
-        if not templates_file.exists():
-            pytest.skip("Templates not built")
 
         windows = calculate_launch_windows(game_date, templates_file)
 
@@ -161,5 +140,25 @@ class TestEdgeCases:
         assert windows['Mars']['days_away'] > 0
 
 
+class TestCachedLaunchWindows:
+    """Memoized wrapper used by preset and populate"""
+
+    def test_same_inputs_computed_once(self, tmp_path):
+        from src.preset.launch_windows import cached_launch_windows
+
+        templates_file = tmp_path / "TISpaceBodyTemplate.json"
+        templates_file.write_text("[]", encoding="utf-8")
+        game_date = datetime(2027, 8, 1)
+
+        first = cached_launch_windows(game_date, templates_file)
+        assert cached_launch_windows(game_date, templates_file) is first
+        assert first['Mars']['next_window'] == '2029-01-01'
+
+    def test_missing_templates_file(self, tmp_path):
+        from src.preset.launch_windows import cached_launch_windows
+
+        assert cached_launch_windows(datetime(2027, 8, 1), tmp_path / "missing.json") == {}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])